@@ -0,0 +1,255 @@
+"""Offscreen benchmark harness: drives NeonDashGame on the null backend."""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from dataclasses import replace
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from config import (
+    LOW_SPEC_STABILITY_CONFIG,
+    CollectibleConfig,
+    DifficultyConfig,
+    GameConfig,
+    MovementConfig,
+    SpawnerConfig,
+    StartupConfig,
+)
+from game.core import NeonDashGame
+from game.render import NullBackend
+from game.state_machine import GameState
+
+# Max spawn pressure: short intervals, mostly two-lane patterns, big pools.
+STRESS_CONFIG = GameConfig(
+    profile="stress",
+    movement=MovementConfig(start_speed=18.0, end_speed=30.0),
+    spawner=SpawnerConfig(
+        start_min_spawn_interval=0.30,
+        start_max_spawn_interval=0.40,
+        end_min_spawn_interval=0.20,
+        end_max_spawn_interval=0.28,
+        start_two_obstacle_chance=0.70,
+        end_two_obstacle_chance=0.90,
+        pool_initial_size=60,
+        pool_max_size=120,
+    ),
+    collectible=CollectibleConfig(
+        start_min_spawn_interval=0.25,
+        start_max_spawn_interval=0.35,
+        end_min_spawn_interval=0.20,
+        end_max_spawn_interval=0.30,
+        max_active=14,
+        pool_initial_size=24,
+        pool_max_size=80,
+    ),
+    difficulty=DifficultyConfig(ramp_seconds=20.0),
+)
+
+PROFILES: dict[str, GameConfig] = {
+    "default": GameConfig(),
+    "low_spec": LOW_SPEC_STABILITY_CONFIG,
+    "stress": STRESS_CONFIG,
+}
+
+# Frame-time percentiles divided by the calibration loop's time; lower is
+# better. Only gated on request, since even normalized timings are noisy.
+TIMED_METRICS = ("frame_rel_p50", "frame_rel_p95", "frame_rel_p99")
+ALLOC_METRICS = ("alloc_peak_bytes_per_frame", "alloc_net_bytes_per_frame")
+# Deterministic for a given seed; any change means behaviour changed.
+EXACT_METRICS = ("peak_obstacles", "peak_collectibles", "cap_hits", "runs", "score")
+POOL_METRICS = ("hits", "misses", "cap_hits")
+
+
+def benchmark_config(config: GameConfig) -> GameConfig:
+    # Benchmarks measure the steady-state loop: build everything up front,
+    # no disk caches, no startup/profiler output.
+    return replace(
+        config,
+        startup=StartupConfig(async_loading=False, log_report=False),
+        assets=replace(config.assets, baked_cache=False),
+        pools=replace(config.pools, adaptive_sizing=False),
+    )
+
+
+class DodgeBot:
+    """Moves out of the current lane when an obstacle is close ahead."""
+
+    def __init__(self, game: NeonDashGame, look_ahead: float = 14.0) -> None:
+        self.game = game
+        self.look_ahead = look_ahead
+
+    def _lane_clear(self, lane: int) -> bool:
+        player = self.game.player
+        half = self.look_ahead * 0.5
+        return not self.game.spawner.store.any_within(player.z + half, half, lane=lane)
+
+    def act(self) -> Optional[str]:
+        lane = self.game.player.lane_index
+        if self._lane_clear(lane):
+            return None
+        for key, target in (("a", lane - 1), ("d", lane + 1)):
+            if 0 <= target < len(self.game.config.lane.x_positions) and self._lane_clear(target):
+                return key
+        return None
+
+
+def _drive(
+    game: NeonDashGame,
+    frames: int,
+    dt: float,
+    on_frame: Optional[Callable[[int], None]] = None,
+) -> dict[str, int]:
+    bot = DodgeBot(game)
+    counts = {"runs": 0, "score": 0, "peak_obstacles": 0, "peak_collectibles": 0}
+    for frame in range(frames):
+        if game.state.state in {GameState.START, GameState.GAME_OVER}:
+            counts["score"] += game.score // 10
+            counts["runs"] += 1
+            game.input("space")
+        else:
+            key = bot.act()
+            if key is not None:
+                game.input(key)
+        if on_frame is not None:
+            on_frame(frame)
+        else:
+            game.update(dt)
+        counts["peak_obstacles"] = max(counts["peak_obstacles"], game.spawner.store.count)
+        counts["peak_collectibles"] = max(counts["peak_collectibles"], game.collectibles.store.count)
+    counts["score"] += game.score // 10
+    return counts
+
+
+def calibration_us(repeats: int = 9) -> float:
+    """Median time (us) of a fixed Python + NumPy workload.
+
+    Frame times are divided by it, so they can be compared with a baseline
+    recorded on another machine, or under other load, than this run.
+    """
+    samples = np.zeros(repeats, dtype=np.float64)
+    for repeat in range(repeats):
+        values = np.linspace(0.0, 1.0, 64)
+        started = time.perf_counter()
+        total = 0.0
+        for i in range(3000):
+            total += (i % 7) * 0.5
+        for _ in range(200):
+            values = np.minimum(values * 1.01 + 0.001, 1.0)
+        samples[repeat] = time.perf_counter() - started
+    return float(np.median(samples) * 1e6)
+
+
+def run_benchmark(
+    profile: str,
+    seconds: float = 60.0,
+    fps: float = 60.0,
+    seed: int = 1,
+    alloc_frames: int = 600,
+) -> dict[str, Any]:
+    config = benchmark_config(PROFILES[profile])
+    dt = 1.0 / max(fps, 1.0)
+    frames = max(1, int(seconds * fps))
+
+    random.seed(seed)
+    game = NeonDashGame(config, backend=NullBackend())
+    frame_times = np.zeros(frames, dtype=np.float64)
+    clock = time.perf_counter
+
+    def timed_frame(frame: int) -> None:
+        started = clock()
+        game.update(dt)
+        frame_times[frame] = clock() - started
+
+    calibration = calibration_us()
+    counts = _drive(game, frames, dt, timed_frame)
+    # Measured on both sides of the run, in case the machine's load changed.
+    calibration = (calibration + calibration_us()) * 0.5
+    p50, p95, p99 = np.percentile(frame_times, (50.0, 95.0, 99.0)) * 1e6
+    pools = {pool.name: pool._asdict() for pool in game.pool_stats()}
+    phases = {name: round(stats.p95 * 1000.0, 2) for name, stats in game.profiler.summary().items()}
+
+    # Separate traced pass: tracemalloc slows everything down, so it must not
+    # share a run with the timings above.
+    random.seed(seed)
+    traced_game = NeonDashGame(config, backend=NullBackend())
+    alloc_frames = max(1, min(alloc_frames, frames))
+    peaks = np.zeros(alloc_frames, dtype=np.float64)
+    nets = np.zeros(alloc_frames, dtype=np.float64)
+    tracemalloc.start()
+
+    def traced_frame(frame: int) -> None:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        traced_game.update(dt)
+        current, peak = tracemalloc.get_traced_memory()
+        peaks[frame] = peak - before
+        nets[frame] = current - before
+
+    try:
+        _drive(traced_game, alloc_frames, dt, traced_frame)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "profile": profile,
+        "seconds": seconds,
+        "fps": fps,
+        "seed": seed,
+        "frames": frames,
+        "score": counts["score"],
+        "runs": counts["runs"],
+        "frame_us_p50": round(float(p50), 2),
+        "frame_us_p95": round(float(p95), 2),
+        "frame_us_p99": round(float(p99), 2),
+        "frame_us_max": round(float(frame_times.max() * 1e6), 2),
+        "calibration_us": round(calibration, 2),
+        "frame_rel_p50": round(float(p50) / calibration, 4),
+        "frame_rel_p95": round(float(p95) / calibration, 4),
+        "frame_rel_p99": round(float(p99) / calibration, 4),
+        "phase_us_p95": phases,
+        "peak_obstacles": counts["peak_obstacles"],
+        "peak_collectibles": counts["peak_collectibles"],
+        "cap_hits": sum(pool["cap_hits"] for pool in pools.values()),
+        "pools": pools,
+        "alloc_peak_bytes_per_frame": round(float(peaks.mean()), 1),
+        "alloc_net_bytes_per_frame": round(float(nets.mean()), 1),
+    }
+
+
+def compare(
+    result: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.25,
+    alloc_tolerance: float = 0.10,
+    timings: bool = False,
+) -> list[str]:
+    """Return human-readable regressions of `result` against `baseline`.
+
+    Entity peaks, pool counters and allocations always count; normalized
+    frame times only with `timings`.
+    """
+    problems: list[str] = []
+    for metric in TIMED_METRICS if timings else ():
+        if metric not in baseline:
+            continue
+        limit = baseline[metric] * (1.0 + tolerance)
+        if result[metric] > limit:
+            problems.append(f"{metric}: {result[metric]:.3f} > {limit:.3f} (baseline {baseline[metric]:.3f} +{tolerance:.0%})")
+    for metric in ALLOC_METRICS:
+        # Small absolute slack so near-zero baselines do not flap.
+        limit = baseline[metric] * (1.0 + alloc_tolerance) + 256.0
+        if result[metric] > limit:
+            problems.append(f"{metric}: {result[metric]:.0f} > {limit:.0f} (baseline {baseline[metric]:.0f})")
+    for metric in EXACT_METRICS:
+        if metric in baseline and result[metric] != baseline[metric]:
+            problems.append(f"{metric}: {result[metric]} != baseline {baseline[metric]}")
+    for name, reference in baseline.get("pools", {}).items():
+        pool = result["pools"].get(name, {})
+        for metric in POOL_METRICS:
+            if pool.get(metric) != reference[metric]:
+                problems.append(f"pool {name} {metric}: {pool.get(metric)} != baseline {reference[metric]}")
+    return problems
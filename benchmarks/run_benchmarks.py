@@ -0,0 +1,119 @@
+"""Run the offscreen benchmark suite and compare it against the stored baseline."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import PROFILES, compare, run_benchmark  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILES) + ["all"],
+        default="all",
+        help="config profile to benchmark",
+    )
+    parser.add_argument("--seconds", type=float, default=60.0, help="simulated seconds per profile")
+    parser.add_argument("--fps", type=float, default=60.0, help="simulated frame rate")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("--alloc-frames", type=int, default=600, help="frames traced for allocation counts")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument(
+        "--gate-timings",
+        action="store_true",
+        help="fail on normalized frame-time regressions (reported only by default)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed normalized frame-time slowdown with --gate-timings (0.25 = 25%%)",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--output", default="", help="also write this run's results to a JSON file")
+    return parser.parse_args()
+
+
+def _print_result(result: dict) -> None:
+    print(
+        f"[Bench] {result['profile']}: frames={result['frames']} runs={result['runs']} score={result['score']} "
+        f"frame_us p50={result['frame_us_p50']:.0f} p95={result['frame_us_p95']:.0f} "
+        f"p99={result['frame_us_p99']:.0f} max={result['frame_us_max']:.0f}"
+    )
+    print(
+        f"[Bench] {result['profile']}: calibration={result['calibration_us']:.0f}us "
+        f"frame/calibration p50={result['frame_rel_p50']:.3f} p95={result['frame_rel_p95']:.3f} "
+        f"p99={result['frame_rel_p99']:.3f}"
+    )
+    print(
+        f"[Bench] {result['profile']}: peak obstacles={result['peak_obstacles']} "
+        f"collectibles={result['peak_collectibles']} cap_hits={result['cap_hits']} "
+        f"alloc/frame peak={result['alloc_peak_bytes_per_frame']:.0f}B net={result['alloc_net_bytes_per_frame']:.0f}B"
+    )
+    for pool in result["pools"].values():
+        print(
+            f"[Bench] {result['profile']}: pool={pool['name']} created={pool['created']}/{pool['max_size']} "
+            f"high_water={pool['high_water']} hits={pool['hits']} misses={pool['misses']}"
+        )
+
+
+def main() -> int:
+    args = _parse_args()
+    profiles = sorted(PROFILES) if args.profile == "all" else [args.profile]
+
+    try:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    except (OSError, ValueError):
+        baseline = {}
+
+    results = {}
+    failures = 0
+    for profile in profiles:
+        result = run_benchmark(profile, args.seconds, args.fps, args.seed, args.alloc_frames)
+        results[profile] = result
+        _print_result(result)
+        reference = baseline.get(profile)
+        if args.update_baseline:
+            continue
+        if reference is None:
+            print(f"[Bench] {profile}: no baseline, skipped comparison")
+            continue
+        if (reference["seconds"], reference["fps"], reference["seed"]) != (args.seconds, args.fps, args.seed):
+            print(f"[Bench] {profile}: baseline was recorded with different --seconds/--fps/--seed, skipped")
+            continue
+        problems = compare(result, reference, args.tolerance, timings=args.gate_timings)
+        if not args.gate_timings and "frame_rel_p95" in reference:
+            print(
+                f"[Bench] {profile}: frame/calibration p95 {result['frame_rel_p95']:.3f} "
+                f"vs baseline {reference['frame_rel_p95']:.3f} (not gated)"
+            )
+        for problem in problems:
+            print(f"[Bench] {profile}: REGRESSION {problem}")
+        if not problems:
+            print(f"[Bench] {profile}: ok")
+        failures += bool(problems)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(baseline, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"[Bench] baseline written to {args.baseline}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
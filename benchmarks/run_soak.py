@@ -0,0 +1,78 @@
+"""Long-run soak: hours of simulated play, checked for leaks and slow drift.
+
+Plays one game instance with an autoplay bot at full speed (restarts,
+pause/resume cycles and game-overs included) and samples tracemalloc,
+`gc` object counts, scene-graph nodes, pool sizes and the animation/run
+clocks. Prints a trend report and exits with status 1 if any of them grows
+monotonically after warm-up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.soak import SOAK_SERIES, SoakSettings, run_soak  # noqa: E402
+from game.profiles import ProfileRegistry  # noqa: E402
+
+
+def _parse_args(names: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--preset", choices=sorted(names), default="low_spec", help="profile from presets/ to soak")
+    parser.add_argument("--hours", type=float, default=2.0, help="simulated hours of play")
+    parser.add_argument("--fps", type=float, default=60.0, help="simulated frame rate")
+    parser.add_argument("--seed", type=int, default=1, help="run seed generator seed")
+    parser.add_argument("--sample-seconds", type=float, default=30.0, help="simulated seconds between samples")
+    parser.add_argument("--max-run-seconds", type=float, default=240.0, help="bot gives up after this long")
+    parser.add_argument("--pause-every", type=float, default=90.0, help="seconds between pause/resume cycles")
+    parser.add_argument("--no-trace", action="store_true", help="skip tracemalloc (much faster)")
+    parser.add_argument("--output", default="", help="also write the report, with full series, to a JSON file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    profiles = ProfileRegistry()
+    args = _parse_args(profiles.names())
+    settings = SoakSettings(
+        hours=args.hours,
+        fps=args.fps,
+        seed=args.seed,
+        sample_seconds=args.sample_seconds,
+        max_run_seconds=args.max_run_seconds,
+        pause_every_seconds=args.pause_every,
+        trace=not args.no_trace,
+    )
+    started = time.perf_counter()
+    report = run_soak(profiles.load(args.preset), settings)
+    wall = time.perf_counter() - started
+    print(
+        f"[Soak] {args.preset}: {report['simulated_hours']:.2f}h simulated in {wall:.1f}s, "
+        f"runs={report['runs']} game_overs={report['game_overs']} pauses={report['pauses']} "
+        f"samples={report['samples']}"
+    )
+    for name in SOAK_SERIES:
+        values = report["series"][name]
+        if values:
+            print(f"[Soak] {name}: first={values[0]:.0f} min={min(values):.0f} max={max(values):.0f} last={values[-1]:.0f}")
+    for stat in report["top_allocators"]:
+        print(f"[Soak] alloc {stat['size_diff']:+d} B ({stat['count_diff']:+d} blocks) {stat['location']}")
+    for growth in report["growth"]:
+        print(
+            f"[Soak] GROWTH {growth['series']}: {growth['start']:.0f} -> {growth['end']:.0f} "
+            f"(rising in {growth['rising_fraction']:.0%} of samples)"
+        )
+    if not report["growth"]:
+        print("[Soak] no monotonic growth")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+    return 1 if report["growth"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
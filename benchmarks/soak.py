@@ -0,0 +1,199 @@
+"""Long-run soak test: hours of simulated play in one game instance.
+
+`run_soak` drives `NeonDashGame` on the null backend as fast as it will go
+with `DodgeBot`: runs end in real collisions (the bot gives up after
+`max_run_seconds`), restart through `start_run`, and are interrupted by
+pause/resume cycles. Every `sample_seconds` of simulated time it records
+memory and scene-graph counters; `find_growth` then flags any series that
+keeps climbing after warm-up instead of levelling off or resetting per run.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import replace
+from typing import Any, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.harness import DodgeBot, benchmark_config
+from config import GameConfig, ProfilerConfig
+from game.core import NeonDashGame
+from game.render import NullBackend
+from game.state_machine import GameState
+
+# Sampled every `sample_seconds`; all of them should plateau or saw-tooth.
+SOAK_SERIES = (
+    "traced_bytes",
+    "gc_objects",
+    "scene_nodes",
+    "obstacle_pool",
+    "collectible_pool",
+    "anim_time",
+    "elapsed_time",
+)
+
+
+class SoakSettings(NamedTuple):
+    hours: float = 1.0
+    fps: float = 60.0
+    seed: int = 1
+    sample_seconds: float = 30.0
+    # Bot stops dodging after this long, so every run ends in a game-over.
+    max_run_seconds: float = 240.0
+    pause_every_seconds: float = 90.0
+    paused_seconds: float = 2.0
+    trace: bool = True
+    top_allocators: int = 10
+
+
+class Growth(NamedTuple):
+    series: str
+    start: float
+    end: float
+    # Share of post-warm-up steps that did not go down.
+    rising_fraction: float
+
+
+def soak_config(config: GameConfig, seed: int) -> GameConfig:
+    # Benchmark setup with fixed run seeds; per-node rendering is kept as
+    # configured so scene-graph leaks still show up.
+    config = benchmark_config(config)
+    return replace(
+        config,
+        simulation=replace(config.simulation, seed=seed),
+        profiler=ProfilerConfig(enabled=False),
+    )
+
+
+def find_growth(
+    series: dict[str, Sequence[float]],
+    warmup_fraction: float = 0.25,
+    rising_fraction: float = 0.6,
+    min_growth: float = 0.05,
+    min_absolute: float = 1.0,
+) -> list[Growth]:
+    """Series that grow (almost) monotonically after the warm-up samples.
+
+    A series is flagged when at least `rising_fraction` of its post-warm-up
+    steps are non-decreasing and its lowest value in the last third is more
+    than `min_growth` (relative) and `min_absolute` above its highest value
+    in the first third. Values that level off, or drop back with every run
+    (run clocks), are not flagged.
+    """
+    flagged = []
+    for name, values in series.items():
+        values = np.asarray(values, dtype=np.float64)
+        values = values[int(values.size * warmup_fraction):]
+        if values.size < 3:
+            continue
+        third = max(1, values.size // 3)
+        head, tail = float(values[:third].max()), float(values[-third:].min())
+        rising = float(np.mean(np.diff(values) >= 0.0))
+        grew = tail - head > max(min_absolute, abs(head) * min_growth)
+        if grew and rising >= rising_fraction:
+            flagged.append(Growth(name, float(values[0]), float(values[-1]), round(rising, 3)))
+    return flagged
+
+
+def _sample(game: NeonDashGame) -> dict[str, float]:
+    traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+    return {
+        "traced_bytes": float(traced),
+        "gc_objects": float(len(gc.get_objects())),
+        "scene_nodes": float(game.backend.scene_node_count()),
+        "obstacle_pool": float(game.spawner.pool.created),
+        "collectible_pool": float(game.collectibles.pool.created),
+        "anim_time": game.collectibles._anim_time,
+        "elapsed_time": game.elapsed_time,
+    }
+
+
+def _top_allocators(
+    first: Optional[tracemalloc.Snapshot],
+    last: Optional[tracemalloc.Snapshot],
+    limit: int,
+) -> list[dict[str, Any]]:
+    if first is None or last is None:
+        return []
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = last.filter_traces(filters).compare_to(first.filter_traces(filters), "lineno")
+    return [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_diff": stat.size_diff,
+            "count_diff": stat.count_diff,
+        }
+        for stat in stats[:limit]
+        if stat.size_diff > 0
+    ]
+
+
+def run_soak(config: GameConfig, settings: SoakSettings = SoakSettings()) -> dict[str, Any]:
+    game = NeonDashGame(soak_config(config, settings.seed), backend=NullBackend())
+    bot = DodgeBot(game)
+    dt = 1.0 / max(settings.fps, 1.0)
+    frames = max(1, int(settings.hours * 3600.0 * settings.fps))
+    sample_every = max(1, int(settings.sample_seconds * settings.fps))
+    pause_every = max(1, int(settings.pause_every_seconds * settings.fps))
+    paused_frames = max(1, int(settings.paused_seconds * settings.fps))
+    samples = frames // sample_every
+    warmup_sample = max(1, int(samples * 0.25))
+
+    # Preallocated, so the soak's own bookkeeping does not show up as growth.
+    series = {name: np.zeros(samples, dtype=np.float64) for name in SOAK_SERIES}
+    taken = 0
+    counts = {"runs": 0, "game_overs": 0, "pauses": 0}
+    first_snapshot = last_snapshot = None
+    paused_until = -1
+    if settings.trace:
+        tracemalloc.start()
+    try:
+        for frame in range(frames):
+            state = game.state.state
+            if state == GameState.START:
+                game.input("space")
+                counts["runs"] += 1
+            elif state == GameState.GAME_OVER:
+                counts["game_overs"] += 1
+                counts["runs"] += 1
+                game.input("r")
+            elif state == GameState.PAUSED and frame >= paused_until:
+                # Starts the resume countdown.
+                game.input("p")
+            elif state == GameState.PLAYING:
+                if frame % pause_every == pause_every - 1:
+                    game.input("p")
+                    paused_until = frame + paused_frames
+                    counts["pauses"] += 1
+                elif game.elapsed_time < settings.max_run_seconds:
+                    key = bot.act()
+                    if key is not None:
+                        game.input(key)
+            game.update(dt)
+
+            if frame % sample_every == sample_every - 1 and taken < samples:
+                for name, value in _sample(game).items():
+                    series[name][taken] = value
+                taken += 1
+                if settings.trace and taken == warmup_sample:
+                    first_snapshot = tracemalloc.take_snapshot()
+        if settings.trace:
+            last_snapshot = tracemalloc.take_snapshot()
+    finally:
+        if settings.trace:
+            tracemalloc.stop()
+        if game.patterns is not None:
+            game.patterns.stop()
+
+    return {
+        "profile": config.profile,
+        "simulated_hours": round(frames * dt / 3600.0, 3),
+        "seed": settings.seed,
+        "samples": samples,
+        **counts,
+        "series": {name: values.tolist() for name, values in series.items()},
+        "growth": [growth._asdict() for growth in find_growth(series)],
+        "top_allocators": _top_allocators(first_snapshot, last_snapshot, settings.top_allocators),
+    }
@@ -0,0 +1,97 @@
+"""Monte-Carlo evaluation of the difficulty presets across all CPU cores.
+
+Plays thousands of headless runs per preset with a lane-switching bot and
+reports survival-time and score distributions, spawn density and peak pool
+occupancy. Exits with status 1 if any run hit a `pool_max_size` cap.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.tuner import apply_overrides, make_jobs, run_batch, run_jobs, summarize  # noqa: E402
+from game.profiles import ProfileRegistry  # noqa: E402
+
+
+def _parse_args(names: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--preset",
+        action="append",
+        choices=sorted(names),
+        help="preset to evaluate (repeatable; default: all)",
+    )
+    parser.add_argument("--runs", type=int, default=1000, help="runs per preset")
+    parser.add_argument("--max-seconds", type=float, default=180.0, help="simulated time cap per run")
+    parser.add_argument(
+        "--engine",
+        choices=("process", "batch"),
+        default="process",
+        help="process: full game loop on a process pool; batch: vectorized lockstep simulator",
+    )
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (0 = all cores, 1 = in-process)")
+    parser.add_argument("--chunk", type=int, default=25, help="runs per process-pool job")
+    parser.add_argument("--seed", type=int, default=1, help="base seed for run seeds")
+    parser.add_argument("--bot-interval", type=int, default=6, help="ticks between bot decisions")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="SECTION.FIELD=VALUE",
+        help="candidate tweak applied to every preset, e.g. spawner.pool_max_size=24",
+    )
+    parser.add_argument("--output", default="", help="also write the report to a JSON file")
+    return parser.parse_args()
+
+
+def _print_summary(name: str, summary: dict) -> None:
+    survival, score = summary["survival_seconds"], summary["score"]
+    print(
+        f"[Tune] {name}: runs={summary['runs']} crash_rate={summary['crash_rate']:.1%} "
+        f"survival p10/p50/p90={survival['p10']:.1f}/{survival['p50']:.1f}/{survival['p90']:.1f}s "
+        f"score p10/p50/p90={score['p10']:.0f}/{score['p50']:.0f}/{score['p90']:.0f}"
+    )
+    print(
+        f"[Tune] {name}: spawns/s obstacles={summary['obstacles_per_second']:.2f} "
+        f"collectibles={summary['collectibles_per_second']:.2f} "
+        f"peak obstacles={summary['peak_obstacles']}/{summary['obstacle_pool_max']} "
+        f"collectibles={summary['peak_collectibles']}/{summary['collectible_pool_max']} "
+        f"cap_hits={summary['cap_hits']}"
+    )
+
+
+def main() -> int:
+    profiles = ProfileRegistry()
+    args = _parse_args(profiles.names())
+    names = args.preset or sorted(profiles.names())
+    presets = {name: apply_overrides(profiles.load(name), args.overrides) for name in names}
+    started = time.perf_counter()
+    if args.engine == "batch":
+        results = run_batch(presets, args.runs, args.max_seconds, args.seed, args.bot_interval)
+    else:
+        jobs = make_jobs(presets, args.runs, args.max_seconds, args.chunk, args.seed, args.bot_interval)
+        results = run_jobs(jobs, args.workers or None)
+    wall = time.perf_counter() - started
+    total = sum(len(runs) for runs in results.values())
+    print(f"[Tune] {total} runs in {wall:.1f}s ({total / max(wall, 1e-9):.1f} runs/s)")
+
+    report = {}
+    for name in names:
+        summary = summarize(presets[name], results[name])
+        report[name] = summary
+        _print_summary(name, summary)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"overrides": args.overrides, "presets": report}, handle, indent=2, sort_keys=True)
+    return 1 if any(summary["cap_hits"] for summary in report.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,222 @@
+"""Monte-Carlo difficulty tuner: many headless runs per config preset.
+
+Each job plays a chunk of complete runs (start to collision, or a time cap)
+with `DodgeBot` on the null backend and returns one `RunStats` per run.
+`run_jobs` spreads the chunks over a process pool (`run_batch` steps all runs
+of a preset together in `game.batch_sim` instead); `summarize` turns the runs
+of one preset into survival/score distributions, spawn density and peak pool
+occupancy.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, is_dataclass, replace
+from typing import Any, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.harness import DodgeBot, benchmark_config
+from config import GameConfig, ProfilerConfig
+from game.batch_sim import BatchSimulator
+from game.core import NeonDashGame
+from game.render import NullBackend
+from game.state_machine import GameState
+
+
+class RunStats(NamedTuple):
+    seed: int
+    survival_seconds: float
+    # False => still alive when the time cap was reached.
+    crashed: bool
+    score: int
+    pickups: int
+    obstacles_spawned: int
+    collectibles_spawned: int
+    peak_obstacles: int
+    peak_collectibles: int
+    obstacle_cap_hits: int
+    collectible_cap_hits: int
+
+
+class TuneJob(NamedTuple):
+    preset: str
+    config: GameConfig
+    seeds: tuple[int, ...]
+    max_seconds: float
+    # Ticks between bot decisions (reaction time).
+    bot_interval: int = 6
+    bot_look_ahead: float = 14.0
+
+
+def tuning_config(config: GameConfig) -> GameConfig:
+    # Same steady-state setup as the benchmarks, without per-frame timing.
+    # Batched obstacle/collectible rendering does not change gameplay but
+    # skips most per-node work on the null backend.
+    config = benchmark_config(config)
+    return replace(
+        config,
+        spawner=replace(config.spawner, instanced_rendering=True),
+        collectible=replace(config.collectible, render_mode="shader"),
+        profiler=ProfilerConfig(enabled=False),
+    )
+
+
+def apply_overrides(config: GameConfig, overrides: Sequence[str]) -> GameConfig:
+    """Apply `section.field=value` overrides (value parsed as the field's type)."""
+    for override in overrides:
+        path, _, raw = override.partition("=")
+        section_name, _, field_name = path.strip().partition(".")
+        section = getattr(config, section_name, None)
+        if not is_dataclass(section) or not raw:
+            raise ValueError(f"bad override {override!r}; expected section.field=value")
+        types = {field.name: type(getattr(section, field.name)) for field in fields(section)}
+        if field_name not in types:
+            raise ValueError(f"unknown field {path!r}")
+        kind = types[field_name]
+        value: Any = raw.strip().lower() in {"1", "true", "yes"} if kind is bool else kind(raw.strip())
+        config = replace(config, **{section_name: replace(section, **{field_name: value})})
+    return config
+
+
+def _play_run(game: NeonDashGame, bot: DodgeBot, seed: int, max_ticks: int, bot_interval: int) -> RunStats:
+    game.start_run(seed=seed)
+    obstacle_pool, collectible_pool = game.spawner.pool, game.collectibles.pool
+    obstacle_pool.reset_stats()
+    collectible_pool.reset_stats()
+    dt = game.tick_dt
+    peak_obstacles = peak_collectibles = 0
+    while game.state.is_state(GameState.PLAYING) and game.tick_count < max_ticks:
+        if game.tick_count % bot_interval == 0:
+            key = bot.act()
+            if key is not None:
+                game.input(key)
+        game.update(dt)
+        peak_obstacles = max(peak_obstacles, game.spawner.store.count)
+        peak_collectibles = max(peak_collectibles, game.collectibles.store.count)
+    obstacles, collectibles = obstacle_pool.stats(), collectible_pool.stats()
+    return RunStats(
+        seed=seed,
+        survival_seconds=game.elapsed_time,
+        crashed=game.state.is_state(GameState.GAME_OVER),
+        score=game.score // 10,
+        pickups=game.pickups,
+        obstacles_spawned=obstacles.hits + obstacles.misses,
+        collectibles_spawned=collectibles.hits + collectibles.misses,
+        peak_obstacles=peak_obstacles,
+        peak_collectibles=peak_collectibles,
+        obstacle_cap_hits=obstacles.cap_hits,
+        collectible_cap_hits=collectibles.cap_hits,
+    )
+
+
+def run_job(job: TuneJob) -> tuple[str, list[RunStats]]:
+    """Play every seed of `job` in one game instance (process-pool entry point)."""
+    game = NeonDashGame(tuning_config(job.config), backend=NullBackend())
+    bot = DodgeBot(game, job.bot_look_ahead)
+    max_ticks = max(1, int(job.max_seconds * job.config.simulation.tick_rate))
+    runs = [_play_run(game, bot, seed, max_ticks, max(1, job.bot_interval)) for seed in job.seeds]
+    if game.patterns is not None:
+        game.patterns.stop()
+    return job.preset, runs
+
+
+def make_jobs(
+    presets: dict[str, GameConfig],
+    runs: int,
+    max_seconds: float,
+    chunk: int = 25,
+    seed: int = 1,
+    bot_interval: int = 6,
+) -> list[TuneJob]:
+    # Same run seeds for every preset, so presets are compared on equal luck.
+    seeds = [seed * 1_000_003 + run for run in range(runs)]
+    jobs = []
+    for name, config in presets.items():
+        for start in range(0, runs, max(1, chunk)):
+            jobs.append(TuneJob(name, config, tuple(seeds[start:start + chunk]), max_seconds, bot_interval))
+    return jobs
+
+
+def run_jobs(jobs: Sequence[TuneJob], workers: Optional[int] = None) -> dict[str, list[RunStats]]:
+    """Run `jobs` on `workers` processes (default: all cores; 1 => in-process)."""
+    workers = workers or os.cpu_count() or 1
+    results: dict[str, list[RunStats]] = {job.preset: [] for job in jobs}
+    if workers <= 1:
+        outputs = list(map(run_job, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outputs = list(executor.map(run_job, jobs))
+    for preset, runs in outputs:
+        results[preset].extend(runs)
+    for runs in results.values():
+        runs.sort(key=lambda run: run.seed)
+    return results
+
+
+def run_batch(
+    presets: dict[str, GameConfig],
+    runs: int,
+    max_seconds: float,
+    seed: int = 1,
+    bot_interval: int = 6,
+) -> dict[str, list[RunStats]]:
+    """Same report inputs as `run_jobs`, from the vectorized `BatchSimulator`."""
+    results = {}
+    for name, config in presets.items():
+        batch = BatchSimulator(tuning_config(config), runs, seed=seed, bot_interval=bot_interval).run(max_seconds)
+        results[name] = [
+            RunStats(
+                seed=run,
+                survival_seconds=float(batch.survival_seconds[run]),
+                crashed=bool(batch.crashed[run]),
+                score=int(batch.score[run]),
+                pickups=int(batch.pickups[run]),
+                obstacles_spawned=int(batch.obstacles_spawned[run]),
+                collectibles_spawned=int(batch.collectibles_spawned[run]),
+                peak_obstacles=int(batch.peak_obstacles[run]),
+                peak_collectibles=int(batch.peak_collectibles[run]),
+                obstacle_cap_hits=int(batch.obstacle_cap_hits[run]),
+                collectible_cap_hits=0,
+            )
+            for run in range(runs)
+        ]
+    return results
+
+
+def _percentiles(values: np.ndarray) -> dict[str, float]:
+    p10, p50, p90 = np.percentile(values, (10.0, 50.0, 90.0))
+    return {
+        "p10": round(float(p10), 2),
+        "p50": round(float(p50), 2),
+        "p90": round(float(p90), 2),
+        "mean": round(float(values.mean()), 2),
+        "max": round(float(values.max()), 2),
+    }
+
+
+def summarize(config: GameConfig, runs: Sequence[RunStats]) -> dict[str, Any]:
+    survival = np.asarray([run.survival_seconds for run in runs], dtype=np.float64)
+    total_seconds = max(float(survival.sum()), 1e-9)
+    peak_obstacles = max(run.peak_obstacles for run in runs)
+    peak_collectibles = max(run.peak_collectibles for run in runs)
+    return {
+        "runs": len(runs),
+        "crash_rate": round(sum(run.crashed for run in runs) / len(runs), 4),
+        "survival_seconds": _percentiles(survival),
+        "score": _percentiles(np.asarray([run.score for run in runs], dtype=np.float64)),
+        "pickups": _percentiles(np.asarray([run.pickups for run in runs], dtype=np.float64)),
+        "obstacles_per_second": round(sum(run.obstacles_spawned for run in runs) / total_seconds, 3),
+        "collectibles_per_second": round(sum(run.collectibles_spawned for run in runs) / total_seconds, 3),
+        "peak_obstacles": peak_obstacles,
+        "peak_collectibles": peak_collectibles,
+        "obstacle_pool_max": config.spawner.pool_max_size,
+        "collectible_pool_max": max(config.collectible.pool_max_size, config.collectible.max_active),
+        "obstacle_pool_peak_ratio": round(peak_obstacles / max(1, config.spawner.pool_max_size), 3),
+        "collectible_pool_peak_ratio": round(
+            peak_collectibles / max(1, config.collectible.pool_max_size, config.collectible.max_active),
+            3,
+        ),
+        "cap_hits": sum(run.obstacle_cap_hits + run.collectible_cap_hits for run in runs),
+    }
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass(frozen=True)
 class LaneConfig:
@@ -65,6 +66,23 @@ class WorldConfig:
     # Should cover lane spread comfortably.
     # Practical range: 9 ~ 16
     road_width: float = 10.0
+    # Scroll one track root instead of moving every world entity.
+    # True => O(1) per-tick movement; objects live at track-local z.
+    moving_track: bool = False
+    # Track distance after which track-local coordinates are re-based to 0.
+    # Keeps float precision stable on long runs.
+    # Practical range: 500 ~ 5000
+    track_rebase_distance: float = 2000.0
+    # How the road and lane guides are drawn:
+    # "segments" => ground_segments cubes moved and wrapped every tick, plus
+    # one cube per lane guide.
+    # "scroll" => one static mesh for road + guides (one draw call, no
+    # per-tick transforms); motion shows as cross stripes scrolled by a
+    # shader uniform.
+    render_mode: str = "segments"
+    # Distance between the scrolling cross stripes ("scroll" mode).
+    # Practical range: 3.0 ~ 12.0
+    stripe_spacing: float = 6.0
 
 
 @dataclass(frozen=True)
@@ -95,6 +113,10 @@ class SpawnerConfig:
     # Prevents unbounded runtime entity creation.
     # Practical range: 20 ~ 120
     pool_max_size: int = 60
+    # Draw all obstacles as one hardware-instanced cube batch.
+    # True => one draw call / scene node regardless of active count.
+    # False => one Entity per pooled obstacle.
+    instanced_rendering: bool = False
 
 
 @dataclass(frozen=True)
@@ -161,6 +183,20 @@ class CollectibleConfig:
     # Prevents unbounded runtime entity creation.
     # Practical range: 8 ~ 80
     pool_max_size: int = 32
+    # Collectible visual representation.
+    # "nodes": sphere + core + rings + glow + spark entities, animated on CPU.
+    # "shader": one instanced batch for all pickups; spin/bob/pulse/glow run
+    #           in the vertex/fragment shader from a time uniform.
+    render_mode: str = "nodes"
+    # Distance LOD ("nodes" mode): beyond this z a collectible is a single glow
+    # billboard with its six-node visual stashed, and it switches to full
+    # detail once it scrolls inside. >= world.obstacle_spawn_z => always full.
+    # Practical range: 20.0 ~ 45.0
+    lod_near_z: float = 30.0
+    # Far billboards bob every N ticks; 0 => not animated at all.
+    # Quality tiers multiply this (see game/quality.py).
+    # Practical range: 0 ~ 8
+    lod_far_anim_interval: int = 4
 
 
 @dataclass(frozen=True)
@@ -172,6 +208,108 @@ class DifficultyConfig:
     ramp_seconds: float = 40.0
 
 
+@dataclass(frozen=True)
+class SimulationConfig:
+    # Fixed simulation tick rate (ticks per second).
+    # Gameplay advances in steps of 1 / tick_rate regardless of render FPS.
+    # Higher value => finer collision sampling, more CPU per second.
+    # Practical range: 30 ~ 120
+    tick_rate: float = 60.0
+    # Max fixed ticks run in one rendered frame.
+    # Time beyond this is dropped so one slow frame cannot snowball.
+    # Practical range: 3 ~ 10
+    max_catchup_steps: int = 5
+    # Seed for the per-subsystem RNG streams; each run derives its own seed
+    # from it. None => seeded from the global `random` module.
+    seed: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class PatternConfig:
+    # Where obstacle/collectible spawn patterns are decided.
+    # "inline": on the tick that crosses the spawn timer (scans live objects).
+    # "idle":   planned ahead in leftover frame time; ticks only place them.
+    # "thread": planned ahead on a worker thread.
+    # quality.adjust_spawn_caps = True always runs "inline".
+    mode: str = "idle"
+    # How far ahead patterns are planned (simulated seconds).
+    # Practical range: 1.0 ~ 8.0
+    lookahead_seconds: float = 4.0
+    # Per-frame planning budget in "idle" mode (milliseconds).
+    # Practical range: 0.25 ~ 2.0
+    idle_budget_ms: float = 0.5
+
+
+@dataclass(frozen=True)
+class StartupConfig:
+    # Spread pool prewarm across the first frames instead of building it all
+    # before the START screen appears. SPACE finishes any remaining work.
+    # False => everything is built synchronously in NeonDashGame.__init__.
+    async_loading: bool = True
+    # Per-frame time budget for deferred loading work (milliseconds).
+    # At least one unit of work runs per frame regardless.
+    # Practical range: 1.0 ~ 8.0
+    frame_budget_ms: float = 4.0
+    # Print the startup timing report once loading has finished.
+    log_report: bool = True
+
+
+@dataclass(frozen=True)
+class AssetConfig:
+    # Load obstacle/collectible/ground/lane-guide models from one baked file
+    # keyed by a hash of the lane/world/spawner/collectible configs.
+    # A changed key rebuilds the bundle on the next launch.
+    baked_cache: bool = True
+    # Where baked bundles are stored. Empty => ~/.neon_dash/asset_cache
+    cache_dir: str = ""
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    # Learn pool prewarm sizes from observed high-water marks.
+    # True => obstacle/collectible pool_initial_size is replaced by the
+    # learned size for this machine + profile once one has been recorded.
+    adaptive_sizing: bool = False
+    # Extra prewarm on top of the learned high-water mark (0.25 = +25%).
+    # Practical range: 0.0 ~ 0.5
+    headroom: float = 0.25
+    # Where learned sizes are stored. Empty => ~/.neon_dash/pool_sizes.json
+    cache_path: str = ""
+
+
+@dataclass(frozen=True)
+class ProfilerConfig:
+    # Time each phase of NeonDashGame.update (hud, player, world, spawner,
+    # collectibles, pickup, collision, render) every frame.
+    # Cost is a few clock reads per tick; False => no timing at all.
+    enabled: bool = True
+    # Frames kept in the ring buffer used for p50/p95/p99/max.
+    # Practical range: 120 ~ 3600
+    history_frames: int = 600
+    # Key toggling the on-screen timing overlay.
+    overlay_key: str = "f3"
+    # Seconds between overlay text refreshes.
+    # Practical range: 0.25 ~ 2.0
+    overlay_refresh_interval: float = 0.5
+    # Key writing the buffer to JSON + CSV in output_dir.
+    dump_key: str = "f4"
+    # Also write a dump every time a run ends.
+    dump_on_game_over: bool = False
+    # Directory for JSON/CSV dumps (relative to the working directory).
+    output_dir: str = "profiles"
+
+
+@dataclass(frozen=True)
+class ReplayConfig:
+    # Every run records its seed and lane inputs in memory (one tuple per
+    # lane switch). Key writing the current/last run to output_dir.
+    save_key: str = "f5"
+    # Also write the replay every time a run ends.
+    save_on_game_over: bool = False
+    # Directory for .ndr replay files (relative to the working directory).
+    output_dir: str = "replays"
+
+
 @dataclass(frozen=True)
 class HudConfig:
     # Resume countdown visual style.
@@ -179,10 +317,103 @@ class HudConfig:
     # "minimal": large timer only, no background panel/shadow.
     # resume_countdown_style: str = "cyber"
     resume_countdown_style: str = "minimal"
+    # Max refresh rate of the score/time counters (Hz).
+    # Counters only rebuild when the shown value changes; 0 => every frame.
+    # Practical range: 10 ~ 60
+    counter_refresh_rate: float = 20.0
+    # Draw score/time digits from pre-built glyph nodes (no text rebuilds).
+    # False => plain Text nodes, re-generated when the value changes.
+    glyph_counters: bool = True
+    # Seconds between window aspect-ratio checks for HUD layout.
+    # Practical range: 0.1 ~ 1.0
+    layout_poll_interval: float = 0.5
+
+
+@dataclass(frozen=True)
+class QualityConfig:
+    # Step through the quality tiers in game/quality.py at runtime, from
+    # measured frame times. False => stay on start_tier.
+    adaptive: bool = True
+    # Tier at launch: "high", "medium", "low" or "minimal".
+    start_tier: str = "high"
+    # Best tier the controller may step up to; a start_tier above it is
+    # lowered to it. Same names as start_tier.
+    max_tier: str = "high"
+    # Frame rate the controller tries to hold.
+    # Practical range: 30 ~ 144
+    target_fps: float = 60.0
+    # Frame-time percentile compared against the 1 / target_fps budget.
+    # Practical range: 80 ~ 99
+    percentile: float = 90.0
+    # Seconds of frames per measurement window (one decision per window).
+    # Practical range: 1.0 ~ 5.0
+    window_seconds: float = 2.0
+    # Step down when the percentile is over budget * (1 + downgrade_margin).
+    # Practical range: 0.10 ~ 0.50
+    downgrade_margin: float = 0.20
+    # Step up after the percentile stays under budget * (1 + upgrade_margin)
+    # for upgrade_hold_seconds. The hold doubles (up to 8x) whenever an
+    # upgrade has to be undone, so a borderline machine stops oscillating.
+    # Practical range: 0.0 ~ 0.10 / 5.0 ~ 60.0
+    upgrade_margin: float = 0.05
+    upgrade_hold_seconds: float = 15.0
+    # Let low tiers lower collectible.max_active. This changes gameplay, so
+    # runs on slow machines no longer match replays or other machines.
+    adjust_spawn_caps: bool = False
+
+
+@dataclass(frozen=True)
+class PacingConfig:
+    # How frames are paced; main.py applies it before the window opens and
+    # `--pacing` / `--fps-cap` override it.
+    # "vsync": wait for the display refresh.
+    # "capped": no vsync, at most fps_cap frames a second.
+    # "uncapped": no vsync, no limit (benchmarking; tears).
+    # "half_refresh": vsync at refresh_rate / 2 (power saving).
+    mode: str = "vsync"
+    # Practical range: 30 ~ 240
+    fps_cap: float = 60.0
+    # Display refresh rate (Hz): the frame budget for "vsync" / "uncapped"
+    # and the base of "half_refresh".
+    refresh_rate: float = 60.0
+    # Frames longer than budget * (1 + stall_margin) count as over budget.
+    # Practical range: 0.10 ~ 0.50
+    stall_margin: float = 0.25
+    # Frame intervals kept for the jitter stats (F3 overlay, profile dumps).
+    history_frames: int = 600
+    # Also print the jitter stats as a `[Pacing]` line after every run.
+    log_on_game_over: bool = False
+
+
+@dataclass(frozen=True)
+class InputConfig:
+    # Low-latency lane switching: the player is drawn between this tick and
+    # the next one's position instead of between the last two ticks, so a
+    # switch shows on the first frame after the key press. Render-only:
+    # collision and replays are unchanged.
+    low_latency: bool = False
+    # A switch counts as presented once the drawn player is this far (0-1)
+    # toward the new lane.
+    presented_fraction: float = 0.5
+    # Lane switches kept for the latency histograms.
+    latency_samples: int = 256
+
+
+@dataclass(frozen=True)
+class ProfilesConfig:
+    # Live profile switching (game/profiles.py); only on the START screen and
+    # while paused. Key that steps through the profile files in presets/.
+    cycle_key: str = "f6"
+    # Seconds between checks of the active profile file; an edited file is
+    # re-applied on the next check. 0 => do not watch.
+    # Practical range: 0.5 ~ 10.0
+    watch_interval: float = 2.0
 
 
 @dataclass(frozen=True)
 class GameConfig:
+    # Profile name; learned per-machine data (pool sizes) is keyed by it.
+    profile: str = "default"
     lane: LaneConfig = LaneConfig()
     player: PlayerConfig = PlayerConfig()
     movement: MovementConfig = MovementConfig()
@@ -190,7 +421,18 @@ class GameConfig:
     spawner: SpawnerConfig = SpawnerConfig()
     collectible: CollectibleConfig = CollectibleConfig()
     difficulty: DifficultyConfig = DifficultyConfig()
+    simulation: SimulationConfig = SimulationConfig()
+    patterns: PatternConfig = PatternConfig()
+    pools: PoolConfig = PoolConfig()
+    startup: StartupConfig = StartupConfig()
+    assets: AssetConfig = AssetConfig()
+    profiler: ProfilerConfig = ProfilerConfig()
+    replay: ReplayConfig = ReplayConfig()
     hud: HudConfig = HudConfig()
+    quality: QualityConfig = QualityConfig()
+    pacing: PacingConfig = PacingConfig()
+    input: InputConfig = InputConfig()
+    profiles: ProfilesConfig = ProfilesConfig()
 
 
 # ------------------------------------------------------------
@@ -279,51 +521,53 @@ class GameConfig:
 # collectible.pool_max_size = 16
 # ------------------------------------------------------------
 
-# Optional one-switch profile toggle.
+# Optional one-switch profile toggle. Without editing this file: run with
+# `--profile low_spec` or NEON_DASH_PROFILE=low_spec (see presets/).
 # False: keep current default (balanced/high-spec) config.
 # True: use low-spec stability profile for long-run testing.
 USE_LOW_SPEC_STABILITY_PROFILE = False
 # USE_LOW_SPEC_STABILITY_PROFILE = True
 
-if USE_LOW_SPEC_STABILITY_PROFILE:
-    CONFIG = GameConfig(
-        movement=MovementConfig(
-            start_speed=10.5,
-            end_speed=18.5,
-            score_per_second=8.0,
-        ),
-        spawner=SpawnerConfig(
-            start_min_spawn_interval=1.15,
-            start_max_spawn_interval=1.65,
-            end_min_spawn_interval=0.72,
-            end_max_spawn_interval=1.08,
-            start_two_obstacle_chance=0.08,
-            end_two_obstacle_chance=0.38,
-            pool_initial_size=12,
-            pool_max_size=28,
-        ),
-        collectible=CollectibleConfig(
-            start_min_spawn_interval=1.25,
-            start_max_spawn_interval=2.00,
-            end_min_spawn_interval=0.95,
-            end_max_spawn_interval=1.45,
-            reward_score=5,
-            min_obstacle_distance_z=9.5,
-            max_active=5,
-            y=2.2,
-            scale=1.0,
-            pickup_z_threshold=1.2,
-            bob_amplitude=0.13,
-            bob_speed=2.6,
-            spin_speed=120.0,
-            glow_scale=2.3,
-            glow_alpha=88,
-            pool_initial_size=6,
-            pool_max_size=16,
-        ),
-        difficulty=DifficultyConfig(
-            ramp_seconds=110.0,
-        ),
-    )
-else:
-    CONFIG = GameConfig()
+LOW_SPEC_STABILITY_CONFIG = GameConfig(
+    profile="low_spec",
+    movement=MovementConfig(
+        start_speed=10.5,
+        end_speed=18.5,
+        score_per_second=8.0,
+    ),
+    spawner=SpawnerConfig(
+        start_min_spawn_interval=1.15,
+        start_max_spawn_interval=1.65,
+        end_min_spawn_interval=0.72,
+        end_max_spawn_interval=1.08,
+        start_two_obstacle_chance=0.08,
+        end_two_obstacle_chance=0.38,
+        pool_initial_size=12,
+        pool_max_size=28,
+    ),
+    collectible=CollectibleConfig(
+        start_min_spawn_interval=1.25,
+        start_max_spawn_interval=2.00,
+        end_min_spawn_interval=0.95,
+        end_max_spawn_interval=1.45,
+        reward_score=5,
+        min_obstacle_distance_z=9.5,
+        max_active=5,
+        y=2.2,
+        scale=1.0,
+        pickup_z_threshold=1.2,
+        bob_amplitude=0.13,
+        bob_speed=2.6,
+        spin_speed=120.0,
+        glow_scale=2.3,
+        glow_alpha=88,
+        pool_initial_size=6,
+        pool_max_size=16,
+    ),
+    difficulty=DifficultyConfig(
+        ramp_seconds=110.0,
+    ),
+    quality=QualityConfig(start_tier="medium", max_tier="medium"),
+)
+
+CONFIG = LOW_SPEC_STABILITY_CONFIG if USE_LOW_SPEC_STABILITY_PROFILE else GameConfig()
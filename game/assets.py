@@ -0,0 +1,92 @@
+import glob
+import hashlib
+import json
+import os
+import time
+from typing import Optional, Sequence
+
+from config import GameConfig
+from game.render import ASSET_SPECS, AssetSpec, RenderBackend
+
+# Bump when the baked layout changes in a way the config hash cannot see.
+ASSET_CACHE_VERSION = 1
+
+
+def default_asset_cache_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".neon_dash", "asset_cache")
+
+
+# Config fields that can shape baked geometry: lane layout and entity /
+# segment dimensions. Tuning, spawn, pool and profile changes must not force a
+# rebake. Colors are set on entities, not baked.
+ASSET_KEY_FIELDS: dict[str, tuple[str, ...]] = {
+    "lane": ("x_positions",),
+    "world": ("ground_segment_length", "road_width"),
+    "collectible": ("scale", "glow_scale"),
+}
+
+
+def asset_key(config: GameConfig, specs: Sequence[AssetSpec] = ASSET_SPECS) -> str:
+    payload = {
+        "version": ASSET_CACHE_VERSION,
+        "specs": [list(spec) for spec in specs],
+    }
+    for section, names in ASSET_KEY_FIELDS.items():
+        values = getattr(config, section)
+        payload[section] = {name: getattr(values, name) for name in names}
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class BakedAssetCache:
+    """Loads the baked asset bundle for a config key, rebuilding it on a miss.
+
+    The bundle is one file per key (`assets-<key><ext>`); bundles for other
+    keys are deleted when a new one is written.
+    """
+
+    def __init__(self, backend: RenderBackend, directory: str, key: str) -> None:
+        self.backend = backend
+        self.directory = directory
+        self.key = key
+        self.path = os.path.join(directory, f"assets-{key}{backend.baked_asset_extension}")
+        self.hit = False
+        self.load_seconds = 0.0
+        self.bake_seconds = 0.0
+
+    def load_or_bake(self, specs: Sequence[AssetSpec] = ASSET_SPECS) -> bool:
+        """Register baked assets with the backend; returns True on a cache hit."""
+        started = time.perf_counter()
+        baked = self._load(specs)
+        self.load_seconds = time.perf_counter() - started
+        self.hit = baked is not None
+        if baked is None:
+            started = time.perf_counter()
+            baked = self.backend.bake_assets(specs)
+            self._save(baked)
+            self.bake_seconds = time.perf_counter() - started
+        self.backend.register_assets(specs, baked)
+        return self.hit
+
+    def _load(self, specs: Sequence[AssetSpec]) -> Optional[dict]:
+        if not os.path.exists(self.path):
+            return None
+        baked = self.backend.load_baked_assets(self.path)
+        if baked is None or any(spec.name not in baked for spec in specs):
+            return None
+        return baked
+
+    def _save(self, baked: dict) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError:
+            return
+        if not self.backend.save_baked_assets(baked, self.path):
+            return
+        pattern = os.path.join(self.directory, f"assets-*{self.backend.baked_asset_extension}")
+        for stale in glob.glob(pattern):
+            if stale != self.path:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
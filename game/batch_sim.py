@@ -0,0 +1,388 @@
+"""Vectorized simulation of many independent runs stepped in lockstep.
+
+`BatchSimulator` reproduces the gameplay rules of `NeonDashGame` with the
+lookahead spawn planner (`game.patterns`), `ObstacleSpawner`,
+`CollectibleSystem`, collision and pickups, plus the benchmark `DodgeBot`,
+for B runs at once: every piece of per-run state is an array with a leading
+batch dimension and one tick is a fixed number of array operations.
+Time, speed and scrolled distance depend only on the tick, so they are
+scalars shared by the whole batch.
+
+Spawn plans come from `BatchPatternPlanner` (NumPy RNG; same rules as
+`PatternGenerator`) or, for parity checks, from per-run `SpawnEvent` lists.
+Rendering, animation and HUD are not simulated.
+"""
+
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from config import CollectibleConfig, GameConfig, SpawnerConfig
+from game.patterns import SpawnEvent
+
+
+class BatchResult(NamedTuple):
+    ticks: np.ndarray
+    survival_seconds: np.ndarray
+    # False => still alive when the time cap was reached.
+    crashed: np.ndarray
+    score: np.ndarray
+    pickups: np.ndarray
+    obstacles_spawned: np.ndarray
+    collectibles_spawned: np.ndarray
+    peak_obstacles: np.ndarray
+    peak_collectibles: np.ndarray
+    obstacle_cap_hits: np.ndarray
+
+
+# Per-run outputs of `BatchSimulator`, written out when a row is dropped.
+_RESULT_STATE = (
+    "ticks",
+    "survival",
+    "score",
+    "pickups",
+    "obstacles_spawned",
+    "collectibles_spawned",
+    "peak_obstacles",
+    "peak_collectibles",
+    "obstacle_cap_hits",
+)
+# Every per-run array; rows are dropped together on compaction.
+_RUN_STATE = (
+    "run_ids",
+    "obstacle_z",
+    "obstacle_lane",
+    "obstacle_active",
+    "collectible_z",
+    "collectible_lane",
+    "collectible_active",
+    "player_lane",
+    "alive",
+) + _RESULT_STATE
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
+
+
+class BatchPatternPlanner:
+    """`PatternGenerator` rules for B runs at once.
+
+    Only the most recent spawn per lane matters for spacing (everything else
+    is further away in track distance), so each run keeps one distance per
+    lane for obstacles and one for collectibles.
+    """
+
+    def __init__(self, config: GameConfig, batch_size: int, rng: np.random.Generator) -> None:
+        self.config = config
+        self.rng = rng
+        self.batch_size = batch_size
+        self.lane_count = len(config.lane.x_positions)
+        self.tick_dt = 1.0 / max(config.simulation.tick_rate, 1.0)
+        self.obstacle_timer = np.zeros(batch_size, dtype=np.float64)
+        self.collectible_timer = np.zeros(batch_size, dtype=np.float64)
+        self.obstacle_interval = self._draw_interval(config.spawner, 0.0, batch_size)
+        self.collectible_interval = self._draw_interval(config.collectible, 0.0, batch_size)
+        self.last_obstacle = np.full((batch_size, self.lane_count), -np.inf)
+        self.last_collectible = np.full((batch_size, self.lane_count), -np.inf)
+        self._rows = np.arange(batch_size)
+
+    def compact(self, keep: np.ndarray) -> None:
+        for name in ("obstacle_timer", "collectible_timer", "obstacle_interval", "collectible_interval"):
+            setattr(self, name, getattr(self, name)[keep])
+        self.last_obstacle = self.last_obstacle[keep]
+        self.last_collectible = self.last_collectible[keep]
+        self.batch_size = int(np.count_nonzero(keep))
+        self._rows = np.arange(self.batch_size)
+
+    def _draw_interval(
+        self,
+        cfg: Union[SpawnerConfig, CollectibleConfig],
+        difficulty_t: float,
+        count: int,
+    ) -> np.ndarray:
+        low = _lerp(cfg.start_min_spawn_interval, cfg.end_min_spawn_interval, difficulty_t)
+        high = _lerp(cfg.start_max_spawn_interval, cfg.end_max_spawn_interval, difficulty_t)
+        return self.rng.uniform(low, high, count)
+
+    def _random_ranks(self, allowed: np.ndarray) -> np.ndarray:
+        # Rank of each lane in a random order of the allowed lanes; disallowed
+        # lanes rank last.
+        keys = self.rng.random(allowed.shape)
+        keys[~allowed] = np.inf
+        return np.argsort(np.argsort(keys, axis=1), axis=1)
+
+    def plan(self, difficulty_t: float, spawn_distance: float, distance: float) -> tuple[np.ndarray, np.ndarray]:
+        """Obstacle lane mask (B, lanes) and collectible lane (B,; -1 = none)."""
+        config = self.config
+        dt = self.tick_dt
+        min_distance = config.collectible.min_obstacle_distance_z
+        obstacles = np.zeros((self.batch_size, self.lane_count), dtype=bool)
+
+        self.obstacle_timer += dt
+        fire = self.obstacle_timer >= self.obstacle_interval
+        fired = int(np.count_nonzero(fire))
+        if fired:
+            self.obstacle_timer[fire] = 0.0
+            self.obstacle_interval[fire] = self._draw_interval(config.spawner, difficulty_t, fired)
+            allowed = spawn_distance - self.last_collectible[fire] >= min_distance
+            chance = _lerp(config.spawner.start_two_obstacle_chance, config.spawner.end_two_obstacle_chance, difficulty_t)
+            lane_count = 1 + (self.rng.random(fired) < chance)
+            lane_count = np.minimum(lane_count, allowed.sum(axis=1))
+            picked = (self._random_ranks(allowed) < lane_count[:, None]) & allowed
+            obstacles[fire] = picked
+            self.last_obstacle[obstacles] = spawn_distance
+
+        collectible_lane = np.full(self.batch_size, -1, dtype=np.int64)
+        self.collectible_timer += dt
+        fire = self.collectible_timer >= self.collectible_interval
+        fired = int(np.count_nonzero(fire))
+        if fired:
+            self.collectible_timer[fire] = 0.0
+            self.collectible_interval[fire] = self._draw_interval(config.collectible, difficulty_t, fired)
+            safe = distance - self.last_obstacle[fire] >= min_distance
+            lanes = np.argmin(self._random_ranks(safe), axis=1)
+            lanes[~safe.any(axis=1)] = -1
+            collectible_lane[fire] = lanes
+            spawned = collectible_lane >= 0
+            self.last_collectible[self._rows[spawned], collectible_lane[spawned]] = distance
+        return obstacles, collectible_lane
+
+
+class _EventPlan:
+    """Per-run `SpawnEvent` lists replayed as batch masks (parity checks)."""
+
+    def __init__(self, plans: Sequence[Sequence[SpawnEvent]], lane_count: int) -> None:
+        self.lane_count = lane_count
+        self.by_tick: dict[int, list[tuple[int, SpawnEvent]]] = {}
+        for run, events in enumerate(plans):
+            for event in events:
+                self.by_tick.setdefault(event.tick, []).append((run, event))
+        self.batch_size = len(plans)
+
+    def plan(self, tick: int) -> tuple[np.ndarray, np.ndarray]:
+        obstacles = np.zeros((self.batch_size, self.lane_count), dtype=bool)
+        collectible_lane = np.full(self.batch_size, -1, dtype=np.int64)
+        for run, event in self.by_tick.get(tick, ()):
+            obstacles[run, list(event.obstacle_lanes)] = True
+            collectible_lane[run] = event.collectible_lane
+        return obstacles, collectible_lane
+
+
+class BatchSimulator:
+    """B runs of the game loop as array operations, one fixed tick per step.
+
+    The player is driven by the `DodgeBot` policy every `bot_interval` ticks
+    (0 = stand still). Pass `plans` (one `SpawnEvent` list per run) to replay
+    exact spawn schedules instead of drawing them. Once half of the rows have
+    crashed, their results are written out and the arrays shrink to the live
+    runs, so a batch costs roughly what its survivors cost.
+    """
+
+    def __init__(
+        self,
+        config: GameConfig,
+        batch_size: int,
+        seed: int = 0,
+        bot_interval: int = 6,
+        bot_look_ahead: float = 14.0,
+        plans: Optional[Sequence[Sequence[SpawnEvent]]] = None,
+    ) -> None:
+        self.config = config
+        self.batch_size = len(plans) if plans is not None else max(1, batch_size)
+        self.bot_interval = bot_interval
+        self.bot_look_ahead = bot_look_ahead
+        self.tick_dt = 1.0 / max(config.simulation.tick_rate, 1.0)
+        self.lane_count = len(config.lane.x_positions)
+        self._rows = np.arange(self.batch_size)
+        if plans is not None:
+            self._events: Optional[_EventPlan] = _EventPlan(plans, self.lane_count)
+            self._planner: Optional[BatchPatternPlanner] = None
+        else:
+            self._events = None
+            self._planner = BatchPatternPlanner(config, self.batch_size, np.random.default_rng(seed))
+
+        batch = self.batch_size
+        self.run_ids = np.arange(batch)
+        self.obstacle_capacity = max(1, config.spawner.pool_max_size)
+        self.obstacle_z = np.zeros((batch, self.obstacle_capacity), dtype=np.float64)
+        self.obstacle_lane = np.zeros((batch, self.obstacle_capacity), dtype=np.int8)
+        self.obstacle_active = np.zeros((batch, self.obstacle_capacity), dtype=bool)
+        self.collectible_capacity = max(1, config.collectible.max_active)
+        self.collectible_z = np.zeros((batch, self.collectible_capacity), dtype=np.float64)
+        self.collectible_lane = np.zeros((batch, self.collectible_capacity), dtype=np.int8)
+        self.collectible_active = np.zeros((batch, self.collectible_capacity), dtype=bool)
+
+        self.player_lane = np.full(batch, 1, dtype=np.int8)
+        self.alive = np.ones(batch, dtype=bool)
+        self.ticks = np.zeros(batch, dtype=np.int64)
+        self.survival = np.zeros(batch, dtype=np.float64)
+        self.score = np.zeros(batch, dtype=np.int64)
+        self.pickups = np.zeros(batch, dtype=np.int64)
+        self.obstacles_spawned = np.zeros(batch, dtype=np.int64)
+        self.collectibles_spawned = np.zeros(batch, dtype=np.int64)
+        self.peak_obstacles = np.zeros(batch, dtype=np.int64)
+        self.peak_collectibles = np.zeros(batch, dtype=np.int64)
+        self.obstacle_cap_hits = np.zeros(batch, dtype=np.int64)
+
+        self.tick = 0
+        self.elapsed_time = 0.0
+        self.distance = 0.0
+        self._crashed = np.zeros(batch, dtype=bool)
+        self._results = {name: np.zeros_like(getattr(self, name)) for name in _RESULT_STATE}
+
+    def _lane_hits(self, z: np.ndarray, lanes: np.ndarray, active: np.ndarray, low: float, high: float) -> np.ndarray:
+        # (B, capacity) mask of active entities in the player's lane within [low, high].
+        return active & (lanes == self.player_lane[:, None]) & (z >= low) & (z <= high)
+
+    def _bot_step(self) -> None:
+        # Same window as DodgeBot: centred half a look-ahead in front of the player.
+        half = self.bot_look_ahead * 0.5
+        center = self.config.player.z + half
+        in_range = self.obstacle_active & (self.obstacle_z >= center - half) & (self.obstacle_z <= center + half)
+        blocked = np.zeros((self.batch_size, self.lane_count), dtype=bool)
+        runs, slots = np.nonzero(in_range)
+        blocked[runs, self.obstacle_lane[runs, slots]] = True
+        lane = self.player_lane.astype(np.int64)
+        stuck = blocked[self._rows, lane] & self.alive
+        left = lane - 1
+        right = lane + 1
+        can_left = stuck & (left >= 0) & ~blocked[self._rows, np.clip(left, 0, self.lane_count - 1)]
+        can_right = (
+            stuck
+            & ~can_left
+            & (right < self.lane_count)
+            & ~blocked[self._rows, np.clip(right, 0, self.lane_count - 1)]
+        )
+        self.player_lane[can_left] -= 1
+        self.player_lane[can_right] += 1
+
+    def _place_obstacles(self, mask: np.ndarray) -> None:
+        mask &= self.alive[:, None]
+        for lane in range(self.lane_count):
+            want = mask[:, lane]
+            if not want.any():
+                continue
+            free = ~self.obstacle_active
+            has_room = free.any(axis=1)
+            self.obstacle_cap_hits += want & ~has_room
+            place = want & has_room
+            runs = self._rows[place]
+            slots = np.argmax(free[place], axis=1)
+            self.obstacle_z[runs, slots] = self.config.world.obstacle_spawn_z
+            self.obstacle_lane[runs, slots] = lane
+            self.obstacle_active[runs, slots] = True
+            self.obstacles_spawned += place
+
+    def _place_collectibles(self, lanes: np.ndarray) -> None:
+        free = ~self.collectible_active
+        place = (lanes >= 0) & self.alive & free.any(axis=1)
+        if not place.any():
+            return
+        runs = self._rows[place]
+        slots = np.argmax(free[place], axis=1)
+        self.collectible_z[runs, slots] = self.config.world.obstacle_spawn_z
+        self.collectible_lane[runs, slots] = lanes[place]
+        self.collectible_active[runs, slots] = True
+        self.collectibles_spawned += place
+
+    def step(self) -> None:
+        config = self.config
+        dt = self.tick_dt
+        if self.bot_interval > 0 and self.tick % self.bot_interval == 0:
+            self._bot_step()
+        self.tick += 1
+        self.elapsed_time += dt
+        difficulty_t = min(1.0, self.elapsed_time / max(config.difficulty.ramp_seconds, 1.0))
+        speed = _lerp(config.movement.start_speed, config.movement.end_speed, difficulty_t)
+        dz = speed * dt
+        spawn_distance = self.distance
+        self.distance += dz
+        if self._planner is not None:
+            obstacle_mask, collectible_lanes = self._planner.plan(difficulty_t, spawn_distance, self.distance)
+        else:
+            obstacle_mask, collectible_lanes = self._events.plan(self.tick)
+            obstacle_mask = obstacle_mask[self.run_ids]
+            collectible_lanes = collectible_lanes[self.run_ids]
+
+        # Spawner: place, scroll, clean up.
+        self._place_obstacles(obstacle_mask)
+        self.obstacle_z -= dz
+        self.obstacle_active &= self.obstacle_z > config.world.obstacle_cleanup_z
+        # Collectibles: scroll, clean up, place (up to max_active).
+        self.collectible_z -= dz
+        self.collectible_active &= self.collectible_z > config.world.obstacle_cleanup_z
+        self._place_collectibles(collectible_lanes)
+
+        player_z = config.player.z
+        threshold = config.collectible.pickup_z_threshold
+        picked = self._lane_hits(
+            self.collectible_z,
+            self.collectible_lane,
+            self.collectible_active,
+            player_z - threshold,
+            player_z + threshold,
+        )
+        picked &= self.alive[:, None]
+        collected = picked.sum(axis=1)
+        self.collectible_active &= ~picked
+        self.pickups += collected
+        self.score += collected * (config.collectible.reward_score * 10)
+        self.score[self.alive] += int(dt * config.movement.score_per_second * 10)
+
+        threshold = config.player.collision_z_threshold
+        hit = self._lane_hits(
+            self.obstacle_z,
+            self.obstacle_lane,
+            self.obstacle_active,
+            player_z - threshold,
+            player_z + threshold,
+        ).any(axis=1)
+        self.ticks[self.alive] = self.tick
+        self.survival[self.alive] = self.elapsed_time
+        np.maximum(self.peak_obstacles, self.obstacle_active.sum(axis=1), out=self.peak_obstacles, where=self.alive)
+        np.maximum(
+            self.peak_collectibles,
+            self.collectible_active.sum(axis=1),
+            out=self.peak_collectibles,
+            where=self.alive,
+        )
+        self.alive &= ~hit
+        alive = int(np.count_nonzero(self.alive))
+        if alive * 2 <= self.batch_size:
+            self._compact()
+
+    def _flush(self, rows: np.ndarray) -> None:
+        ids = self.run_ids[rows]
+        for name, values in self._results.items():
+            values[ids] = getattr(self, name)[rows]
+        self._crashed[ids] = ~self.alive[rows]
+
+    def _compact(self) -> None:
+        keep = self.alive.copy()
+        self._flush(~keep)
+        for name in _RUN_STATE:
+            setattr(self, name, getattr(self, name)[keep])
+        if self._planner is not None:
+            self._planner.compact(keep)
+        self.batch_size = int(np.count_nonzero(keep))
+        self._rows = np.arange(self.batch_size)
+
+    def run(self, max_seconds: float) -> BatchResult:
+        max_ticks = max(1, int(max_seconds * self.config.simulation.tick_rate))
+        while self.tick < max_ticks and self.batch_size:
+            self.step()
+        self._flush(self._rows)
+        results = self._results
+        return BatchResult(
+            ticks=results["ticks"].copy(),
+            survival_seconds=results["survival"].copy(),
+            crashed=self._crashed.copy(),
+            score=results["score"] // 10,
+            pickups=results["pickups"].copy(),
+            obstacles_spawned=results["obstacles_spawned"].copy(),
+            collectibles_spawned=results["collectibles_spawned"].copy(),
+            peak_obstacles=results["peak_obstacles"].copy(),
+            peak_collectibles=results["peak_collectibles"].copy(),
+            obstacle_cap_hits=results["obstacle_cap_hits"].copy(),
+        )
@@ -1,10 +1,60 @@
 import random
 import math
-from typing import Optional, Sequence
+from typing import Any, NamedTuple, Optional
 
-from ursina import Entity, color
+import numpy as np
 
 from config import CollectibleConfig, LaneConfig, WorldConfig
+from game.entity_store import EntityStore
+from game.pool import ObjectPool
+from game.render import RenderBackend, get_backend
+from game.track import Track
+
+
+class CollectibleAnimationFrame(NamedTuple):
+    body_y: np.ndarray
+    spin_y: np.ndarray
+    outer_ring_z: np.ndarray
+    inner_ring_x: np.ndarray
+    inner_ring_y: np.ndarray
+    spark_x: np.ndarray
+    spark_y: np.ndarray
+    outer_ring_scale: np.ndarray
+    inner_ring_scale: np.ndarray
+    glow_scale: np.ndarray
+    glow_alpha: np.ndarray
+
+
+COLLECTIBLE_RENDER_MODES = ("nodes", "shader")
+GLOW_ALPHA_MIN = 45
+GLOW_ALPHA_MAX = 180
+
+
+def compute_collectible_animation(
+    cfg: CollectibleConfig,
+    anim_time: float,
+    phase: np.ndarray,
+    age: np.ndarray,
+) -> CollectibleAnimationFrame:
+    # One batched pass over every active collectible; `age` is the animation
+    # time since spawn, which replaces the per-frame incremental rotations.
+    spin = cfg.spin_speed * age
+    orbit_t = anim_time * (cfg.bob_speed * 1.8) + phase
+    pulse = 1.0 + 0.18 * np.sin(anim_time * (cfg.bob_speed * 1.7) + phase)
+    glow_alpha = cfg.glow_alpha + 34 * np.sin(anim_time * (cfg.bob_speed * 2.1) + phase)
+    return CollectibleAnimationFrame(
+        body_y=cfg.y + np.sin(anim_time * cfg.bob_speed + phase) * cfg.bob_amplitude,
+        spin_y=np.mod(spin, 360.0),
+        outer_ring_z=np.mod(spin * 1.9, 360.0),
+        inner_ring_x=np.mod(68.0 + spin * 1.2, 360.0),
+        inner_ring_y=np.mod(-spin * 0.7, 360.0),
+        spark_x=np.cos(orbit_t) * (cfg.scale * 1.06),
+        spark_y=np.sin(orbit_t) * (cfg.scale * 0.42),
+        outer_ring_scale=cfg.scale * 2.2 * (0.96 + 0.08 * pulse),
+        inner_ring_scale=cfg.scale * 1.42 * (0.94 + 0.10 * pulse),
+        glow_scale=cfg.scale * (cfg.glow_scale + 0.55) * pulse,
+        glow_alpha=np.clip(glow_alpha.astype(np.int64), GLOW_ALPHA_MIN, GLOW_ALPHA_MAX),
+    )
 
 
 class CollectibleSystem:
@@ -13,19 +63,73 @@ class CollectibleSystem:
         lane_cfg: LaneConfig,
         world_cfg: WorldConfig,
         collectible_cfg: CollectibleConfig,
+        backend: Optional[RenderBackend] = None,
+        track: Optional[Track] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
+        self.backend = backend or get_backend()
+        self.rng = rng or random.Random(random.getrandbits(63))
+        self.track = track or Track(world_cfg, self.backend)
         self.lane_cfg = lane_cfg
         self.world_cfg = world_cfg
         self.collectible_cfg = collectible_cfg
         self.spawn_timer = 0.0
         self.next_interval = self._pick_next_interval(0.0)
-        self.collectibles: list[Entity] = []
         self._anim_time = 0.0
-        self._pool: list[Entity] = []
-        self._created_count = 0
-        self._pool_max_size = max(1, self.collectible_cfg.pool_max_size, self.collectible_cfg.max_active)
-        self._pool_initial_size = max(0, min(self.collectible_cfg.pool_initial_size, self._pool_max_size))
-        self._prewarm_pool()
+        # Quality knobs (see `set_quality`).
+        self.max_active = self.collectible_cfg.max_active
+        self._details = True
+        self._effects = True
+        self._far_anim_interval = max(0, self.collectible_cfg.lod_far_anim_interval)
+        self._anim_ticks = 0
+        pool_max_size = max(1, self.collectible_cfg.pool_max_size, self.collectible_cfg.max_active)
+        self.store = EntityStore(
+            pool_max_size,
+            len(self.lane_cfg.x_positions),
+            track_space=self.track.enabled,
+        )
+        self._spawn_anim_time = np.zeros(self.store.capacity, dtype=np.float64)
+        self._lane_x = np.asarray(self.lane_cfg.x_positions, dtype=np.float64)
+        # Glow alpha is an int in a small range: build each color once instead
+        # of allocating a fresh one per collectible per frame.
+        self._glow_colors = [
+            self.backend.rgba(255, 224, 128, alpha)
+            for alpha in range(GLOW_ALPHA_MIN, GLOW_ALPHA_MAX + 1)
+        ]
+        self._batch: Optional[Any] = None
+        self._batch_dirty = True
+        if self.collectible_cfg.render_mode == "shader":
+            self._batch = self._create_shader_batch()
+        # Distance LOD: far collectibles show `_impostors[slot]` instead of
+        # their node tree until they cross `lod_near_z`.
+        self._lod = self._batch is None and self.collectible_cfg.lod_near_z < self.world_cfg.obstacle_spawn_z
+        self._far = np.zeros(self.store.capacity, dtype=bool)
+        self._impostors: list[Any] = [None] * self.store.capacity
+        self.pool: ObjectPool[int] = ObjectPool(
+            "collectibles",
+            self._create_collectible_slot,
+            pool_max_size,
+        )
+        self.pool.prewarm(self.collectible_cfg.pool_initial_size)
+        # Idle slots above this are destroyed (see `apply_config`).
+        self._trim_size = self.pool.max_size
+
+    @property
+    def collectibles(self) -> list[Any]:
+        if self._batch is not None:
+            return []
+        return [self.store.nodes[slot] for slot in self.store.active_slots().tolist()]
+
+    @property
+    def draw_nodes(self) -> int:
+        if self._batch is not None:
+            return 1
+        # Sphere, core, two rings, glow and spark per pooled collectible,
+        # plus the far billboard with LOD on.
+        return self.pool.created * (7 if self._lod else 6)
+
+    def active_slots(self) -> np.ndarray:
+        return self.store.active_slots()
 
     @staticmethod
     def _lerp(a: float, b: float, t: float) -> float:
@@ -42,212 +146,431 @@ class CollectibleSystem:
             self.collectible_cfg.end_max_spawn_interval,
             difficulty_t,
         )
-        return random.uniform(min_interval, max_interval)
+        return self.rng.uniform(min_interval, max_interval)
 
-    def _prewarm_pool(self) -> None:
-        for _ in range(self._pool_initial_size):
-            collectible = self._create_collectible_entity()
-            collectible._in_pool = True
-            self._pool.append(collectible)
-
-    def _create_collectible_entity(self) -> Entity:
-        collectible = Entity(
-            model="sphere",
-            color=color.rgb(255, 214, 64),
+    def _create_collectible_entity(self) -> Any:
+        collectible = self.backend.entity(
+            **self.backend.asset("collectible_body"),
+            color=self.backend.rgb(255, 214, 64),
             position=(0, -1000, self.world_cfg.obstacle_cleanup_z - 100.0),
             scale=self.collectible_cfg.scale * 0.46,
-            collider="box",
             enabled=False,
+            **self.track.parent_kwargs(),
         )
-        collectible.lane_index = 1
-        collectible.base_y = self.collectible_cfg.y
-        collectible.phase = 0.0
-        collectible.core = Entity(
+        collectible.core = self.backend.entity(
             parent=collectible,
-            model="sphere",
-            color=color.rgb(255, 246, 190),
+            **self.backend.asset("collectible_core"),
+            color=self.backend.rgb(255, 246, 190),
             scale=0.62,
         )
-        collectible.outer_ring = Entity(
+        collectible.outer_ring = self.backend.entity(
             parent=collectible,
-            model="quad",
-            texture="circle_outlined",
-            color=color.rgba(255, 214, 92, 230),
+            **self.backend.asset("collectible_ring"),
+            color=self.backend.rgba(255, 214, 92, 230),
             scale=self.collectible_cfg.scale * 2.2,
             double_sided=True,
         )
-        collectible.inner_ring = Entity(
+        collectible.inner_ring = self.backend.entity(
             parent=collectible,
-            model="quad",
-            texture="circle_outlined",
-            color=color.rgba(255, 170, 72, 220),
+            **self.backend.asset("collectible_ring"),
+            color=self.backend.rgba(255, 170, 72, 220),
             scale=self.collectible_cfg.scale * 1.42,
             rotation=(68, 0, 20),
             double_sided=True,
         )
-        collectible.glow = Entity(
+        collectible.glow = self.backend.entity(
             parent=collectible,
-            model="quad",
-            texture="circle",
-            color=color.rgba(255, 224, 128, self.collectible_cfg.glow_alpha),
+            **self.backend.asset("collectible_glow"),
+            color=self.backend.rgba(255, 224, 128, self.collectible_cfg.glow_alpha),
             billboard=True,
             scale=self.collectible_cfg.scale * (self.collectible_cfg.glow_scale + 0.55),
             double_sided=True,
         )
-        collectible.spark = Entity(
+        collectible.spark = self.backend.entity(
             parent=collectible,
-            model="sphere",
-            color=color.rgba(255, 255, 255, 220),
+            **self.backend.asset("collectible_spark"),
+            color=self.backend.rgba(255, 255, 255, 220),
             scale=self.collectible_cfg.scale * 0.15,
             position=(self.collectible_cfg.scale * 1.08, 0, 0),
         )
-        collectible.outer_ring_base_scale = collectible.outer_ring.scale
-        collectible.inner_ring_base_scale = collectible.inner_ring.scale
-        collectible._in_pool = False
-        self._created_count += 1
         return collectible
 
-    def _acquire_collectible(self) -> Optional[Entity]:
-        collectible: Optional[Entity] = None
-        if self._pool:
-            collectible = self._pool.pop()
-        elif self._created_count < self._pool_max_size:
+    def _create_shader_batch(self) -> Any:
+        cfg = self.collectible_cfg
+        size = cfg.scale * 0.46
+        batch = self.backend.instanced_batch(
+            "sphere",
+            self.store.capacity,
+            (size, size, size),
+            effect="collectible_pulse",
+            **self.track.parent_kwargs(),
+        )
+        batch.set_uniform("anim_params", self._shader_anim_params())
+        batch.set_uniform("anim_time", self._anim_time)
+        self._batch_colors = np.tile(
+            np.asarray((255 / 255.0, 214 / 255.0, 64 / 255.0, 1.0), dtype=np.float32),
+            (self.store.capacity, 1),
+        )
+        return batch
+
+    def _shader_anim_params(self) -> tuple[float, float, float, float]:
+        cfg = self.collectible_cfg
+        return (cfg.bob_speed, cfg.bob_amplitude, math.radians(cfg.spin_speed), cfg.glow_alpha / 255.0)
+
+    def _create_collectible_slot(self) -> int:
+        slot = self.pool.created
+        if self._batch is None:
             collectible = self._create_collectible_entity()
-        if collectible is None:
+            self._show_parts(collectible)
+            self.store.nodes[slot] = collectible
+            if self._lod:
+                self._impostors[slot] = self._create_impostor()
+        return slot
+
+    def _create_impostor(self) -> Any:
+        # A single billboard: a collectible is a few pixels across out there.
+        return self.backend.entity(
+            **self.backend.asset("collectible_glow"),
+            color=self.backend.rgba(255, 214, 92, 235),
+            billboard=True,
+            scale=self.collectible_cfg.scale * 1.3,
+            position=(0, -1000, self.world_cfg.obstacle_cleanup_z - 100.0),
+            enabled=False,
+            double_sided=True,
+            **self.track.parent_kwargs(),
+        )
+
+    def _show_parts(self, collectible: Any) -> None:
+        collectible.core.enabled = self._details
+        collectible.outer_ring.enabled = self._details
+        collectible.inner_ring.enabled = self._details
+        collectible.glow.enabled = self._effects
+        collectible.spark.enabled = self._effects
+
+    def set_quality(
+        self,
+        details: bool = True,
+        effects: bool = True,
+        far_anim_interval: int = 1,
+        max_active: Optional[int] = None,
+    ) -> None:
+        """Hide child visuals and/or animate far billboards less often.
+
+        `details` covers the core and rings, `effects` the glow and spark;
+        hidden parts are not animated. Far billboards bob every
+        `lod_far_anim_interval * far_anim_interval` ticks. Node mode only,
+        apart from `max_active`.
+        """
+        self._far_anim_interval = max(0, self.collectible_cfg.lod_far_anim_interval) * max(1, far_anim_interval)
+        if max_active is not None:
+            self.max_active = max(1, max_active)
+        if (details, effects) == (self._details, self._effects):
+            return
+        self._details = details
+        self._effects = effects
+        if self._batch is None:
+            for slot in range(self.pool.created):
+                self._show_parts(self.store.nodes[slot])
+
+    def apply_config(self, collectible_cfg: CollectibleConfig, prewarm: Optional[int] = None) -> int:
+        """Switch tuning and pool limits in place; returns the pool size.
+
+        Same pool handling as `ObstacleSpawner.apply_config`. Resets
+        `max_active` (callers re-apply the quality tier afterwards).
+        `render_mode`, and whether distance LOD is on at all, are fixed at
+        construction.
+        """
+        self.collectible_cfg = collectible_cfg
+        self.max_active = collectible_cfg.max_active
+        self._far_anim_interval = max(0, collectible_cfg.lod_far_anim_interval)
+        pool_max_size = max(1, collectible_cfg.pool_max_size, collectible_cfg.max_active)
+        if pool_max_size > self.store.capacity:
+            extra = pool_max_size - self.store.capacity
+            self.store.grow(pool_max_size)
+            self._spawn_anim_time = np.concatenate((self._spawn_anim_time, np.zeros(extra, dtype=np.float64)))
+            self._far = np.concatenate((self._far, np.zeros(extra, dtype=bool)))
+            self._impostors.extend([None] * extra)
+            if self._batch is not None:
+                self.backend.destroy(self._batch)
+                self._batch = None
+        if self.collectible_cfg.render_mode == "shader":
+            if self._batch is None:
+                self._batch = self._create_shader_batch()
+            else:
+                self._batch.set_uniform("anim_params", self._shader_anim_params())
+            self._batch_dirty = True
+        self.pool.max_size = pool_max_size
+        self._trim_size = min(pool_max_size, collectible_cfg.pool_initial_size if prewarm is None else prewarm)
+        self._trim_pool()
+        self.pool.prewarm(self._trim_size)
+        if self._batch is not None:
+            self._sync_batch(np.flatnonzero(self.store.active))
+        return self.pool.created
+
+    def _trim_pool(self) -> None:
+        # Slot index == creation order, so only the topmost slot can go.
+        pool = self.pool
+        while pool.created > self._trim_size:
+            slot = pool.created - 1
+            if self.store.active[slot] or not pool.discard(slot):
+                return
+            for nodes in (self.store.nodes, self._impostors):
+                if nodes[slot] is not None:
+                    self.backend.destroy(nodes[slot])
+                    nodes[slot] = None
+
+    def _acquire_collectible(self) -> Optional[int]:
+        slot = self.pool.acquire()
+        if slot is None:
             return None
-        collectible._in_pool = False
-        collectible.enabled = True
-        return collectible
+        collectible = self.store.nodes[slot]
+        if collectible is not None:
+            collectible.enabled = True
+        return slot
 
-    def _release_collectible(self, collectible: Entity) -> None:
-        if getattr(collectible, "_in_pool", False):
+    def _release_collectible(self, slot: int) -> None:
+        if not self.store.deactivate(slot):
             return
-        collectible.enabled = False
-        collectible.position = (0, -1000, self.world_cfg.obstacle_cleanup_z - 100.0)
-        collectible._in_pool = True
-        self._pool.append(collectible)
+        collectible = self.store.nodes[slot]
+        if collectible is not None:
+            collectible.enabled = False
+            collectible.position = (0, -1000, self.world_cfg.obstacle_cleanup_z - 100.0)
+        if self._far[slot]:
+            self._far[slot] = False
+            self._impostors[slot].enabled = False
+        self.pool.release(slot)
+        self._batch_dirty = True
 
     def reset(self) -> None:
         self.spawn_timer = 0.0
         self.next_interval = self._pick_next_interval(0.0)
-        for collectible in self.collectibles:
-            self._release_collectible(collectible)
-        self.collectibles.clear()
+        # Restart the animation clock per run: the shader reads it as a
+        # float32 uniform, which gets visibly coarse after hours of play.
+        self._anim_time = 0.0
+        for slot in self.store.active_slots().tolist():
+            self._release_collectible(slot)
+        self._trim_pool()
+        self.store.rebase()
+        if self._batch is not None:
+            self._sync_batch(np.flatnonzero(self.store.active))
+
+    def rebase(self) -> None:
+        # Track origin moved back to 0: shift track-local z of live objects.
+        self.store.rebase()
+        self._batch_dirty = True
+        slots = np.flatnonzero(self.store.active)
+        if self._batch is None:
+            self.store.sync_z(slots)
+            self._sync_impostor_z(slots[self._far[slots]])
+
+    def _lane_is_safe_for_spawn(self, lane_index: int, obstacles: EntityStore) -> bool:
+        return not obstacles.any_within(
+            self.world_cfg.obstacle_spawn_z,
+            self.collectible_cfg.min_obstacle_distance_z,
+            lane=lane_index,
+            strict=True,
+        )
 
-    def _lane_is_safe_for_spawn(self, lane_index: int, obstacles: Sequence[Entity]) -> bool:
+    def _spawn_collectible(self, lane_index: int, phase: Optional[float] = None) -> None:
+        slot = self._acquire_collectible()
+        if slot is None:
+            return
+        if phase is None:
+            phase = self.rng.uniform(0.0, math.tau)
         spawn_z = self.world_cfg.obstacle_spawn_z
-        min_distance = self.collectible_cfg.min_obstacle_distance_z
-        for obstacle in obstacles:
-            if obstacle.lane_index != lane_index:
-                continue
-            if abs(obstacle.z - spawn_z) < min_distance:
-                return False
-        return True
-
-    def _spawn_collectible(self, lane_index: int) -> None:
-        collectible = self._acquire_collectible()
+        self.store.activate(slot, lane_index, spawn_z, phase=phase)
+        self._spawn_anim_time[slot] = self._anim_time
+        self._batch_dirty = True
+        collectible = self.store.nodes[slot]
         if collectible is None:
             return
         collectible.position = (
             self.lane_cfg.x_positions[lane_index],
             self.collectible_cfg.y,
-            self.world_cfg.obstacle_spawn_z,
+            self.store.z[slot],
         )
         collectible.scale = self.collectible_cfg.scale * 0.46
-        collectible.lane_index = lane_index
-        collectible.base_y = self.collectible_cfg.y
-        collectible.phase = random.uniform(0.0, math.tau)
         collectible.rotation_y = 0
         collectible.core.scale = 0.62
-        collectible.outer_ring.color = color.rgba(255, 214, 92, 230)
+        collectible.outer_ring.color = self.backend.rgba(255, 214, 92, 230)
         collectible.outer_ring.scale = self.collectible_cfg.scale * 2.2
         collectible.outer_ring.rotation = (0, 0, 0)
-        collectible.inner_ring.color = color.rgba(255, 170, 72, 220)
+        collectible.inner_ring.color = self.backend.rgba(255, 170, 72, 220)
         collectible.inner_ring.scale = self.collectible_cfg.scale * 1.42
         collectible.inner_ring.rotation = (68, 0, 20)
-        collectible.glow.color = color.rgba(255, 224, 128, self.collectible_cfg.glow_alpha)
+        collectible.glow.color = self.backend.rgba(255, 224, 128, self.collectible_cfg.glow_alpha)
         collectible.glow.scale = self.collectible_cfg.scale * (self.collectible_cfg.glow_scale + 0.55)
         collectible.spark.scale = self.collectible_cfg.scale * 0.15
         collectible.spark.position = (self.collectible_cfg.scale * 1.08, 0, 0)
-        collectible.outer_ring_base_scale = collectible.outer_ring.scale
-        collectible.inner_ring_base_scale = collectible.inner_ring.scale
-        self.collectibles.append(collectible)
+        if self._lod and spawn_z > self.collectible_cfg.lod_near_z:
+            # Starts far away: stash the node tree behind the billboard.
+            collectible.enabled = False
+            self._far[slot] = True
+            impostor = self._impostors[slot]
+            impostor.position = collectible.position
+            impostor.enabled = True
 
-    def _try_spawn(self, obstacles: Sequence[Entity]) -> None:
-        if len(self.collectibles) >= self.collectible_cfg.max_active:
+    def _try_spawn(self, obstacles: EntityStore) -> None:
+        if self.store.count >= self.max_active:
             return
 
         lanes = list(range(len(self.lane_cfg.x_positions)))
-        random.shuffle(lanes)
+        self.rng.shuffle(lanes)
         for lane_index in lanes:
             if self._lane_is_safe_for_spawn(lane_index, obstacles):
                 self._spawn_collectible(lane_index)
                 return
 
+    def place(self, lane_index: int, phase: float) -> None:
+        """Spawn a pre-planned collectible (see `game.patterns`)."""
+        if self.store.count < self.max_active:
+            self._spawn_collectible(lane_index, phase)
+
     def collect_at(self, player_lane: int, player_z: float, threshold: float) -> int:
-        active_collectibles: list[Entity] = []
-        collected_count = 0
-        for collectible in self.collectibles:
-            same_lane = collectible.lane_index == player_lane
-            close_enough = abs(collectible.z - player_z) <= threshold
-            if same_lane and close_enough:
-                collected_count += 1
-                self._release_collectible(collectible)
-            else:
-                active_collectibles.append(collectible)
-        self.collectibles = active_collectibles
-        return collected_count
+        collected = self.store.slots_within(player_z, threshold, lane=player_lane)
+        for slot in collected.tolist():
+            self._release_collectible(slot)
+        return int(collected.size)
 
     def lanes_blocked_near_spawn(self, min_distance_z: float) -> set[int]:
-        spawn_z = self.world_cfg.obstacle_spawn_z
-        blocked_lanes: set[int] = set()
-        for collectible in self.collectibles:
-            if abs(collectible.z - spawn_z) < min_distance_z:
-                blocked_lanes.add(collectible.lane_index)
-        return blocked_lanes
+        return self.store.lanes_within(self.world_cfg.obstacle_spawn_z, min_distance_z, strict=True)
 
     def update(
         self,
         dt: float,
         speed: float,
         difficulty_t: float,
-        obstacles: Sequence[Entity],
+        obstacles: EntityStore,
+        timed_spawns: bool = True,
     ) -> None:
+        # timed_spawns=False: spawns come from `place` (lookahead planner).
         self._anim_time += dt
-        cleanup_z = self.world_cfg.obstacle_cleanup_z
-        active_collectibles: list[Entity] = []
-        for collectible in self.collectibles:
-            collectible.rotation_y += self.collectible_cfg.spin_speed * dt
-            collectible.outer_ring.rotation_z += self.collectible_cfg.spin_speed * 1.9 * dt
-            collectible.inner_ring.rotation_x += self.collectible_cfg.spin_speed * 1.2 * dt
-            collectible.inner_ring.rotation_y -= self.collectible_cfg.spin_speed * 0.7 * dt
-            orbit_t = self._anim_time * (self.collectible_cfg.bob_speed * 1.8) + collectible.phase
-            collectible.spark.x = math.cos(orbit_t) * (self.collectible_cfg.scale * 1.06)
-            collectible.spark.y = math.sin(orbit_t) * (self.collectible_cfg.scale * 0.42)
-            collectible.y = collectible.base_y + math.sin(
-                self._anim_time * self.collectible_cfg.bob_speed + collectible.phase,
-            ) * self.collectible_cfg.bob_amplitude
-            pulse = 1.0 + 0.18 * math.sin(
-                self._anim_time * (self.collectible_cfg.bob_speed * 1.7) + collectible.phase,
-            )
-            collectible.outer_ring.scale = collectible.outer_ring_base_scale * (0.96 + 0.08 * pulse)
-            collectible.inner_ring.scale = collectible.inner_ring_base_scale * (0.94 + 0.10 * pulse)
-            collectible.glow.scale = self.collectible_cfg.scale * (self.collectible_cfg.glow_scale + 0.55) * pulse
-            glow_alpha = int(
-                self.collectible_cfg.glow_alpha
-                + 34 * math.sin(self._anim_time * (self.collectible_cfg.bob_speed * 2.1) + collectible.phase),
-            )
-            glow_alpha = max(45, min(180, glow_alpha))
-            collectible.glow.color = color.rgba(255, 224, 128, glow_alpha)
-            collectible.z -= speed * dt
-            if collectible.z > cleanup_z:
-                active_collectibles.append(collectible)
-            else:
-                self._release_collectible(collectible)
-        self.collectibles = active_collectibles
+        store = self.store
+        store.advance(speed * dt)
+        for slot in store.slots_behind(self.world_cfg.obstacle_cleanup_z).tolist():
+            self._release_collectible(slot)
+
+        slots = np.flatnonzero(store.active)
+        if self._batch is not None:
+            self._sync_batch(slots)
+        elif slots.size:
+            if self._lod:
+                slots = self._update_far(slots)
+            if slots.size:
+                self._apply_animation(slots)
 
         self.spawn_timer += dt
-        if self.spawn_timer >= self.next_interval:
+        if timed_spawns and self.spawn_timer >= self.next_interval:
             self.spawn_timer = 0.0
             self.next_interval = self._pick_next_interval(difficulty_t)
             self._try_spawn(obstacles)
+
+    def _sync_batch(self, slots: np.ndarray) -> None:
+        # Shader mode: the GPU animates from `anim_time` and the per-instance
+        # phase in w, so the only per-collectible CPU work is this z upload
+        # (skipped entirely in track mode until the active set changes).
+        self._batch.set_uniform("anim_time", self._anim_time)
+        if self.track.enabled and not self._batch_dirty:
+            return
+        self._batch_dirty = False
+        store = self.store
+        instances = np.empty((slots.size, 4), dtype=np.float32)
+        instances[:, 0] = self._lane_x[store.lane[slots]]
+        instances[:, 1] = self.collectible_cfg.y
+        instances[:, 2] = store.z[slots]
+        instances[:, 3] = store.phase[slots]
+        self._batch.update(instances, self._batch_colors[: slots.size])
+
+    def _update_far(self, slots: np.ndarray) -> np.ndarray:
+        """Swap collectibles inside `lod_near_z` to full detail and move the
+        far billboards; returns the slots that get the full animation."""
+        far = self._far[slots]
+        if not far.any():
+            return slots
+        store = self.store
+        far_slots = slots[far]
+        crossing = store.world_z(far_slots) <= self.collectible_cfg.lod_near_z
+        if crossing.any():
+            for slot in far_slots[crossing].tolist():
+                self._far[slot] = False
+                self._impostors[slot].enabled = False
+                store.nodes[slot].enabled = True
+            far_slots = far_slots[~crossing]
+        self._anim_ticks += 1
+        interval = self._far_anim_interval
+        if interval and self._anim_ticks % interval == 0:
+            cfg = self.collectible_cfg
+            bob_y = cfg.y + np.sin(self._anim_time * cfg.bob_speed + store.phase[far_slots]) * cfg.bob_amplitude
+            impostors = self._impostors
+            for slot, x, y, z in zip(
+                far_slots.tolist(),
+                self._lane_x[store.lane[far_slots]].tolist(),
+                bob_y.tolist(),
+                store.z[far_slots].tolist(),
+            ):
+                impostors[slot].position = (x, y, z)
+        elif not self.track.enabled:
+            # Not animated this tick, but still has to follow the scroll.
+            self._sync_impostor_z(far_slots)
+        return slots[~self._far[slots]]
+
+    def _sync_impostor_z(self, slots: np.ndarray) -> None:
+        impostors = self._impostors
+        for slot, z in zip(slots.tolist(), self.store.z[slots].tolist()):
+            impostors[slot].z = z
+
+    def _apply_animation(self, slots: np.ndarray) -> None:
+        store = self.store
+        frame = compute_collectible_animation(
+            self.collectible_cfg,
+            self._anim_time,
+            store.phase[slots],
+            self._anim_time - self._spawn_anim_time[slots],
+        )
+        glow_colors = self._glow_colors
+        nodes = store.nodes
+        details, effects = self._details, self._effects
+        rows = zip(
+            slots.tolist(),
+            self._lane_x[store.lane[slots]].tolist(),
+            frame.body_y.tolist(),
+            store.z[slots].tolist(),
+            frame.spin_y.tolist(),
+            frame.outer_ring_z.tolist(),
+            frame.inner_ring_x.tolist(),
+            frame.inner_ring_y.tolist(),
+            frame.spark_x.tolist(),
+            frame.spark_y.tolist(),
+            frame.outer_ring_scale.tolist(),
+            frame.inner_ring_scale.tolist(),
+            frame.glow_scale.tolist(),
+            (frame.glow_alpha - GLOW_ALPHA_MIN).tolist(),
+        )
+        for (
+            slot,
+            x,
+            y,
+            z,
+            spin_y,
+            outer_z,
+            inner_x,
+            inner_y,
+            spark_x,
+            spark_y,
+            outer_scale,
+            inner_scale,
+            glow_scale,
+            glow_index,
+        ) in rows:
+            collectible = nodes[slot]
+            collectible.position = (x, y, z)
+            collectible.rotation_y = spin_y
+            if details:
+                collectible.outer_ring.rotation_z = outer_z
+                collectible.inner_ring.rotation = (inner_x, inner_y, 20)
+                collectible.outer_ring.scale = outer_scale
+                collectible.inner_ring.scale = inner_scale
+            if effects:
+                collectible.spark.position = (spark_x, spark_y, 0)
+                collectible.glow.scale = glow_scale
+                collectible.glow.color = glow_colors[glow_index]
@@ -0,0 +1,627 @@
+import os
+import random
+import time
+from dataclasses import replace
+from typing import Optional, Union
+
+from config import CONFIG, CollectibleConfig, GameConfig, QualityConfig, SpawnerConfig
+from game.assets import BakedAssetCache, asset_key, default_asset_cache_dir
+from game.collectibles import CollectibleSystem
+from game.hud import HudView
+from game.latency import LATENCY_BINS_MS, LatencyTracker
+from game.loading import LoadingScheduler, prewarm_steps
+from game.pacing import FrameJitter, pacing_plan
+from game.patterns import PatternGenerator, PatternQueue, pattern_mode
+from game.player import PlayerController
+from game.profiler import (
+    PHASE_COLLECTIBLES,
+    PHASE_COLLISION,
+    PHASE_HUD,
+    PHASE_PICKUP,
+    PHASE_PLAYER,
+    PHASE_RENDER,
+    PHASE_SPAWNER,
+    PHASE_WORLD,
+    FrameProfiler,
+    ProfilerOverlay,
+)
+from game.pool import PoolSizeCache, PoolStats, default_pool_size_path
+from game.profiles import ProfileError, ProfileRegistry, live_config
+from game.quality import QualityController, QualityTier
+from game.render import RenderBackend, get_backend
+from game.replay import MOVE_LEFT, MOVE_RIGHT, Replay, ReplayRecorder, config_hash
+from game.rng import RandomStreams
+from game.spawner import ObstacleSpawner
+from game.state_machine import GameState, StateMachine
+from game.track import Track
+from game.world import WorldSystem
+
+
+class NeonDashGame:
+    def __init__(
+        self,
+        config: GameConfig = CONFIG,
+        backend: Optional[RenderBackend] = None,
+        launch_time: Optional[float] = None,
+        profiles: Optional[ProfileRegistry] = None,
+    ) -> None:
+        self.config = config
+        # Profile files for `switch_profile`, the cycle key and the watcher.
+        self.profiles = profiles
+        self.backend = backend or get_backend()
+        self.loader = LoadingScheduler(launch_time)
+        self._startup_reported = False
+        phase_started = time.perf_counter()
+        self.state = StateMachine(GameState.START)
+        self.pool_sizes: Optional[PoolSizeCache] = None
+        if config.pools.adaptive_sizing:
+            self.pool_sizes = PoolSizeCache(config.pools.cache_path or default_pool_size_path(), config.profile)
+        self.asset_cache: Optional[BakedAssetCache] = None
+        if config.assets.baked_cache and self.backend.persistent_assets:
+            self.asset_cache = BakedAssetCache(
+                self.backend,
+                config.assets.cache_dir or default_asset_cache_dir(),
+                asset_key(config),
+            )
+            self.asset_cache.load_or_bake()
+            phase_started = self._record_startup_phase(
+                "assets_hit" if self.asset_cache.hit else "assets_baked",
+                phase_started,
+            )
+        obstacle_prewarm = self._pool_prewarm_size(config.spawner, "obstacles")
+        collectible_prewarm = self._pool_prewarm_size(config.collectible, "collectibles")
+        deferred = config.startup.async_loading
+        # Run seeds come from one generator (fixed by `simulation.seed` when
+        # set); each run reseeds the per-subsystem streams from its own seed.
+        base_seed = config.simulation.seed
+        self._run_seeds = random.Random(random.getrandbits(63) if base_seed is None else base_seed)
+        self.rng = RandomStreams(self._run_seeds.getrandbits(63))
+        self.run_seed = self.rng.seed
+        self.recorder = ReplayRecorder()
+        self.last_replay: Optional[Replay] = None
+        self._config_hash = config_hash(config)
+        self.track = Track(config.world, self.backend)
+        self.player = PlayerController(config.lane, config.player, backend=self.backend)
+        self.world = WorldSystem(config.world, config.lane, backend=self.backend, track=self.track)
+        self.spawner = ObstacleSpawner(
+            config.lane,
+            config.world,
+            replace(config.spawner, pool_initial_size=0 if deferred else obstacle_prewarm),
+            backend=self.backend,
+            track=self.track,
+            rng=self.rng.stream("spawner"),
+        )
+        self.collectibles = CollectibleSystem(
+            config.lane,
+            config.world,
+            replace(config.collectible, pool_initial_size=0 if deferred else collectible_prewarm),
+            backend=self.backend,
+            track=self.track,
+            rng=self.rng.stream("collectibles"),
+        )
+        self.patterns: Optional[PatternQueue] = None
+        if pattern_mode(config) != "inline":
+            generator = PatternGenerator(
+                config,
+                self.rng.stream("obstacle_patterns"),
+                self.rng.stream("collectible_patterns"),
+            )
+            horizon = int(config.patterns.lookahead_seconds * config.simulation.tick_rate)
+            self.patterns = PatternQueue(generator, horizon, pattern_mode(config))
+        phase_started = self._record_startup_phase("systems", phase_started)
+        self.hud = HudView(
+            resume_countdown_style=config.hud.resume_countdown_style,
+            backend=self.backend,
+            counter_refresh_rate=config.hud.counter_refresh_rate,
+            glyph_counters=config.hud.glyph_counters,
+            layout_poll_interval=config.hud.layout_poll_interval,
+        )
+        self.resume_countdown_duration = 3.0
+        self.resume_countdown_remaining = 0.0
+        self.elapsed_time = 0.0
+        self.score = 0
+        self.pickups = 0
+        self.tick_count = 0
+        self.dropped_time = 0.0
+        self._tick_dt = 1.0 / max(config.simulation.tick_rate, 1.0)
+        self._accumulator = 0.0
+        self._last_step_distance = 0.0
+
+        self.profiler = FrameProfiler(
+            capacity=config.profiler.history_frames,
+            enabled=config.profiler.enabled,
+        )
+        self.profiler_overlay = ProfilerOverlay(
+            self.profiler,
+            self.backend,
+            config.profiler.overlay_refresh_interval,
+            status=self._overlay_status,
+        )
+        self.pacing = pacing_plan(config.pacing)
+        self.jitter = FrameJitter(self.pacing.budget_ms, config.pacing.history_frames, config.pacing.stall_margin)
+        self.quality = QualityController(self._quality_config(config), self._apply_quality)
+        self.latency = LatencyTracker(config.input.latency_samples, config.input.presented_fraction)
+        self._profile_watch_time = 0.0
+        self._profile_mtime = self._profile_file_mtime()
+
+        self._setup_scene()
+        self.hud.set_state(self.state.state)
+        self._record_startup_phase("hud_scene", phase_started)
+        if deferred:
+            self.loader.add_phase("obstacle_pool", prewarm_steps(self.spawner.pool, obstacle_prewarm))
+            self.loader.add_phase("collectible_pool", prewarm_steps(self.collectibles.pool, collectible_prewarm))
+            self.loader.add_phase("hud_glyphs", self.hud.glyph_build_steps())
+        else:
+            self.hud.build_glyphs()
+
+    def _record_startup_phase(self, name: str, started: float) -> float:
+        now = time.perf_counter()
+        self.loader.record_phase(name, now - started)
+        return now
+
+    def _pool_prewarm_size(self, cfg: Union[SpawnerConfig, CollectibleConfig], pool_name: str) -> int:
+        if self.pool_sizes is not None:
+            learned = self.pool_sizes.prewarm_size(pool_name, self.config.pools.headroom, cfg.pool_max_size)
+            if learned is not None:
+                return learned
+        return cfg.pool_initial_size
+
+    @property
+    def loading(self) -> bool:
+        return not self.loader.done
+
+    def finish_loading(self) -> None:
+        self.loader.finish()
+        self._report_startup()
+
+    def _report_startup(self) -> None:
+        if self._startup_reported or not self.loader.done:
+            return
+        self._startup_reported = True
+        if self.config.startup.log_report:
+            print(self.loader.report().format())
+
+    def pool_stats(self) -> list[PoolStats]:
+        return [self.spawner.pool.stats(), self.collectibles.pool.stats()]
+
+    def save_pool_sizes(self) -> bool:
+        if self.pool_sizes is None:
+            return False
+        self.pool_sizes.record(self.pool_stats())
+        return self.pool_sizes.save()
+
+    def dump_profile(self, reason: str = "manual") -> Optional[tuple[str, str]]:
+        if not self.profiler.enabled or self.profiler.count == 0:
+            return None
+        stem = time.strftime("profile-%Y%m%d-%H%M%S") + f"-{reason}"
+        meta = {
+            "reason": reason,
+            "profile": self.config.profile,
+            "backend": self.backend.name,
+            "tick_rate": self.config.simulation.tick_rate,
+            "elapsed_time": self.elapsed_time,
+            "score": self.score // 10,
+            "quality_tier": self.quality.tier.name,
+            "pacing": self.pacing.mode,
+            "jitter": self.jitter.stats()._asdict(),
+            "input_latency": {
+                "low_latency": self.config.input.low_latency,
+                "bins_ms": list(LATENCY_BINS_MS),
+                "sim": self.latency.sim.summary()._asdict(),
+                "presented": self.latency.shown.summary()._asdict(),
+            },
+        }
+        paths = self.profiler.dump(self.config.profiler.output_dir, stem, meta)
+        print(f"[Profiler] wrote {paths[0]} and {paths[1]}")
+        return paths
+
+    def _quality_config(self, config: GameConfig) -> QualityConfig:
+        # A capped or half-refresh pacing mode must not read as "too slow".
+        target_fps = min(config.quality.target_fps, self.pacing.target_fps)
+        return replace(config.quality, target_fps=target_fps)
+
+    def _overlay_status(self) -> str:
+        return (
+            f"profile: {self.config.profile}  quality: {self.quality.tier.name}\n"
+            f"pacing: {self.pacing.mode}  {self.jitter.stats().format()}\n"
+            f"{self.latency.format()}{'  (low latency)' if self.config.input.low_latency else ''}"
+        )
+
+    def _apply_quality(self, tier: QualityTier) -> None:
+        cfg = self.config
+        max_active = None
+        if cfg.quality.adjust_spawn_caps:
+            max_active = round(cfg.collectible.max_active * tier.collectible_cap_scale)
+        self.collectibles.set_quality(
+            details=tier.collectible_details,
+            effects=tier.collectible_effects,
+            far_anim_interval=tier.far_anim_interval,
+            max_active=max_active,
+        )
+        self.world.set_visible_segments(tier.ground_segments)
+        self.hud.set_quality_tier(tier.name)
+
+    def apply_config(self, config: GameConfig) -> Optional[list[str]]:
+        """Switch to `config` without rebuilding the game.
+
+        Only on the START screen or while paused; returns None otherwise.
+        Tuning, difficulty, spawn and pool settings take effect at once:
+        pools grow or drop idle entities to the new sizes. Sections that
+        build the scene or clock (see `game.profiles.live_config`) keep their
+        current values; their changed fields are returned. A gameplay change
+        while paused stops recording the run, which could not be replayed.
+        """
+        if not (self.state.is_state(GameState.START) or self.state.is_state(GameState.PAUSED)):
+            print(f"[Profile] {config.profile}: switch on the start screen or while paused")
+            return None
+        # Deferred prewarm steps must not run against the resized pools.
+        self.finish_loading()
+        previous = self.config
+        config, pending = live_config(previous, config)
+        if self.pool_sizes is not None and config.profile != previous.profile:
+            # Learned sizes are per profile: keep this one's, load the new one's.
+            self.save_pool_sizes()
+            self.pool_sizes = PoolSizeCache(self.pool_sizes.path, config.profile)
+        self.config = config
+        obstacles = self.spawner.apply_config(config.spawner, self._pool_prewarm_size(config.spawner, "obstacles"))
+        collectibles = self.collectibles.apply_config(
+            config.collectible,
+            self._pool_prewarm_size(config.collectible, "collectibles"),
+        )
+        if self.patterns is not None:
+            self.patterns.set_config(config)
+        if config.quality != previous.quality:
+            self.quality = QualityController(self._quality_config(config), self._apply_quality)
+        else:
+            self._apply_quality(self.quality.tier)
+        digest = config_hash(config)
+        # The rest of a paused run would replay under the old config.
+        dropped_replay = self.recorder.recording and digest != self._config_hash
+        if dropped_replay:
+            self.recorder.recording = False
+            self.last_replay = None
+        self._config_hash = digest
+        self._profile_mtime = self._profile_file_mtime()
+        print(
+            f"[Profile] {previous.profile} -> {config.profile} "
+            f"(pools: obstacles={obstacles} collectibles={collectibles})"
+            + ("; gameplay changed mid-run, replay recording stopped" if dropped_replay else "")
+        )
+        if pending:
+            print(f"[Profile] needs a restart: {', '.join(pending)}")
+        return pending
+
+    def switch_profile(self, name: str) -> Optional[list[str]]:
+        """Load profile `name` (or a file path) and apply it; see `apply_config`."""
+        if self.profiles is None:
+            return None
+        try:
+            config = self.profiles.load(name)
+        except ProfileError as exc:
+            print(f"[Profile] {exc}")
+            return None
+        return self.apply_config(config)
+
+    def _profile_file_mtime(self) -> Optional[float]:
+        if self.profiles is None:
+            return None
+        try:
+            return os.path.getmtime(self.profiles.path(self.config.profile))
+        except (ProfileError, OSError):
+            return None
+
+    def _watch_profile(self, dt: float) -> None:
+        interval = self.config.profiles.watch_interval
+        if interval <= 0.0 or self._profile_mtime is None:
+            return
+        self._profile_watch_time += dt
+        if self._profile_watch_time < interval:
+            return
+        self._profile_watch_time = 0.0
+        mtime = self._profile_file_mtime()
+        if mtime is not None and mtime != self._profile_mtime:
+            self._profile_mtime = mtime
+            self.switch_profile(self.config.profile)
+
+    @property
+    def tick_dt(self) -> float:
+        return self._tick_dt
+
+    def current_replay(self) -> Optional[Replay]:
+        if self.recorder.recording:
+            return self.recorder.snapshot(self.tick_count, self.score // 10)
+        return self.last_replay
+
+    def save_replay(self, reason: str = "manual") -> Optional[str]:
+        replay = self.current_replay()
+        if replay is None:
+            return None
+        name = time.strftime("replay-%Y%m%d-%H%M%S") + f"-{reason}.ndr"
+        path = replay.save(os.path.join(self.config.replay.output_dir, name))
+        print(f"[Replay] wrote {path} ({len(replay.inputs)} inputs, {replay.ticks} ticks)")
+        return path
+
+    def _setup_scene(self) -> None:
+        self.backend.set_window("Neon Dash", self.backend.rgb(8, 10, 17))
+        self.backend.set_camera(position=(0, 13, -28), rotation_x=22, fov=50)
+
+    @staticmethod
+    def _lerp(a: float, b: float, t: float) -> float:
+        return a + (b - a) * t
+
+    def _difficulty_t(self) -> float:
+        ramp = max(self.config.difficulty.ramp_seconds, 1.0)
+        return min(1.0, self.elapsed_time / ramp)
+
+    def _current_speed(self) -> float:
+        t = self._difficulty_t()
+        return self._lerp(
+            self.config.movement.start_speed,
+            self.config.movement.end_speed,
+            t,
+        )
+
+    def _set_state(self, new_state: GameState) -> None:
+        if self.state.set_state(new_state):
+            self.hud.set_state(new_state)
+
+    def start_run(self, seed: Optional[int] = None) -> None:
+        """Start a run; `seed` replays a recorded run, None draws the next one."""
+        self.run_seed = self._run_seeds.getrandbits(63) if seed is None else seed
+        if self.patterns is not None:
+            # The worker must not draw from the streams while they are reseeded.
+            self.patterns.stop()
+        self.rng.reseed(self.run_seed)
+        self._start_run()
+        self.recorder.begin(self.run_seed, self._config_hash)
+
+    def move_lane(self, direction: int) -> None:
+        """Queue a lane switch for the next tick and record it."""
+        if not self.state.is_state(GameState.PLAYING):
+            return
+        self.recorder.record(self.tick_count, direction)
+        from_x, lane = self.player.entity.x, self.player.lane_index
+        # The lane index (and so collision) switches now; the move itself
+        # starts on the next tick.
+        if direction == MOVE_LEFT:
+            self.player.move_left()
+        elif direction == MOVE_RIGHT:
+            self.player.move_right()
+        if self.player.lane_index != lane:
+            self.latency.press(from_x, self.player.target_x)
+
+    def _start_run(self) -> None:
+        self.elapsed_time = 0.0
+        self.score = 0
+        self.pickups = 0
+        self.tick_count = 0
+        self.resume_countdown_remaining = 0.0
+        self._accumulator = 0.0
+        self._last_step_distance = 0.0
+        # The restart frame itself is a hitch; start measuring afresh.
+        self.quality.reset_window()
+        self.latency.reset()
+        self.player.reset()
+        self.track.reset()
+        self.world.reset()
+        self.spawner.reset()
+        self.collectibles.reset()
+        if self.patterns is not None:
+            self.patterns.reset()
+        self.hud.hide_resume_countdown()
+        self.hud.set_score(self.score)
+        self.hud.set_elapsed_time(self.elapsed_time)
+        self._set_state(GameState.PLAYING)
+
+    def _end_run(self) -> None:
+        # The state change flushes the counters; nothing refreshes them after.
+        self.hud.set_score(self.score // 10)
+        self.hud.set_elapsed_time(self.elapsed_time)
+        self._set_state(GameState.GAME_OVER)
+        if self.recorder.recording:
+            self.last_replay = self.recorder.finish(self.tick_count, self.score // 10)
+        if self.config.replay.save_on_game_over:
+            self.save_replay("game_over")
+        self.save_pool_sizes()
+        if self.config.pacing.log_on_game_over:
+            print(f"[Pacing] {self.pacing.mode}: {self.jitter.stats().format()}")
+        if self.config.profiler.dump_on_game_over:
+            self.dump_profile("game_over")
+
+    def _start_resume_countdown(self) -> None:
+        self.resume_countdown_remaining = self.resume_countdown_duration
+        self.hud.start_resume_countdown(self.resume_countdown_duration)
+        self._set_state(GameState.RESUMING)
+
+    def _cancel_resume_countdown(self) -> None:
+        self.resume_countdown_remaining = 0.0
+        self.hud.hide_resume_countdown()
+        self._set_state(GameState.PAUSED)
+
+    def input(self, key: str) -> None:
+        if key == self.config.profiler.overlay_key:
+            self.profiler_overlay.toggle()
+            return
+        if key == self.config.profiler.dump_key:
+            self.dump_profile()
+            return
+        if key == self.config.replay.save_key:
+            self.save_replay()
+            return
+        if key == self.config.profiles.cycle_key:
+            if self.profiles is not None:
+                self.profiles.refresh()
+                name = self.profiles.next_name(self.config.profile)
+                if name is not None:
+                    self.switch_profile(name)
+            return
+
+        if key in {"escape", "p"}:
+            if self.state.is_state(GameState.PLAYING):
+                self._set_state(GameState.PAUSED)
+            elif self.state.is_state(GameState.PAUSED):
+                self._start_resume_countdown()
+            elif self.state.is_state(GameState.RESUMING):
+                self._cancel_resume_countdown()
+            return
+
+        if self.state.is_state(GameState.START):
+            if key == "space":
+                # Deferred prewarm must be complete before the first run starts.
+                self.finish_loading()
+                self.start_run()
+            return
+
+        if self.state.is_state(GameState.GAME_OVER):
+            if key in {"r", "space"}:
+                self.start_run()
+            return
+
+        if not self.state.is_state(GameState.PLAYING):
+            return
+
+        if key in {"a", "left arrow"}:
+            self.move_lane(MOVE_LEFT)
+        elif key in {"d", "right arrow"}:
+            self.move_lane(MOVE_RIGHT)
+
+    def _check_collision(self) -> bool:
+        return self.spawner.collides_with(
+            self.player.lane_index,
+            self.player.z,
+            self.config.player.collision_z_threshold,
+        )
+
+    def _step(self, dt: float) -> None:
+        profiler = self.profiler
+        profiler.mark()
+        self.tick_count += 1
+        self.latency.tick()
+        self.player.update(dt)
+        profiler.lap(PHASE_PLAYER)
+        self.elapsed_time += dt
+        difficulty_t = self._difficulty_t()
+        speed = self._current_speed()
+        self._last_step_distance = speed * dt
+        self.track.advance(speed * dt)
+        self.world.update(dt, speed)
+        profiler.lap(PHASE_WORLD)
+        if self.patterns is None:
+            blocked_lanes = self.collectibles.lanes_blocked_near_spawn(
+                self.config.collectible.min_obstacle_distance_z,
+            )
+            self.spawner.update(dt, speed, difficulty_t, blocked_lanes=blocked_lanes)
+            profiler.lap(PHASE_SPAWNER)
+            self.collectibles.update(dt, speed, difficulty_t, self.spawner.store)
+            profiler.lap(PHASE_COLLECTIBLES)
+        else:
+            event = self.patterns.take(self.tick_count)
+            if event is not None:
+                self.spawner.place(event.obstacle_lanes)
+            self.spawner.update(dt, speed, difficulty_t, timed_spawns=False)
+            profiler.lap(PHASE_SPAWNER)
+            self.collectibles.update(dt, speed, difficulty_t, self.spawner.store, timed_spawns=False)
+            if event is not None and event.collectible_lane >= 0:
+                self.collectibles.place(event.collectible_lane, event.phase)
+            profiler.lap(PHASE_COLLECTIBLES)
+
+        collected_count = self.collectibles.collect_at(
+            player_lane=self.player.lane_index,
+            player_z=self.player.z,
+            threshold=self.config.collectible.pickup_z_threshold,
+        )
+        if collected_count > 0:
+            self.pickups += collected_count
+            bonus_score = collected_count * self.config.collectible.reward_score
+            self.score += bonus_score * 10
+            self.hud.show_pickup_bonus(f"+{bonus_score}")
+
+        self.score += int(dt * self.config.movement.score_per_second * 10)
+        profiler.lap(PHASE_PICKUP)
+
+        if self._check_collision():
+            self._end_run()
+        profiler.lap(PHASE_COLLISION)
+
+        if self.track.needs_rebase():
+            self._rebase_track()
+            profiler.lap(PHASE_WORLD)
+
+    def _rebase_track(self) -> None:
+        shift = self.track.rebase()
+        self.world.rebase(shift)
+        self.spawner.rebase()
+        self.collectibles.rebase()
+
+    def _render(self, alpha: float) -> None:
+        # Everything world-bound scrolls at the same speed, so interpolating
+        # between the last two ticks is a single view offset for all of it.
+        view_offset = (1.0 - alpha) * self._last_step_distance
+        self.backend.set_view_offset(view_offset)
+        lead_dt = self._tick_dt if self.config.input.low_latency else 0.0
+        self.player.render(alpha, view_offset, lead_dt)
+        if self.latency.pending:
+            self.latency.presented(self.player.entity.x)
+
+    def update(self, dt: float) -> None:
+        self.profiler.begin_frame()
+        self._update_frame(dt)
+        self.profiler.end_frame()
+
+    def _update_frame(self, dt: float) -> None:
+        profiler = self.profiler
+        if not self._startup_reported:
+            self.loader.run(self.config.startup.frame_budget_ms)
+            self._report_startup()
+        profiler.mark()
+        self.hud.update(dt)
+        self.profiler_overlay.update(dt)
+        profiler.lap(PHASE_HUD)
+
+        if self.state.is_state(GameState.RESUMING):
+            self.resume_countdown_remaining = max(0.0, self.resume_countdown_remaining - dt)
+            self.hud.set_resume_countdown_remaining(self.resume_countdown_remaining)
+            if self.resume_countdown_remaining <= 0.0:
+                self.hud.hide_resume_countdown()
+                self.quality.reset_window()
+                self._set_state(GameState.PLAYING)
+            return
+
+        if not self.state.is_state(GameState.PLAYING):
+            if self.profiles is not None and self.state.state in {GameState.START, GameState.PAUSED}:
+                self._watch_profile(dt)
+            return
+
+        self.jitter.observe(dt)
+        change = self.quality.observe(dt)
+        if change is not None:
+            print(
+                f"[Quality] {change.previous.name} -> {change.tier.name} "
+                f"(p{self.config.quality.percentile:g} {change.frame_ms:.1f} ms, budget {change.budget_ms:.1f} ms)"
+            )
+
+        tick = self._tick_dt
+        max_steps = max(1, self.config.simulation.max_catchup_steps)
+        self._accumulator += max(0.0, dt)
+        steps = 0
+        while self._accumulator >= tick and steps < max_steps:
+            self._accumulator -= tick
+            steps += 1
+            self._step(tick)
+            if not self.state.is_state(GameState.PLAYING):
+                break
+        if steps >= max_steps and self._accumulator >= tick:
+            # Catch-up cap hit: drop the backlog instead of spiralling.
+            dropped = self._accumulator - (self._accumulator % tick)
+            self.dropped_time += dropped
+            self._accumulator -= dropped
+
+        profiler.mark()
+        self.hud.set_elapsed_time(self.elapsed_time)
+        self.hud.set_score(self.score // 10)
+        profiler.lap(PHASE_HUD)
+        self._render(min(1.0, self._accumulator / tick))
+        profiler.lap(PHASE_RENDER)
+        if self.patterns is not None and self.state.is_state(GameState.PLAYING):
+            self.patterns.fill(self.config.patterns.idle_budget_ms)
+            profiler.lap(PHASE_SPAWNER)
@@ -0,0 +1,175 @@
+from collections import deque
+from typing import Any, Optional
+
+import numpy as np
+
+
+class EntityStore:
+    """Structure-of-arrays state for pooled world objects.
+
+    One slot per pool entry: gameplay state lives in contiguous arrays and the
+    render node for a slot is only written by `sync_z`, once per tick.
+
+    Each lane also keeps a deque of its active slots ordered by z (nearest the
+    player on the left). Everything scrolls at one speed, so that order never
+    changes after insertion: lane queries are a binary search from one end and
+    cleanup is popping from the left.
+
+    With `track_space=True`, `z` holds track-local coordinates and `advance`
+    only moves `offset` (world z = z - offset), so scrolling is O(1); `rebase`
+    folds the offset back into the array at intervals.
+    """
+
+    def __init__(self, capacity: int, lane_count: int = 3, track_space: bool = False) -> None:
+        self.capacity = max(1, capacity)
+        self.track_space = track_space
+        self.offset = 0.0
+        self.z = np.zeros(self.capacity, dtype=np.float64)
+        self.lane = np.zeros(self.capacity, dtype=np.int8)
+        self.phase = np.zeros(self.capacity, dtype=np.float64)
+        self.active = np.zeros(self.capacity, dtype=bool)
+        self.spawn_seq = np.zeros(self.capacity, dtype=np.int64)
+        self.nodes: list[Optional[Any]] = [None] * self.capacity
+        self.lanes: list[deque[int]] = [deque() for _ in range(max(1, lane_count))]
+        self._next_seq = 0
+
+    def grow(self, capacity: int) -> None:
+        """Add slots; existing slots keep their index and state."""
+        extra = capacity - self.capacity
+        if extra <= 0:
+            return
+        self.capacity = capacity
+        self.z = np.concatenate((self.z, np.zeros(extra, dtype=self.z.dtype)))
+        self.lane = np.concatenate((self.lane, np.zeros(extra, dtype=self.lane.dtype)))
+        self.phase = np.concatenate((self.phase, np.zeros(extra, dtype=self.phase.dtype)))
+        self.active = np.concatenate((self.active, np.zeros(extra, dtype=bool)))
+        self.spawn_seq = np.concatenate((self.spawn_seq, np.zeros(extra, dtype=self.spawn_seq.dtype)))
+        self.nodes.extend([None] * extra)
+
+    @property
+    def count(self) -> int:
+        return int(np.count_nonzero(self.active))
+
+    def activate(self, slot: int, lane: int, z: float, phase: float = 0.0) -> None:
+        z += self.offset
+        self.z[slot] = z
+        self.lane[slot] = lane
+        self.phase[slot] = phase
+        self.active[slot] = True
+        self.spawn_seq[slot] = self._next_seq
+        self._next_seq += 1
+
+        lane_slots = self.lanes[lane]
+        if not lane_slots or self.z[lane_slots[-1]] <= z:
+            lane_slots.append(slot)
+        else:
+            lane_slots.insert(self._lower_bound(lane_slots, z), slot)
+
+    def deactivate(self, slot: int) -> bool:
+        if not self.active[slot]:
+            return False
+        self.active[slot] = False
+        lane_slots = self.lanes[self.lane[slot]]
+        if lane_slots and lane_slots[0] == slot:
+            lane_slots.popleft()
+        else:
+            lane_slots.remove(slot)
+        return True
+
+    def active_slots(self) -> np.ndarray:
+        slots = np.flatnonzero(self.active)
+        if slots.size > 1:
+            slots = slots[np.argsort(self.spawn_seq[slots], kind="stable")]
+        return slots
+
+    def advance(self, dz: float) -> None:
+        if self.track_space:
+            self.offset += dz
+            return
+        # Inactive slots drift too; `activate` overwrites their z on reuse.
+        self.z -= dz
+
+    def rebase(self) -> float:
+        shift = self.offset
+        if shift:
+            self.z -= shift
+            self.offset = 0.0
+        return shift
+
+    def world_z(self, slots: np.ndarray) -> np.ndarray:
+        return self.z[slots] - self.offset
+
+    def _lower_bound(self, lane_slots: deque, z: float, strict: bool = False) -> int:
+        # First index whose z is >= `z` (> `z` when strict).
+        zs = self.z
+        lo, hi = 0, len(lane_slots)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = zs[lane_slots[mid]]
+            if value > z or (not strict and value == z):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _lane_range(self, lane: int, z: float, distance: float, strict: bool, first_only: bool) -> list[int]:
+        lane_slots = self.lanes[lane]
+        zs = self.z
+        z += self.offset
+        upper = z + distance
+        found: list[int] = []
+        for index in range(self._lower_bound(lane_slots, z - distance, strict), len(lane_slots)):
+            slot = lane_slots[index]
+            value = zs[slot]
+            if value > upper or (strict and value == upper):
+                break
+            found.append(slot)
+            if first_only:
+                break
+        return found
+
+    def slots_behind(self, cleanup_z: float) -> np.ndarray:
+        zs = self.z
+        cleanup_z += self.offset
+        behind: list[int] = []
+        for lane_slots in self.lanes:
+            for slot in lane_slots:
+                if zs[slot] > cleanup_z:
+                    break
+                behind.append(slot)
+        return np.asarray(behind, dtype=np.int64)
+
+    def slots_within(
+        self,
+        z: float,
+        distance: float,
+        lane: Optional[int] = None,
+        strict: bool = False,
+    ) -> np.ndarray:
+        lanes = range(len(self.lanes)) if lane is None else (lane,)
+        found: list[int] = []
+        for lane_index in lanes:
+            found.extend(self._lane_range(lane_index, z, distance, strict, first_only=False))
+        return np.asarray(found, dtype=np.int64)
+
+    def any_within(
+        self,
+        z: float,
+        distance: float,
+        lane: Optional[int] = None,
+        strict: bool = False,
+    ) -> bool:
+        lanes = range(len(self.lanes)) if lane is None else (lane,)
+        return any(self._lane_range(lane_index, z, distance, strict, first_only=True) for lane_index in lanes)
+
+    def lanes_within(self, z: float, distance: float, strict: bool = False) -> set[int]:
+        return {
+            lane_index
+            for lane_index in range(len(self.lanes))
+            if self._lane_range(lane_index, z, distance, strict, first_only=True)
+        }
+
+    def sync_z(self, slots: np.ndarray) -> None:
+        nodes = self.nodes
+        for slot, z in zip(slots.tolist(), self.z[slots].tolist()):
+            nodes[slot].z = z
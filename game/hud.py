@@ -1,56 +1,192 @@
 import math
-from ursina import Entity, Text, camera, color, window
+from typing import Any, Iterator, Optional
+
+from game.render import RenderBackend, get_backend
 from game.state_machine import GameState
 
+# Ursina's default Text.size and VeraMono's advance (em fraction): with the
+# monospace font every glyph is TEXT_SIZE * MONO_ADVANCE * scale wide.
+TEXT_SIZE = 0.025
+MONO_ADVANCE = 0.6
+MONO_FONT = "VeraMono.ttf"
+DIGITS = "0123456789"
+RESUME_COUNTDOWN_STYLES = ("cyber", "minimal")
+
+
+class GlyphCounter:
+    """Fixed-width counter drawn from pre-built glyph nodes.
+
+    `template` marks digit slots with '#'; any other character is a static
+    glyph. Each digit slot owns one hidden text node per digit, so showing a
+    new value only flips `enabled` on slots whose digit changed and never
+    rebuilds text geometry. A blank (' ') hides the slot.
+    """
+
+    def __init__(
+        self,
+        backend: RenderBackend,
+        template: str,
+        prefix: str = "",
+        scale: float = 1.0,
+        color: Any = None,
+        **root_kwargs: Any,
+    ) -> None:
+        self.backend = backend
+        self.template = template
+        self.root = backend.entity(parent=backend.ui, **root_kwargs)
+        self.advance = TEXT_SIZE * MONO_ADVANCE * scale
+        self._length = len(prefix) + len(template)
+        self._glyph_kwargs = {"origin": (-0.5, 0), "scale": scale, "font": MONO_FONT, "color": color}
+        self.static = [
+            backend.text(parent=self.root, text=char, position=(index * self.advance, 0), **self._glyph_kwargs)
+            for index, char in enumerate(prefix + template)
+            if char != "#" and char != " "
+        ]
+        self._slot_x = [
+            (len(prefix) + index) * self.advance for index, char in enumerate(template) if char == "#"
+        ]
+        self._slots: list[list[Any]] = []
+        self._shown: list[Optional[int]] = []
+        self.text = ""
+
+    @property
+    def slot_count(self) -> int:
+        return len(self._slot_x)
+
+    @property
+    def width(self) -> float:
+        return self.advance * self._length
+
+    @property
+    def built(self) -> bool:
+        return len(self._slots) == self.slot_count
+
+    def build_steps(self) -> Iterator[None]:
+        """Create the digit nodes one slot at a time (for the loading scheduler)."""
+        while not self.built:
+            x = self._slot_x[len(self._slots)]
+            self._slots.append(
+                [
+                    self.backend.text(
+                        parent=self.root,
+                        text=digit,
+                        position=(x, 0),
+                        enabled=False,
+                        **self._glyph_kwargs,
+                    )
+                    for digit in DIGITS
+                ]
+            )
+            self._shown.append(None)
+            if not self.built:
+                yield
+
+    def build(self) -> None:
+        for _ in self.build_steps():
+            pass
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.root.enabled)
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.root.enabled = value
+
+    def set_digits(self, digits: str) -> None:
+        if digits == self.text:
+            return
+        self.text = digits
+        shown = self._shown
+        for slot, char in enumerate(digits[: self.slot_count]):
+            index = None if char == " " else ord(char) - 48
+            current = shown[slot]
+            if current == index:
+                continue
+            glyphs = self._slots[slot]
+            if current is not None:
+                glyphs[current].enabled = False
+            if index is not None:
+                glyphs[index].enabled = True
+            shown[slot] = index
+
 
 class HudView:
-    def __init__(self, resume_countdown_style: str = "cyber") -> None:
+    SCORE_DIGITS = 9
+    # Larger scores show as this rather than losing their leading digits.
+    SCORE_MAX = 10**SCORE_DIGITS - 1
+    TIME_TEMPLATE = "##:##.##"
+    TIME_TEMPLATE_HOURS = "##:##:##.##"
+
+    def __init__(
+        self,
+        resume_countdown_style: str = "cyber",
+        backend: Optional[RenderBackend] = None,
+        counter_refresh_rate: float = 20.0,
+        glyph_counters: bool = True,
+        layout_poll_interval: float = 0.5,
+    ) -> None:
+        self.backend = backend or get_backend()
+        # 0 => counters refresh every frame (still only when the value changed).
+        self._counter_interval = 1.0 / counter_refresh_rate if counter_refresh_rate > 0 else 0.0
+        self._counter_timer = self._counter_interval
+        self._layout_poll_interval = max(0.0, layout_poll_interval)
+        self._layout_timer = 0.0
+        self._pending_score = 0
+        self._pending_centis = 0
+        self._shown_score: Optional[int] = None
+        self._shown_centis: Optional[int] = None
+        self._shown_fps: Optional[int] = None
+        self.quality_tier = ""
+        self.score_display = "0"
+        self.time_display = "00:00.00"
+        self.text_writes = 0
         self._resume_style = (
-            resume_countdown_style if resume_countdown_style in {"cyber", "minimal"} else "cyber"
+            resume_countdown_style if resume_countdown_style in RESUME_COUNTDOWN_STYLES else "cyber"
         )
-        self.score_text = Text(
+        self.score_text = self.backend.text(
             text="Score: 0",
             origin=(-0.5, 0),
             position=(-0.86, 0.45),
-            color=color.azure,
+            color=self.backend.named_color("azure"),
             scale=1.6,
         )
-        self.time_text = Text(
+        self.time_text = self.backend.text(
             text="Time: 00:00.00",
             origin=(0, 0),
             position=(0.0, 0.46),
-            color=color.rgb(178, 228, 255),
+            color=self.backend.rgb(178, 228, 255),
             scale=1.35,
         )
-        self.fps_text = Text(
+        self.fps_text = self.backend.text(
             text="fps:0",
             origin=(1.0, 0),
             position=(0.875, 0.46),
-            color=color.light_gray,
+            color=self.backend.named_color("light_gray"),
             scale=1.16,
         )
-        self.state_text = Text(
+        self.state_text = self.backend.text(
             text="Press SPACE to Start",
             origin=(0, 0),
             position=(0, 0.38),
-            color=color.cyan,
+            color=self.backend.named_color("cyan"),
             scale=1.6,
         )
-        self.hint_text = Text(
+        self.hint_text = self.backend.text(
             text="Move: A/D or Left/Right | Pause: ESC/P | Restart: R",
             origin=(0, 0),
             position=(0, -0.45),
-            color=color.light_gray,
+            color=self.backend.named_color("light_gray"),
             scale=1.0,
         )
         self._bonus_base_x = 0.0
         self._bonus_base_y = -0.06
         self._bonus_main_scale = 2.15
-        self.bonus_text = Text(
+        self.bonus_text = self.backend.text(
             text="",
             origin=(0, 0),
             position=(self._bonus_base_x, self._bonus_base_y),
-            color=color.rgba(255, 242, 168, 255),
+            color=self.backend.rgba(255, 242, 168, 255),
             scale=self._bonus_main_scale,
         )
         self._bonus_timer = 0.0
@@ -69,45 +205,95 @@ class HudView:
         self._last_aspect_ratio = 0.0
         self._hud_top_y = 0.46
 
-        self.resume_panel = Entity(
-            parent=camera.ui,
+        self.resume_panel = self.backend.entity(
+            parent=self.backend.ui,
             model="quad",
             position=(0, 0.31),
             scale=self._resume_panel_base_scale,
-            color=color.rgba(12, 28, 44, 170),
+            color=self.backend.rgba(12, 28, 44, 170),
             enabled=False,
         )
-        self.resume_title_text = Text(
+        self.resume_title_text = self.backend.text(
             text="Resume In",
             origin=(0, 0),
             position=(0, 0.335),
-            color=color.rgb(115, 220, 255),
+            color=self.backend.rgb(115, 220, 255),
             scale=1.2,
         )
-        self.resume_value_text = Text(
+        self.resume_value_text = self.backend.text(
             text="3.0s",
             origin=(0, 0),
             position=(0, 0.283),
-            color=color.rgb(255, 236, 140),
+            color=self.backend.rgb(255, 236, 140),
             scale=2.1,
         )
-        self.resume_accent_line = Entity(
-            parent=camera.ui,
+        self.resume_accent_line = self.backend.entity(
+            parent=self.backend.ui,
             model="quad",
             position=(0, 0.358),
             scale=(0.18, 0.004),
-            color=color.rgba(120, 240, 255, 140),
+            color=self.backend.rgba(120, 240, 255, 140),
             enabled=False,
         )
         self.resume_title_text.enabled = False
         self.resume_value_text.enabled = False
         self._apply_resume_style()
+
+        self._glyph_counters = glyph_counters
+        self._glyphs_active = False
+        self.score_counter: Optional[GlyphCounter] = None
+        self.time_counter: Optional[GlyphCounter] = None
+        self._time_hours_counter: Optional[GlyphCounter] = None
+        if glyph_counters:
+            self.score_counter = GlyphCounter(
+                self.backend,
+                "#" * self.SCORE_DIGITS,
+                prefix="Score: ",
+                scale=1.6,
+                color=self.backend.named_color("azure"),
+                enabled=False,
+            )
+            self.time_counter = self._create_time_counter(self.TIME_TEMPLATE)
         self._refresh_layout(force=True)
 
-    @staticmethod
-    def _safe_aspect_ratio() -> float:
+    def _create_time_counter(self, template: str) -> GlyphCounter:
+        return GlyphCounter(
+            self.backend,
+            template,
+            prefix="Time: ",
+            scale=1.35,
+            color=self.backend.rgb(178, 228, 255),
+            enabled=False,
+        )
+
+    def glyph_build_steps(self) -> Iterator[None]:
+        """Build the digit glyphs a slot at a time; counters switch over when done."""
+        for counter in (self.score_counter, self.time_counter):
+            if counter is not None:
+                yield from counter.build_steps()
+                yield
+        self._activate_glyphs()
+
+    def build_glyphs(self) -> None:
+        for _ in self.glyph_build_steps():
+            pass
+
+    def _activate_glyphs(self) -> None:
+        if not self._glyph_counters or self._glyphs_active:
+            return
+        self._glyphs_active = True
+        self.score_text.enabled = False
+        self.time_text.enabled = False
+        self.score_counter.enabled = True
+        self.time_counter.enabled = True
+        self._shown_score = None
+        self._shown_centis = None
+        self._refresh_layout(force=True)
+        self._flush_counters(force=True)
+
+    def _safe_aspect_ratio(self) -> float:
         try:
-            ratio = float(window.aspect_ratio)
+            ratio = float(self.backend.aspect_ratio())
         except Exception:
             ratio = 16.0 / 9.0
         return max(1.2, ratio)
@@ -131,22 +317,82 @@ class HudView:
         self.time_text.scale = 1.35 * scale_factor
         self.fps_text.scale = 1.16 * scale_factor
 
+        if self.score_counter is not None:
+            self.score_counter.root.position = (-x_half + edge_padding, top_y)
+            self.score_counter.root.scale = scale_factor
+        for counter in (self.time_counter, self._time_hours_counter):
+            if counter is not None:
+                counter.root.position = (-counter.width * scale_factor * 0.5, top_y)
+                counter.root.scale = scale_factor
+
     def set_score(self, score: int) -> None:
-        self.score_text.text = f"Score: {score}"
+        self._pending_score = score
+        self._flush_counters()
 
     def set_elapsed_time(self, elapsed_seconds: float) -> None:
-        clamped = max(0.0, elapsed_seconds)
-        hours = int(clamped // 3600)
-        minutes = int((clamped % 3600) // 60)
-        seconds = clamped % 60.0
+        self._pending_centis = int(max(0.0, elapsed_seconds) * 100.0)
+        self._flush_counters()
+
+    def _flush_counters(self, force: bool = False) -> None:
+        # Counters refresh at most once per interval, and only rebuild what
+        # actually changed since the last refresh.
+        if not force and self._counter_timer < self._counter_interval:
+            return
+        self._counter_timer = 0.0
+        if self._pending_score != self._shown_score:
+            self._shown_score = self._pending_score
+            self.score_display = str(min(self._pending_score, self.SCORE_MAX))
+            if self._glyphs_active:
+                self.score_counter.set_digits(self.score_display.ljust(self.SCORE_DIGITS))
+            else:
+                self.score_text.text = f"Score: {self.score_display}"
+                self.text_writes += 1
+        if self._pending_centis != self._shown_centis:
+            self._shown_centis = self._pending_centis
+            self._show_time(self._pending_centis)
+
+    def _show_time(self, centis: int) -> None:
+        seconds, hundredths = divmod(centis, 100)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
         if hours > 0:
-            self.time_text.text = f"Time: {hours:02d}:{minutes:02d}:{seconds:05.2f}"
+            self.time_display = f"{min(hours, 99):02d}:{minutes:02d}:{seconds:02d}.{hundredths:02d}"
         else:
-            self.time_text.text = f"Time: {minutes:02d}:{seconds:05.2f}"
+            self.time_display = f"{minutes:02d}:{seconds:02d}.{hundredths:02d}"
+        if not self._glyphs_active:
+            self.time_text.text = f"Time: {self.time_display}"
+            self.text_writes += 1
+            return
+        counter = self.time_counter
+        if hours > 0:
+            if self._time_hours_counter is None:
+                # Built on first use: most runs never reach an hour.
+                self._time_hours_counter = self._create_time_counter(self.TIME_TEMPLATE_HOURS)
+                self._time_hours_counter.build()
+                self._refresh_layout(force=True)
+            counter = self._time_hours_counter
+        self.time_counter.enabled = counter is self.time_counter
+        if self._time_hours_counter is not None:
+            self._time_hours_counter.enabled = counter is self._time_hours_counter
+        counter.set_digits(self.time_display.replace(":", "").replace(".", ""))
 
     def set_fps(self, fps: float) -> None:
         fps_int = max(0, int(round(fps)))
-        self.fps_text.text = f"fps:{fps_int}"
+        if fps_int == self._shown_fps:
+            return
+        self._shown_fps = fps_int
+        self._write_fps()
+
+    def set_quality_tier(self, name: str) -> None:
+        if name == self.quality_tier:
+            return
+        self.quality_tier = name
+        self._write_fps()
+
+    def _write_fps(self) -> None:
+        tier = f" {self.quality_tier}" if self.quality_tier else ""
+        self.fps_text.text = f"fps:{self._shown_fps or 0}{tier}"
+        self.text_writes += 1
 
     def show_pickup_bonus(self, text: str, duration: float = 0.75) -> None:
         self.bonus_text.text = text
@@ -181,32 +427,36 @@ class HudView:
 
     def _apply_resume_style(self) -> None:
         if self._resume_style == "minimal":
-            self.resume_panel.color = color.rgba(12, 28, 44, 0)
+            self.resume_panel.color = self.backend.rgba(12, 28, 44, 0)
             self.resume_panel.scale = (0.0, 0.0)
             self.resume_title_text.text = "Resuming"
             self.resume_title_text.position = (0, self._minimal_value_y + 0.032)
             self.resume_title_text.scale = 1.05
-            self.resume_title_text.color = color.rgb(120, 235, 255)
+            self.resume_title_text.color = self.backend.rgb(120, 235, 255)
             self.resume_value_text.position = (0, self._minimal_value_y)
             self.resume_value_text.scale = self._minimal_value_scale
-            self.resume_value_text.color = color.rgb(255, 236, 140)
+            self.resume_value_text.color = self.backend.rgb(255, 236, 140)
             self.resume_accent_line.position = (0, self._minimal_value_y - 0.026)
             self.resume_accent_line.scale = (0.18, 0.004)
-            self.resume_accent_line.color = color.rgba(120, 240, 255, 140)
+            self.resume_accent_line.color = self.backend.rgba(120, 240, 255, 140)
             return
 
-        self.resume_panel.color = color.rgba(12, 28, 44, 170)
+        self.resume_panel.color = self.backend.rgba(12, 28, 44, 170)
         self.resume_panel.scale = self._resume_panel_base_scale
         self.resume_title_text.text = "Resume In"
         self.resume_title_text.position = (0, 0.335)
         self.resume_title_text.scale = 1.2
-        self.resume_title_text.color = color.rgb(115, 220, 255)
+        self.resume_title_text.color = self.backend.rgb(115, 220, 255)
         self.resume_value_text.position = (0, 0.283)
         self.resume_value_text.scale = 2.1
-        self.resume_value_text.color = color.rgb(255, 236, 140)
+        self.resume_value_text.color = self.backend.rgb(255, 236, 140)
 
     def update(self, dt: float) -> None:
-        self._refresh_layout()
+        self._counter_timer += dt
+        self._layout_timer += dt
+        if self._layout_timer >= self._layout_poll_interval:
+            self._layout_timer = 0.0
+            self._refresh_layout()
 
         if self._current_state == GameState.PLAYING:
             clamped_dt = max(0.0, min(dt, 0.25))
@@ -245,13 +495,14 @@ class HudView:
 
         alpha = int(255 * (1.0 - progress))
         alpha = max(0, min(255, alpha))
-        self.bonus_text.color = color.rgba(255, 242, 168, alpha)
+        self.bonus_text.color = self.backend.rgba(255, 242, 168, alpha)
 
         if self._bonus_timer <= 0.0:
             self.bonus_text.text = ""
 
     def set_state(self, state: GameState) -> None:
         self._current_state = state
+        self._flush_counters(force=True)
         if state != GameState.RESUMING:
             self.hide_resume_countdown()
 
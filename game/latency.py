@@ -0,0 +1,104 @@
+import time
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+# Histogram bin edges (ms); the last bin is open-ended.
+LATENCY_BINS_MS: tuple[float, ...] = (0.0, 4.0, 8.0, 12.0, 17.0, 25.0, 33.0, 50.0, 67.0, 100.0, 150.0, 250.0)
+
+
+class LatencySummary(NamedTuple):
+    count: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    # Counts per LATENCY_BINS_MS bin.
+    histogram: tuple[int, ...]
+
+
+class _Switch(NamedTuple):
+    pressed: float
+    from_x: float
+    to_x: float
+
+
+class _Samples:
+    def __init__(self, capacity: int) -> None:
+        self.values = np.zeros(max(1, capacity), dtype=np.float64)
+        self.count = 0
+
+    def add(self, value_ms: float) -> None:
+        self.values[self.count % self.values.size] = value_ms
+        self.count += 1
+
+    def summary(self) -> LatencySummary:
+        data = self.values[: min(self.count, self.values.size)]
+        if data.size == 0:
+            return LatencySummary(0, 0.0, 0.0, 0.0, (0,) * len(LATENCY_BINS_MS))
+        p50, p95 = np.percentile(data, (50.0, 95.0))
+        counts, _ = np.histogram(data, bins=LATENCY_BINS_MS + (np.inf,))
+        return LatencySummary(int(data.size), float(p50), float(p95), float(data.max()), tuple(counts.tolist()))
+
+
+class LatencyTracker:
+    """Key-event-to-effect latency of lane switches.
+
+    `press` stamps a switch when the key event arrives. The first `tick`
+    after it records the simulation latency; the first `presented` call
+    whose drawn player x is `presented_fraction` of the way to the new lane
+    records the presented latency (up to the frame being handed to the
+    renderer; the display's own wait for refresh is not visible here). A
+    new press before that replaces the pending one.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        presented_fraction: float = 0.5,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.presented_fraction = min(1.0, max(0.0, presented_fraction))
+        self._clock = clock
+        self.sim = _Samples(capacity)
+        self.shown = _Samples(capacity)
+        self.superseded = 0
+        self._pending: Optional[_Switch] = None
+        # Press time of a switch no tick has run for yet.
+        self._unticked: Optional[float] = None
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def press(self, from_x: float, to_x: float) -> None:
+        if self._pending is not None:
+            self.superseded += 1
+        now = self._clock()
+        self._pending = _Switch(now, from_x, to_x)
+        self._unticked = now
+
+    def tick(self) -> None:
+        if self._unticked is not None:
+            self.sim.add((self._clock() - self._unticked) * 1000.0)
+            self._unticked = None
+
+    def presented(self, drawn_x: float) -> None:
+        switch = self._pending
+        if switch is None:
+            return
+        distance = switch.to_x - switch.from_x
+        if distance and (drawn_x - switch.from_x) / distance < self.presented_fraction:
+            return
+        self.shown.add((self._clock() - switch.pressed) * 1000.0)
+        self._pending = None
+
+    def reset(self) -> None:
+        self._pending = None
+        self._unticked = None
+
+    def format(self) -> str:
+        sim, shown = self.sim.summary(), self.shown.summary()
+        return (
+            f"input: sim p50 {sim.p50_ms:.1f} / p95 {sim.p95_ms:.1f} ms, "
+            f"shown p50 {shown.p50_ms:.1f} / p95 {shown.p95_ms:.1f} ms ({shown.count} switches)"
+        )
@@ -0,0 +1,120 @@
+import time
+from typing import Callable, Iterator, NamedTuple, Optional
+
+from game.pool import ObjectPool
+
+
+class PhaseCost(NamedTuple):
+    name: str
+    seconds: float
+    steps: int
+
+
+class StartupReport(NamedTuple):
+    # Launch (process start or caller-supplied mark) to scheduler creation.
+    launch_seconds: float
+    first_frame_seconds: Optional[float]
+    warm_seconds: Optional[float]
+    warm_frames: int
+    phases: list[PhaseCost]
+
+    def format(self) -> str:
+        def ms(value: Optional[float]) -> str:
+            return "n/a" if value is None else f"{value * 1000.0:.1f}ms"
+
+        phases = " ".join(f"{phase.name}={ms(phase.seconds)}/{phase.steps}" for phase in self.phases)
+        return (
+            f"[Startup] launch={ms(self.launch_seconds)} first_frame={ms(self.first_frame_seconds)} "
+            f"warm={ms(self.warm_seconds)} warm_frames={self.warm_frames} phases: {phases}"
+        )
+
+
+class LoadingScheduler:
+    """Runs deferred startup work a slice at a time within a per-frame budget.
+
+    A phase is a generator that yields between units of work. `run` steps
+    phases in order until the budget is used up (always at least one unit, so
+    loading progresses even with a zero budget); `finish` drains everything.
+    All times are measured from `launch_time` (defaults to construction).
+    """
+
+    def __init__(self, launch_time: Optional[float] = None, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.started_at = clock()
+        self.launch_time = self.started_at if launch_time is None else launch_time
+        self._phases: list[tuple[str, Iterator[None]]] = []
+        self._costs: dict[str, list[float]] = {}
+        self.first_frame_at: Optional[float] = None
+        self.warm_at: Optional[float] = None
+        self.warm_frames = 0
+
+    @property
+    def done(self) -> bool:
+        return not self._phases
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        cost = self._costs.setdefault(name, [0.0, 0])
+        cost[0] += seconds
+        cost[1] += 1
+
+    def add_phase(self, name: str, work: Iterator[None]) -> None:
+        self._costs.setdefault(name, [0.0, 0])
+        self._phases.append((name, work))
+        self.warm_at = None
+
+    def _step(self) -> None:
+        name, work = self._phases[0]
+        started = self._clock()
+        try:
+            next(work)
+        except StopIteration:
+            self._phases.pop(0)
+        self.record_phase(name, self._clock() - started)
+
+    def _mark_done(self) -> None:
+        if self.done and self.warm_at is None:
+            self.warm_at = self._clock()
+
+    def run(self, budget_ms: float) -> bool:
+        """Advance loading for one frame; returns True once everything is done."""
+        now = self._clock()
+        if self.first_frame_at is None:
+            self.first_frame_at = now
+        if self.done:
+            self._mark_done()
+            return True
+        self.warm_frames += 1
+        deadline = now + max(0.0, budget_ms) / 1000.0
+        while self._phases:
+            self._step()
+            if self._clock() >= deadline:
+                break
+        self._mark_done()
+        return self.done
+
+    def finish(self) -> None:
+        while self._phases:
+            self._step()
+        self._mark_done()
+
+    def report(self) -> StartupReport:
+        def since_launch(mark: Optional[float]) -> Optional[float]:
+            return None if mark is None else mark - self.launch_time
+
+        return StartupReport(
+            launch_seconds=self.started_at - self.launch_time,
+            first_frame_seconds=since_launch(self.first_frame_at),
+            warm_seconds=since_launch(self.warm_at),
+            warm_frames=self.warm_frames,
+            phases=[PhaseCost(name, cost[0], int(cost[1])) for name, cost in self._costs.items()],
+        )
+
+
+def prewarm_steps(pool: ObjectPool, target: int) -> Iterator[None]:
+    """Prewarm `pool` up to `target` items, one item per step."""
+    target = min(target, pool.max_size)
+    while pool.created < target:
+        pool.prewarm(pool.created + 1)
+        # No trailing yield: the last item finishes the phase in the same step.
+        if pool.created < target:
+            yield
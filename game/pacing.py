@@ -0,0 +1,99 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from config import PacingConfig
+
+PACING_MODES = ("vsync", "capped", "uncapped", "half_refresh")
+
+
+class PacingPlan(NamedTuple):
+    mode: str
+    # Panda3D `sync-video`.
+    sync_video: bool
+    # Frame limit for the clock (`clock-mode limited`); 0 => unlimited.
+    frame_rate: float
+    # Expected interval between presented frames.
+    budget_ms: float
+
+    @property
+    def clock_mode(self) -> str:
+        return "limited" if self.frame_rate > 0.0 else "normal"
+
+    @property
+    def target_fps(self) -> float:
+        return 1000.0 / self.budget_ms
+
+
+def pacing_plan(cfg: PacingConfig) -> PacingPlan:
+    refresh = max(cfg.refresh_rate, 1.0)
+    if cfg.mode == "vsync":
+        return PacingPlan(cfg.mode, True, 0.0, 1000.0 / refresh)
+    if cfg.mode == "capped":
+        cap = max(cfg.fps_cap, 1.0)
+        return PacingPlan(cfg.mode, False, cap, 1000.0 / cap)
+    if cfg.mode == "uncapped":
+        # Nothing to hold, but the display still only shows one frame per
+        # refresh: slower than that is a visible hitch.
+        return PacingPlan(cfg.mode, False, 0.0, 1000.0 / refresh)
+    if cfg.mode == "half_refresh":
+        # Panda3D has no swap interval setting: the clock limit keeps frames
+        # at least two refreshes long and vsync aligns them to the refresh.
+        return PacingPlan(cfg.mode, True, refresh / 2.0, 2000.0 / refresh)
+    raise ValueError(f"unknown pacing mode {cfg.mode!r} (expected one of {', '.join(PACING_MODES)})")
+
+
+class JitterStats(NamedTuple):
+    frames: int
+    mean_ms: float
+    std_ms: float
+    # Share of frames longer than budget * (1 + stall_margin).
+    over_budget: float
+    longest_stall_ms: float
+    budget_ms: float
+
+    def format(self) -> str:
+        return (
+            f"sd {self.std_ms:.2f} ms, over budget {self.over_budget:.1%}, "
+            f"longest {self.longest_stall_ms:.1f} ms (budget {self.budget_ms:.1f} ms, {self.frames} frames)"
+        )
+
+
+class FrameJitter:
+    """Frame intervals in a ring buffer of the last `capacity` frames.
+
+    Measures how evenly frames arrive, not how fast they are: the standard
+    deviation of the interval, the share of frames over the pacing budget
+    (plus `stall_margin`), and the longest single interval.
+    """
+
+    def __init__(self, budget_ms: float, capacity: int = 600, stall_margin: float = 0.25) -> None:
+        self.budget_ms = budget_ms
+        self.stall_ms = budget_ms * (1.0 + max(0.0, stall_margin))
+        self.capacity = max(1, capacity)
+        self.intervals = np.zeros(self.capacity, dtype=np.float64)
+        self.frames = 0
+
+    @property
+    def count(self) -> int:
+        return min(self.frames, self.capacity)
+
+    def observe(self, dt: float) -> None:
+        self.intervals[self.frames % self.capacity] = dt * 1000.0
+        self.frames += 1
+
+    def reset(self) -> None:
+        self.frames = 0
+
+    def stats(self) -> JitterStats:
+        data = self.intervals[: self.count]
+        if data.size == 0:
+            return JitterStats(0, 0.0, 0.0, 0.0, 0.0, self.budget_ms)
+        return JitterStats(
+            frames=int(data.size),
+            mean_ms=float(data.mean()),
+            std_ms=float(data.std()),
+            over_budget=float(np.count_nonzero(data > self.stall_ms)) / data.size,
+            longest_stall_ms=float(data.max()),
+            budget_ms=self.budget_ms,
+        )
@@ -0,0 +1,317 @@
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, NamedTuple, Optional, Union
+
+from config import CollectibleConfig, GameConfig, SpawnerConfig
+
+PATTERN_MODES = ("inline", "idle", "thread")
+
+# Ticks planned per generator call; small enough to fit in a frame budget.
+_CHUNK_TICKS = 15
+
+
+def pattern_mode(config: GameConfig) -> str:
+    """`patterns.mode`, or "inline" when quality tiers move the spawn caps:
+    spawns planned seconds ahead cannot follow a cap that changes later."""
+    if config.quality.adjust_spawn_caps:
+        return "inline"
+    return config.patterns.mode
+
+
+class SpawnEvent(NamedTuple):
+    tick: int
+    obstacle_lanes: tuple[int, ...]
+    # -1 => no collectible this tick.
+    collectible_lane: int
+    phase: float
+
+
+class PatternGenerator:
+    """Plans obstacle and collectible spawns tick by tick, ahead of the game.
+
+    It replays the spawn timers, interval draws, two-obstacle roll and lane
+    sampling of `ObstacleSpawner` / `CollectibleSystem` against its own
+    timeline, so it never reads live game state. Spacing is checked in track
+    distance: everything spawns at `obstacle_spawn_z` and scrolls at the same
+    speed, so an obstacle and a collectible in one lane are at least
+    `min_obstacle_distance_z` apart iff their spawn distances are. That keeps
+    the no-full-block and obstacle/collectible spacing guarantees without
+    scanning the live stores.
+
+    The same distances tell which of its spawns are still on the track, so
+    it plans no more than the obstacle pool and `max_active` will take: a
+    planned spawn is never dropped by `place`. Collectibles the player picks
+    up still count until they would have scrolled out, so near the cap it
+    can plan fewer than inline spawning would.
+    """
+
+    def __init__(self, config: GameConfig, obstacle_rng: random.Random, collectible_rng: random.Random) -> None:
+        self.config = config
+        self.obstacle_rng = obstacle_rng
+        self.collectible_rng = collectible_rng
+        self.tick_dt = 1.0 / max(config.simulation.tick_rate, 1.0)
+        self.lane_count = len(config.lane.x_positions)
+        # Track distance from spawn to cleanup; the slack keeps rounding from
+        # freeing a slot before the game does.
+        self.live_distance = config.world.obstacle_spawn_z - config.world.obstacle_cleanup_z + 1e-6
+        self.reset()
+
+    def reset(self) -> None:
+        self.tick = 0
+        self.elapsed_time = 0.0
+        self.distance = 0.0
+        self.obstacle_timer = 0.0
+        self.collectible_timer = 0.0
+        self.obstacle_interval = self._pick_interval(self.config.spawner, self.obstacle_rng, 0.0)
+        self.collectible_interval = self._pick_interval(self.config.collectible, self.collectible_rng, 0.0)
+        # (spawn distance, lane) of recent spawns still close enough to matter.
+        self._recent_obstacles: deque[tuple[float, int]] = deque()
+        self._recent_collectibles: deque[tuple[float, int]] = deque()
+        # Spawn distances of planned spawns not yet scrolled out.
+        self._live_obstacles: deque[float] = deque()
+        self._live_collectibles: deque[float] = deque()
+
+    @staticmethod
+    def _lerp(a: float, b: float, t: float) -> float:
+        return a + (b - a) * t
+
+    def _pick_interval(
+        self,
+        cfg: Union[SpawnerConfig, CollectibleConfig],
+        rng: random.Random,
+        difficulty_t: float,
+    ) -> float:
+        min_interval = self._lerp(cfg.start_min_spawn_interval, cfg.end_min_spawn_interval, difficulty_t)
+        max_interval = self._lerp(cfg.start_max_spawn_interval, cfg.end_max_spawn_interval, difficulty_t)
+        return rng.uniform(min_interval, max_interval)
+
+    @staticmethod
+    def _lanes_near(recent: deque, distance: float, min_distance: float) -> set[int]:
+        return {lane for spawned, lane in recent if abs(distance - spawned) < min_distance}
+
+    @staticmethod
+    def _prune(recent: deque, distance: float, min_distance: float) -> None:
+        while recent and distance - recent[0][0] >= min_distance:
+            recent.popleft()
+
+    def _live(self, live: deque, distance: float) -> int:
+        while live and distance - live[0] >= self.live_distance:
+            live.popleft()
+        return len(live)
+
+    def _plan_obstacles(self, difficulty_t: float, spawn_distance: float) -> tuple[int, ...]:
+        cfg = self.config.spawner
+        blocked = self._lanes_near(
+            self._recent_collectibles,
+            spawn_distance,
+            self.config.collectible.min_obstacle_distance_z,
+        )
+        lanes = [lane for lane in range(self.lane_count) if lane not in blocked]
+        if not lanes:
+            return ()
+        two_obstacle_chance = self._lerp(cfg.start_two_obstacle_chance, cfg.end_two_obstacle_chance, difficulty_t)
+        lane_count = 1
+        if self.obstacle_rng.random() < two_obstacle_chance:
+            lane_count = 2
+        lane_count = min(lane_count, len(lanes))
+        picked = tuple(self.obstacle_rng.sample(lanes, k=lane_count))
+        # `place` drops what the pool has no slot for.
+        free = max(1, cfg.pool_max_size) - self._live(self._live_obstacles, spawn_distance)
+        picked = picked[: max(0, free)]
+        for lane in picked:
+            self._recent_obstacles.append((spawn_distance, lane))
+            self._live_obstacles.append(spawn_distance)
+        return picked
+
+    def _plan_collectible(self) -> tuple[int, float]:
+        if self._live(self._live_collectibles, self.distance) >= self.config.collectible.max_active:
+            return -1, 0.0
+        unsafe = self._lanes_near(
+            self._recent_obstacles,
+            self.distance,
+            self.config.collectible.min_obstacle_distance_z,
+        )
+        lanes = list(range(self.lane_count))
+        self.collectible_rng.shuffle(lanes)
+        for lane in lanes:
+            if lane not in unsafe:
+                self._recent_collectibles.append((self.distance, lane))
+                self._live_collectibles.append(self.distance)
+                return lane, self.collectible_rng.uniform(0.0, math.tau)
+        return -1, 0.0
+
+    def _plan_tick(self) -> Optional[SpawnEvent]:
+        dt = self.tick_dt
+        self.tick += 1
+        self.elapsed_time += dt
+        difficulty_t = min(1.0, self.elapsed_time / max(self.config.difficulty.ramp_seconds, 1.0))
+        movement = self.config.movement
+        speed = self._lerp(movement.start_speed, movement.end_speed, difficulty_t)
+        # Obstacles spawn before the tick's scroll, collectibles after it.
+        spawn_distance = self.distance
+        self.distance += speed * dt
+
+        obstacle_lanes: tuple[int, ...] = ()
+        self.obstacle_timer += dt
+        if self.obstacle_timer >= self.obstacle_interval:
+            self.obstacle_timer = 0.0
+            self.obstacle_interval = self._pick_interval(self.config.spawner, self.obstacle_rng, difficulty_t)
+            obstacle_lanes = self._plan_obstacles(difficulty_t, spawn_distance)
+
+        collectible_lane, phase = -1, 0.0
+        self.collectible_timer += dt
+        if self.collectible_timer >= self.collectible_interval:
+            self.collectible_timer = 0.0
+            self.collectible_interval = self._pick_interval(
+                self.config.collectible,
+                self.collectible_rng,
+                difficulty_t,
+            )
+            collectible_lane, phase = self._plan_collectible()
+
+        min_distance = self.config.collectible.min_obstacle_distance_z
+        self._prune(self._recent_obstacles, self.distance, min_distance)
+        self._prune(self._recent_collectibles, self.distance, min_distance)
+        if not obstacle_lanes and collectible_lane < 0:
+            return None
+        return SpawnEvent(self.tick, obstacle_lanes, collectible_lane, phase)
+
+    def plan(self, ticks: int) -> list[SpawnEvent]:
+        events = []
+        for _ in range(ticks):
+            event = self._plan_tick()
+            if event is not None:
+                events.append(event)
+        return events
+
+
+class PatternQueue:
+    """Bounded queue of planned spawns between the generator and the game.
+
+    The generator runs at most `horizon_ticks` ahead of the last tick taken.
+    In "idle" mode `fill` plans in leftover frame time; in "thread" mode a
+    worker thread keeps the queue topped up. If the frame thread reaches a
+    tick that has not been planned yet, it plans it itself ("idle") or waits
+    for the worker ("thread"); `starved_ticks` counts those ticks.
+    """
+
+    def __init__(
+        self,
+        generator: PatternGenerator,
+        horizon_ticks: int,
+        mode: str = "idle",
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if mode not in PATTERN_MODES[1:]:
+            raise ValueError(f"unknown pattern mode {mode!r}")
+        self.generator = generator
+        self.horizon_ticks = max(1, horizon_ticks)
+        self.mode = mode
+        self._clock = clock
+        self._events: deque[SpawnEvent] = deque()
+        self._planned_tick = 0
+        self._taken_tick = 0
+        self.starved_ticks = 0
+        self.max_depth = 0
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._stop = False
+
+    @property
+    def planned_ticks(self) -> int:
+        """Ticks planned beyond the last one taken."""
+        return self._planned_tick - self._taken_tick
+
+    def _push(self, events: list[SpawnEvent], planned_tick: int) -> None:
+        with self._cond:
+            self._events.extend(events)
+            self._planned_tick = planned_tick
+            self.max_depth = max(self.max_depth, len(self._events))
+            self._cond.notify_all()
+
+    def _plan_chunk(self) -> None:
+        ticks = min(_CHUNK_TICKS, self._taken_tick + self.horizon_ticks - self._planned_tick)
+        if ticks > 0:
+            events = self.generator.plan(ticks)
+            self._push(events, self.generator.tick)
+
+    def fill(self, budget_ms: float) -> None:
+        """Plan ahead within `budget_ms` (idle mode; no-op with a worker)."""
+        if self.mode != "idle":
+            return
+        deadline = self._clock() + max(0.0, budget_ms) / 1000.0
+        while self.planned_ticks < self.horizon_ticks:
+            self._plan_chunk()
+            if self._clock() >= deadline:
+                break
+
+    def take(self, tick: int) -> Optional[SpawnEvent]:
+        """Planned spawns for `tick`; ticks must be taken in order."""
+        with self._cond:
+            self._taken_tick = tick
+            if self._planned_tick < tick:
+                self.starved_ticks += tick - self._planned_tick
+                if self._worker is not None:
+                    self._cond.notify_all()
+                    while self._planned_tick < tick:
+                        self._cond.wait()
+            elif self._worker is not None and self.planned_ticks < self.horizon_ticks:
+                self._cond.notify_all()
+        while self._planned_tick < tick:
+            self._plan_chunk()
+        with self._cond:
+            events = self._events
+            while events and events[0].tick < tick:
+                events.popleft()
+            if events and events[0].tick == tick:
+                return events.popleft()
+        return None
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stop and self.planned_ticks >= self.horizon_ticks:
+                    self._cond.wait()
+                if self._stop:
+                    return
+            self._plan_chunk()
+
+    def stop(self) -> None:
+        """Stop the worker; the generator and its RNGs are idle afterwards."""
+        worker = self._worker
+        if worker is None:
+            return
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        worker.join()
+        self._worker = None
+
+    def _start_worker(self) -> None:
+        self._stop = False
+        self._worker = threading.Thread(target=self._run_worker, name="pattern-generator", daemon=True)
+        self._worker.start()
+
+    def set_config(self, config: GameConfig) -> None:
+        """Plan from the next unplanned tick on with `config`.
+
+        Spawns already planned keep the old tuning. The worker is stopped for
+        the swap, so no chunk mixes the two.
+        """
+        running = self._worker is not None
+        self.stop()
+        self.generator.config = config
+        if running:
+            self._start_worker()
+
+    def reset(self) -> None:
+        self.stop()
+        self.generator.reset()
+        self._events.clear()
+        self._planned_tick = 0
+        self._taken_tick = 0
+        if self.mode == "thread":
+            self._start_worker()
@@ -1,33 +1,48 @@
-from ursina import Entity, color, lerp
+from typing import Optional
 
 from config import LaneConfig, PlayerConfig
+from game.render import RenderBackend, get_backend
 
 
 class PlayerController:
-    def __init__(self, lane_cfg: LaneConfig, player_cfg: PlayerConfig) -> None:
+    def __init__(
+        self,
+        lane_cfg: LaneConfig,
+        player_cfg: PlayerConfig,
+        backend: Optional[RenderBackend] = None,
+    ) -> None:
+        self.backend = backend or get_backend()
         self.lane_cfg = lane_cfg
         self.player_cfg = player_cfg
         self.lane_index = 1
         self.target_x = self.lane_cfg.x_positions[self.lane_index]
-        self.entity = Entity(
+        self._x = self.target_x
+        self._prev_x = self.target_x
+        self.entity = self.backend.entity(
             model="cube",
-            color=color.cyan,
+            color=self.backend.named_color("cyan"),
             position=(self.target_x, self.player_cfg.y, self.player_cfg.z),
             scale=(1.0, 1.0, 2.0),
             collider="box",
         )
 
+    @staticmethod
+    def _lerp(a: float, b: float, t: float) -> float:
+        return a + (b - a) * t
+
     @property
     def x(self) -> float:
-        return self.entity.x
+        return self._x
 
     @property
     def z(self) -> float:
-        return self.entity.z
+        return self.player_cfg.z
 
     def reset(self) -> None:
         self.lane_index = 1
         self.target_x = self.lane_cfg.x_positions[self.lane_index]
+        self._x = self.target_x
+        self._prev_x = self.target_x
         self.entity.x = self.target_x
 
     def move_left(self) -> None:
@@ -42,4 +57,15 @@ class PlayerController:
 
     def update(self, dt: float) -> None:
         t = min(1.0, self.lane_cfg.switch_lerp_speed * dt)
-        self.entity.x = lerp(self.entity.x, self.target_x, t)
+        self._prev_x = self._x
+        self._x = self._lerp(self._x, self.target_x, t)
+
+    def render(self, alpha: float, view_offset: float = 0.0, lead_dt: float = 0.0) -> None:
+        if lead_dt > 0.0:
+            # Draw ahead: between this tick and the next one's position,
+            # which only depends on target_x, so a switch shows at once.
+            t = min(1.0, self.lane_cfg.switch_lerp_speed * lead_dt)
+            self.entity.x = self._lerp(self._x, self._lerp(self._x, self.target_x, t), alpha)
+        else:
+            self.entity.x = self._lerp(self._prev_x, self._x, alpha)
+        self.entity.z = self.player_cfg.z - view_offset
@@ -0,0 +1,174 @@
+import json
+import math
+import os
+import platform
+from typing import Callable, Generic, Iterable, NamedTuple, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PoolStats(NamedTuple):
+    name: str
+    created: int
+    active: int
+    idle: int
+    max_size: int
+    hits: int
+    misses: int
+    cap_hits: int
+    high_water: int
+
+
+class ObjectPool(Generic[T]):
+    """Bounded free-list pool with usage counters.
+
+    `acquire` is a hit when an idle item is reused, a miss when a new item has
+    to be created, and a cap hit when the pool is full and returns None.
+    `high_water` is the most items ever active at once.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T], max_size: int, initial_size: int = 0) -> None:
+        self.name = name
+        self.max_size = max(1, max_size)
+        self._factory = factory
+        self._idle: list[T] = []
+        self.created = 0
+        self.active = 0
+        self.hits = 0
+        self.misses = 0
+        self.cap_hits = 0
+        self.high_water = 0
+        self.prewarm(initial_size)
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def _create(self) -> T:
+        # `created` is bumped after the factory returns, so a factory can use
+        # it as the index of the item it is building.
+        item = self._factory()
+        self.created += 1
+        return item
+
+    def prewarm(self, count: int) -> int:
+        target = max(0, min(count, self.max_size))
+        added = 0
+        while self.created < target:
+            self._idle.append(self._create())
+            added += 1
+        return added
+
+    def acquire(self) -> Optional[T]:
+        if self._idle:
+            item = self._idle.pop()
+            self.hits += 1
+        elif self.created < self.max_size:
+            item = self._create()
+            self.misses += 1
+        else:
+            self.cap_hits += 1
+            return None
+        self.active += 1
+        self.high_water = max(self.high_water, self.active)
+        return item
+
+    def release(self, item: T) -> None:
+        self.active -= 1
+        self._idle.append(item)
+
+    def discard(self, item: T) -> bool:
+        """Drop an idle item for good (the caller destroys it)."""
+        try:
+            self._idle.remove(item)
+        except ValueError:
+            return False
+        self.created -= 1
+        return True
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            name=self.name,
+            created=self.created,
+            active=self.active,
+            idle=len(self._idle),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+            cap_hits=self.cap_hits,
+            high_water=self.high_water,
+        )
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.cap_hits = 0
+        self.high_water = self.active
+
+
+def default_pool_size_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".neon_dash", "pool_sizes.json")
+
+
+def machine_id() -> str:
+    return f"{platform.node() or 'unknown'}-{platform.machine() or 'unknown'}"
+
+
+class PoolSizeCache:
+    """Learned pool sizes, persisted per machine and config profile.
+
+    Stores the highest high-water mark and cap-hit count seen in any session
+    for each pool; `prewarm_size` turns that into a prewarm count with some
+    headroom.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, profile: str, machine: Optional[str] = None) -> None:
+        self.path = path
+        self.key = f"{machine or machine_id()}/{profile}"
+        self._data: dict = {"version": self.VERSION, "entries": {}}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION and isinstance(data.get("entries"), dict):
+            self._data = data
+
+    def save(self) -> bool:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(self._data, handle, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return False
+        return True
+
+    def _entries(self) -> dict:
+        return self._data["entries"].setdefault(self.key, {})
+
+    def high_water(self, name: str) -> Optional[int]:
+        entry = self._data["entries"].get(self.key, {}).get(name)
+        if not entry:
+            return None
+        return int(entry.get("high_water", 0))
+
+    def prewarm_size(self, name: str, headroom: float, max_size: int) -> Optional[int]:
+        high_water = self.high_water(name)
+        if high_water is None:
+            return None
+        return max(1, min(max_size, math.ceil(high_water * (1.0 + max(0.0, headroom)))))
+
+    def record(self, stats: Iterable[PoolStats]) -> None:
+        entries = self._entries()
+        for pool in stats:
+            entry = entries.setdefault(pool.name, {"high_water": 0, "cap_hits": 0, "max_size": pool.max_size})
+            entry["high_water"] = max(int(entry.get("high_water", 0)), pool.high_water)
+            entry["cap_hits"] = max(int(entry.get("cap_hits", 0)), pool.cap_hits)
+            entry["max_size"] = pool.max_size
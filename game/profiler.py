@@ -0,0 +1,211 @@
+import csv
+import json
+import os
+import time
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from game.render import RenderBackend
+
+PHASES: tuple[str, ...] = (
+    "hud",
+    "player",
+    "world",
+    "spawner",
+    "collectibles",
+    "pickup",
+    "collision",
+    "render",
+)
+(
+    PHASE_HUD,
+    PHASE_PLAYER,
+    PHASE_WORLD,
+    PHASE_SPAWNER,
+    PHASE_COLLECTIBLES,
+    PHASE_PICKUP,
+    PHASE_COLLISION,
+    PHASE_RENDER,
+) = range(len(PHASES))
+
+
+class PhaseSummary(NamedTuple):
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    mean: float
+
+
+class FrameProfiler:
+    """Per-phase frame timings in a ring buffer of the last `capacity` frames.
+
+    Call `begin_frame`, then `lap(phase)` after each timed section (the time
+    since the previous lap or `mark` is added to that phase; a phase can be
+    lapped several times per frame, e.g. once per fixed tick), then
+    `end_frame`. Values are stored in milliseconds; the last column is the
+    whole frame.
+    """
+
+    def __init__(
+        self,
+        phases: Sequence[str] = PHASES,
+        capacity: int = 600,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.phases = tuple(phases)
+        self.columns = self.phases + ("frame",)
+        self.capacity = max(1, capacity)
+        self.enabled = enabled
+        self._clock = clock
+        self.samples = np.zeros((self.capacity, len(self.columns)), dtype=np.float64)
+        self.frames = 0
+        self._current = [0.0] * len(self.phases)
+        self._frame_start = 0.0
+        self._last = 0.0
+
+    @property
+    def count(self) -> int:
+        return min(self.frames, self.capacity)
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        now = self._clock()
+        self._frame_start = now
+        self._last = now
+        current = self._current
+        for index in range(len(current)):
+            current[index] = 0.0
+
+    def mark(self) -> None:
+        if self.enabled:
+            self._last = self._clock()
+
+    def lap(self, phase: int) -> None:
+        if not self.enabled:
+            return
+        now = self._clock()
+        self._current[phase] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        row = self.samples[self.frames % self.capacity]
+        row[:-1] = self._current
+        row[-1] = self._clock() - self._frame_start
+        row *= 1000.0
+        self.frames += 1
+
+    def reset(self) -> None:
+        self.samples[:] = 0.0
+        self.frames = 0
+
+    def recent(self) -> np.ndarray:
+        """Recorded frames, oldest first."""
+        count = self.count
+        if self.frames <= self.capacity:
+            return self.samples[:count]
+        start = self.frames % self.capacity
+        return np.concatenate((self.samples[start:], self.samples[:start]))
+
+    def summary(self) -> dict[str, PhaseSummary]:
+        data = self.samples[: self.count]
+        if data.shape[0] == 0:
+            return {name: PhaseSummary(0.0, 0.0, 0.0, 0.0, 0.0) for name in self.columns}
+        p50, p95, p99 = np.percentile(data, (50.0, 95.0, 99.0), axis=0)
+        peak = data.max(axis=0)
+        mean = data.mean(axis=0)
+        return {
+            name: PhaseSummary(float(p50[i]), float(p95[i]), float(p99[i]), float(peak[i]), float(mean[i]))
+            for i, name in enumerate(self.columns)
+        }
+
+    def format_summary(self) -> str:
+        lines = [f"{'phase':<13}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>7}  ms, {self.count} frames"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<13}{stats.p50:>7.2f}{stats.p95:>7.2f}{stats.p99:>7.2f}{stats.max:>7.2f}")
+        return "\n".join(lines)
+
+    def dump_json(self, path: str, meta: Optional[dict[str, Any]] = None) -> str:
+        payload = {
+            "meta": meta or {},
+            "frames": self.count,
+            "columns": list(self.columns),
+            "summary_ms": {name: stats._asdict() for name, stats in self.summary().items()},
+            "samples_ms": self.recent().round(4).tolist(),
+        }
+        _ensure_parent(path)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+        return path
+
+    def dump_csv(self, path: str) -> str:
+        _ensure_parent(path)
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(("frame",) + tuple(f"{name}_ms" for name in self.columns))
+            first = self.frames - self.count
+            for offset, row in enumerate(self.recent().tolist()):
+                writer.writerow([first + offset] + [f"{value:.4f}" for value in row])
+        return path
+
+    def dump(self, directory: str, stem: str, meta: Optional[dict[str, Any]] = None) -> tuple[str, str]:
+        base = os.path.join(directory, stem)
+        return self.dump_json(f"{base}.json", meta), self.dump_csv(f"{base}.csv")
+
+
+def _ensure_parent(path: str) -> None:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+class ProfilerOverlay:
+    """Monospace text panel with the profiler summary, refreshed at an interval."""
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        backend: RenderBackend,
+        refresh_interval: float = 0.5,
+        status: Optional[Callable[[], str]] = None,
+    ) -> None:
+        self.profiler = profiler
+        # Extra line under the table (e.g. the current quality tier).
+        self.status = status
+        self.refresh_interval = max(0.05, refresh_interval)
+        self._since_refresh = 0.0
+        self.text = backend.text(
+            text="",
+            origin=(-0.5, 0.5),
+            position=(-0.86, 0.4),
+            color=backend.rgba(180, 255, 200, 230),
+            scale=0.75,
+            font="VeraMono.ttf",
+            enabled=False,
+        )
+
+    @property
+    def visible(self) -> bool:
+        return bool(self.text.enabled)
+
+    def toggle(self) -> bool:
+        self.text.enabled = not self.text.enabled
+        self._since_refresh = self.refresh_interval
+        return self.visible
+
+    def update(self, dt: float) -> None:
+        if not self.text.enabled:
+            return
+        self._since_refresh += dt
+        if self._since_refresh < self.refresh_interval:
+            return
+        self._since_refresh = 0.0
+        text = self.profiler.format_summary()
+        if self.status is not None:
+            text = f"{text}\n{self.status()}"
+        self.text.text = text
@@ -0,0 +1,223 @@
+import json
+import os
+from dataclasses import asdict, fields, is_dataclass, replace
+from typing import Any, Optional
+
+from config import GameConfig
+from game.collectibles import COLLECTIBLE_RENDER_MODES
+from game.hud import RESUME_COUNTDOWN_STYLES
+from game.pacing import PACING_MODES
+from game.patterns import PATTERN_MODES
+from game.quality import QUALITY_TIERS
+from game.world import WORLD_RENDER_MODES
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ImportError:
+        tomllib = None  # type: ignore[assignment]
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "presets")
+PROFILE_ENV = "NEON_DASH_PROFILE"
+PROFILE_DIR_ENV = "NEON_DASH_PROFILE_DIR"
+PROFILE_EXTENSIONS = (".json", ".toml")
+
+# Changes here only take effect on the next launch: they size or build scene
+# geometry, the tick clock or subsystems that are wired up once.
+RESTART_SECTIONS = (
+    "lane",
+    "player",
+    "world",
+    "simulation",
+    "patterns",
+    "pools",
+    "startup",
+    "assets",
+    "profiler",
+    "replay",
+    "hud",
+    "pacing",
+)
+RESTART_FIELDS = (
+    ("spawner", "instanced_rendering"),
+    ("collectible", "render_mode"),
+    ("input", "latency_samples"),
+)
+# String fields that only take one of a fixed set of names.
+CHOICE_FIELDS: dict[tuple[str, str], tuple[str, ...]] = {
+    ("world", "render_mode"): WORLD_RENDER_MODES,
+    ("collectible", "render_mode"): COLLECTIBLE_RENDER_MODES,
+    ("patterns", "mode"): PATTERN_MODES,
+    ("hud", "resume_countdown_style"): RESUME_COUNTDOWN_STYLES,
+    ("quality", "start_tier"): tuple(tier.name for tier in QUALITY_TIERS),
+    ("quality", "max_tier"): tuple(tier.name for tier in QUALITY_TIERS),
+    ("pacing", "mode"): PACING_MODES,
+}
+
+
+class ProfileError(ValueError):
+    pass
+
+
+def _coerce(value: Any, current: Any, path: str) -> Any:
+    if isinstance(current, bool):
+        if not isinstance(value, bool):
+            raise ProfileError(f"{path}: expected true/false, got {value!r}")
+        return value
+    if isinstance(current, tuple):
+        if not isinstance(value, (list, tuple)) or len(value) != len(current):
+            raise ProfileError(f"{path}: expected a list of {len(current)} values")
+        return tuple(_coerce(item, old, path) for item, old in zip(value, current))
+    if isinstance(current, (int, float)) and not isinstance(value, bool) and isinstance(value, (int, float)):
+        if isinstance(current, int) and value != int(value):
+            raise ProfileError(f"{path}: expected an integer, got {value!r}")
+        return type(current)(value)
+    if isinstance(current, str) and isinstance(value, str):
+        return value
+    if current is None or value is None:
+        return value
+    raise ProfileError(f"{path}: unexpected value {value!r}")
+
+
+def config_from_dict(data: dict[str, Any], base: Optional[GameConfig] = None) -> GameConfig:
+    """Apply `{"profile": ..., "<section>": {"<field>": value}}` to `base`."""
+    config = base or GameConfig()
+    for key, value in data.items():
+        if key == "base":
+            continue
+        if key == "profile":
+            if not isinstance(value, str) or not value:
+                raise ProfileError("profile: expected a name")
+            config = replace(config, profile=value)
+            continue
+        section = getattr(config, key, None)
+        if not is_dataclass(section) or not isinstance(value, dict):
+            raise ProfileError(f"unknown section {key!r}")
+        names = {field.name for field in fields(section)}
+        updates = {}
+        for name, field_value in value.items():
+            if name not in names:
+                raise ProfileError(f"unknown field {key}.{name}")
+            updates[name] = _coerce(field_value, getattr(section, name), f"{key}.{name}")
+            choices = CHOICE_FIELDS.get((key, name))
+            if choices is not None and updates[name] not in choices:
+                raise ProfileError(f"{key}.{name}: {updates[name]!r} is not one of {', '.join(choices)}")
+        config = replace(config, **{key: replace(section, **updates)})
+    return config
+
+
+def config_to_dict(config: GameConfig, base: Optional[GameConfig] = None) -> dict[str, Any]:
+    """Fields of `config` that differ from `base` (all of them if None)."""
+    current = asdict(config)
+    reference = asdict(base) if base is not None else {}
+    data: dict[str, Any] = {"profile": config.profile}
+    for key, section in current.items():
+        if key == "profile":
+            continue
+        changed = {
+            name: list(value) if isinstance(value, tuple) else value
+            for name, value in section.items()
+            if base is None or reference[key][name] != value
+        }
+        if changed:
+            data[key] = changed
+    return data
+
+
+def read_profile_file(path: str) -> dict[str, Any]:
+    try:
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise ProfileError(f"{path}: TOML profiles need Python 3.11+ or the tomli package")
+            with open(path, "rb") as handle:
+                data = tomllib.load(handle)
+        else:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+    except OSError as exc:
+        raise ProfileError(f"{path}: {exc}") from exc
+    except ValueError as exc:
+        if isinstance(exc, ProfileError):
+            raise
+        raise ProfileError(f"{path}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ProfileError(f"{path}: expected a table of sections")
+    return data
+
+
+class ProfileRegistry:
+    """Named configs from `*.json` / `*.toml` files in one directory.
+
+    A file holds only the fields that differ from its base: `GameConfig()`,
+    or the profile named by a top-level `base` key. `load` also accepts a
+    path to a file outside the directory.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.directory = directory or os.environ.get(PROFILE_DIR_ENV) or PROFILE_DIR
+        self.paths: dict[str, str] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        self.paths = {}
+        try:
+            entries = sorted(os.listdir(self.directory))
+        except OSError:
+            return
+        for entry in entries:
+            stem, extension = os.path.splitext(entry)
+            if extension in PROFILE_EXTENSIONS and stem not in self.paths:
+                self.paths[stem] = os.path.join(self.directory, entry)
+
+    def names(self) -> list[str]:
+        return list(self.paths)
+
+    def path(self, name: str) -> str:
+        if name in self.paths:
+            return self.paths[name]
+        if os.path.splitext(name)[1] in PROFILE_EXTENSIONS and os.path.isfile(name):
+            return name
+        raise ProfileError(f"unknown profile {name!r} (known: {', '.join(self.names()) or 'none'})")
+
+    def load(self, name: str, _seen: tuple[str, ...] = ()) -> GameConfig:
+        path = self.path(name)
+        if path in _seen:
+            raise ProfileError(f"profile base cycle: {' -> '.join(_seen + (path,))}")
+        data = read_profile_file(path)
+        base = None
+        if "base" in data:
+            base = self.load(str(data["base"]), _seen + (path,))
+        data.setdefault("profile", os.path.splitext(os.path.basename(path))[0])
+        return config_from_dict(data, base)
+
+    def next_name(self, current: str) -> Optional[str]:
+        names = self.names()
+        if not names:
+            return None
+        if current not in names:
+            return names[0]
+        return names[(names.index(current) + 1) % len(names)]
+
+
+def live_config(current: GameConfig, requested: GameConfig) -> tuple[GameConfig, list[str]]:
+    """`requested` minus the changes that need a restart, and those fields."""
+    effective = requested
+    pending = []
+    for section_name in RESTART_SECTIONS:
+        old, new = getattr(current, section_name), getattr(requested, section_name)
+        if old != new:
+            pending.extend(
+                f"{section_name}.{field.name}"
+                for field in fields(old)
+                if getattr(old, field.name) != getattr(new, field.name)
+            )
+            effective = replace(effective, **{section_name: old})
+    for section_name, field_name in RESTART_FIELDS:
+        old = getattr(getattr(current, section_name), field_name)
+        section = getattr(effective, section_name)
+        if getattr(section, field_name) != old:
+            pending.append(f"{section_name}.{field_name}")
+            effective = replace(effective, **{section_name: replace(section, **{field_name: old})})
+    return effective, pending
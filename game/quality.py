@@ -0,0 +1,126 @@
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+from config import QualityConfig
+
+
+class QualityTier(NamedTuple):
+    name: str
+    # Collectible core and both rings.
+    collectible_details: bool
+    # Collectible glow billboard and orbiting spark.
+    collectible_effects: bool
+    # Multiplier on `collectible.lod_far_anim_interval` (far billboards).
+    far_anim_interval: int
+    # Nearest ground segments drawn; 0 => all of `world.ground_segments`.
+    ground_segments: int
+    # Share of `collectible.max_active` (only with `quality.adjust_spawn_caps`).
+    collectible_cap_scale: float
+
+
+# Highest first; the controller moves one step at a time.
+QUALITY_TIERS: tuple[QualityTier, ...] = (
+    QualityTier("high", True, True, 1, 0, 1.0),
+    QualityTier("medium", True, False, 2, 0, 1.0),
+    QualityTier("low", False, False, 4, 3, 0.75),
+    QualityTier("minimal", False, False, 8, 2, 0.5),
+)
+
+_MAX_HOLD_SCALE = 8.0
+
+
+class QualityChange(NamedTuple):
+    previous: QualityTier
+    tier: QualityTier
+    # Frame-time percentile (ms) of the window that triggered the change.
+    frame_ms: float
+    budget_ms: float
+
+
+class QualityController:
+    """Steps through `QUALITY_TIERS` from measured frame times.
+
+    Frame times are collected in tumbling windows of `window_seconds`; after
+    each window the configured percentile is compared with the frame budget.
+    Over budget * (1 + downgrade_margin) drops one tier at once. Stepping
+    back up needs the percentile under budget * (1 + upgrade_margin) for
+    `upgrade_hold_seconds`; each upgrade that is undone by the next window
+    doubles that hold. It never steps above `max_tier`. `apply` is called
+    with the new tier on every change (and once for the start tier).
+    """
+
+    def __init__(
+        self,
+        cfg: QualityConfig,
+        apply: Callable[[QualityTier], None],
+        tiers: tuple[QualityTier, ...] = QUALITY_TIERS,
+    ) -> None:
+        self.cfg = cfg
+        self.tiers = tiers
+        self._apply = apply
+        names = [tier.name for tier in tiers]
+        self.top = names.index(cfg.max_tier) if cfg.max_tier in names else 0
+        self.index = max(names.index(cfg.start_tier) if cfg.start_tier in names else 0, self.top)
+        self.budget_ms = 1000.0 / max(cfg.target_fps, 1.0)
+        # Room for a full window at up to 4x the target rate.
+        self._frames = np.zeros(max(16, int(cfg.window_seconds * max(cfg.target_fps, 1.0) * 4.0)))
+        self._count = 0
+        self._window_time = 0.0
+        self._good_time = 0.0
+        self._hold_scale = 1.0
+        self._just_upgraded = False
+        self.changes = 0
+        self.last_frame_ms = 0.0
+        apply(self.tier)
+
+    @property
+    def tier(self) -> QualityTier:
+        return self.tiers[self.index]
+
+    def _set_index(self, index: int) -> QualityChange:
+        previous = self.tier
+        self.index = index
+        self.changes += 1
+        self._good_time = 0.0
+        self._apply(self.tier)
+        return QualityChange(previous, self.tier, self.last_frame_ms, self.budget_ms)
+
+    def observe(self, dt: float) -> Optional[QualityChange]:
+        """Record one frame interval (seconds); returns a change, if any."""
+        if not self.cfg.adaptive:
+            return None
+        if self._count < self._frames.size:
+            self._frames[self._count] = dt * 1000.0
+            self._count += 1
+        self._window_time += dt
+        if self._window_time < self.cfg.window_seconds:
+            return None
+        frame_ms = float(np.percentile(self._frames[: self._count], self.cfg.percentile))
+        window = self._window_time
+        self._count = 0
+        self._window_time = 0.0
+        self.last_frame_ms = frame_ms
+        just_upgraded, self._just_upgraded = self._just_upgraded, False
+
+        cfg = self.cfg
+        if frame_ms > self.budget_ms * (1.0 + cfg.downgrade_margin):
+            if just_upgraded:
+                self._hold_scale = min(self._hold_scale * 2.0, _MAX_HOLD_SCALE)
+            if self.index + 1 < len(self.tiers):
+                return self._set_index(self.index + 1)
+            return None
+        if frame_ms > self.budget_ms * (1.0 + cfg.upgrade_margin):
+            self._good_time = 0.0
+            return None
+        self._good_time += window
+        if self.index > self.top and self._good_time >= cfg.upgrade_hold_seconds * self._hold_scale:
+            self._just_upgraded = True
+            return self._set_index(self.index - 1)
+        return None
+
+    def reset_window(self) -> None:
+        # Drop a partial window; called at run start and on resume, so no
+        # window spans a pause.
+        self._count = 0
+        self._window_time = 0.0
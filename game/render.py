@@ -0,0 +1,473 @@
+"""Render backend abstraction.
+
+Game systems never import Ursina directly; they ask a backend for entities,
+text and colors. `UrsinaBackend` (see `game.ursina_backend`) drives the real
+scene graph, `NullBackend` keeps plain Python objects so the full game loop
+can run headless (tests, CI, balancing, benchmarks).
+"""
+
+import json
+from typing import Any, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+
+class AssetSpec(NamedTuple):
+    """A model (plus optional texture) that can be baked into the asset cache."""
+
+    name: str
+    model: str
+    texture: Optional[str] = None
+
+
+ASSET_SPECS: tuple[AssetSpec, ...] = (
+    AssetSpec("obstacle", "cube"),
+    AssetSpec("ground_segment", "cube"),
+    AssetSpec("lane_guide", "cube"),
+    AssetSpec("collectible_body", "sphere"),
+    AssetSpec("collectible_core", "sphere"),
+    AssetSpec("collectible_ring", "quad", "circle_outlined"),
+    AssetSpec("collectible_glow", "quad", "circle"),
+    AssetSpec("collectible_spark", "sphere"),
+)
+
+
+class FlatQuad(NamedTuple):
+    """Horizontal rectangle in a `RenderBackend.flat_mesh`."""
+
+    x: float
+    width: float
+    y: float
+    z_min: float
+    z_max: float
+    # RGBA, 0-1.
+    color: tuple[float, float, float, float]
+    # Strength of the scrolling cross stripes on this quad (0 => plain).
+    stripes: float = 0.0
+
+
+class NullVec3(tuple):
+    def __new__(cls, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> "NullVec3":
+        return super().__new__(cls, (float(x), float(y), float(z)))
+
+    @property
+    def x(self) -> float:
+        return self[0]
+
+    @property
+    def y(self) -> float:
+        return self[1]
+
+    @property
+    def z(self) -> float:
+        return self[2]
+
+    def __mul__(self, other: Any) -> "NullVec3":
+        if isinstance(other, (int, float)):
+            return NullVec3(self[0] * other, self[1] * other, self[2] * other)
+        return NullVec3(self[0] * other[0], self[1] * other[1], self[2] * other[2])
+
+    __rmul__ = __mul__
+
+    def __add__(self, other: Any) -> "NullVec3":
+        return NullVec3(self[0] + other[0], self[1] + other[1], self[2] + other[2])
+
+    def __sub__(self, other: Any) -> "NullVec3":
+        return NullVec3(self[0] - other[0], self[1] - other[1], self[2] - other[2])
+
+
+def _to_vec3(value: Any, fallback: NullVec3) -> NullVec3:
+    if isinstance(value, (int, float)):
+        return NullVec3(value, value, value)
+    values = tuple(value)
+    if len(values) == 2:
+        return NullVec3(values[0], values[1], fallback[2])
+    return NullVec3(*values[:3])
+
+
+class NullEntity:
+    """Scene-graph stand-in with the Entity attributes the game touches."""
+
+    def __init__(self, backend: Optional["NullBackend"] = None, **kwargs: Any) -> None:
+        self._backend = backend
+        self._position = NullVec3()
+        self._rotation = NullVec3()
+        self._scale = NullVec3(1.0, 1.0, 1.0)
+        self._parent: Optional["NullEntity"] = None
+        self.children: list["NullEntity"] = []
+        self.enabled = True
+        self.model = None
+        self.color = (1.0, 1.0, 1.0, 1.0)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @property
+    def parent(self) -> Optional["NullEntity"]:
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Optional["NullEntity"]) -> None:
+        if self._parent is not None and self in self._parent.children:
+            self._parent.children.remove(self)
+        self._parent = value
+        if value is not None:
+            value.children.append(self)
+
+    @property
+    def position(self) -> NullVec3:
+        return self._position
+
+    @position.setter
+    def position(self, value: Any) -> None:
+        self._position = _to_vec3(value, self._position)
+
+    @property
+    def x(self) -> float:
+        return self._position[0]
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._position = NullVec3(value, self._position[1], self._position[2])
+
+    @property
+    def y(self) -> float:
+        return self._position[1]
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._position = NullVec3(self._position[0], value, self._position[2])
+
+    @property
+    def z(self) -> float:
+        return self._position[2]
+
+    @z.setter
+    def z(self, value: float) -> None:
+        self._position = NullVec3(self._position[0], self._position[1], value)
+
+    @property
+    def rotation(self) -> NullVec3:
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: Any) -> None:
+        self._rotation = _to_vec3(value, self._rotation)
+
+    @property
+    def rotation_x(self) -> float:
+        return self._rotation[0]
+
+    @rotation_x.setter
+    def rotation_x(self, value: float) -> None:
+        self._rotation = NullVec3(value, self._rotation[1], self._rotation[2])
+
+    @property
+    def rotation_y(self) -> float:
+        return self._rotation[1]
+
+    @rotation_y.setter
+    def rotation_y(self, value: float) -> None:
+        self._rotation = NullVec3(self._rotation[0], value, self._rotation[2])
+
+    @property
+    def rotation_z(self) -> float:
+        return self._rotation[2]
+
+    @rotation_z.setter
+    def rotation_z(self, value: float) -> None:
+        self._rotation = NullVec3(self._rotation[0], self._rotation[1], value)
+
+    @property
+    def scale(self) -> NullVec3:
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: Any) -> None:
+        self._scale = _to_vec3(value, self._scale)
+
+
+class NullText(NullEntity):
+    def __init__(self, backend: Optional["NullBackend"] = None, **kwargs: Any) -> None:
+        self.text = ""
+        super().__init__(backend, **kwargs)
+
+
+class NullInstancedBatch:
+    """Instanced geometry stand-in: one node, per-instance data in buffers."""
+
+    def __init__(
+        self,
+        model: str,
+        capacity: int,
+        scale: tuple[float, float, float],
+        effect: str = "flat",
+    ) -> None:
+        self.model = model
+        self.effect = effect
+        self.capacity = max(1, capacity)
+        self.scale = NullVec3(*scale)
+        # xyz = position, w = per-instance parameter (e.g. animation phase).
+        self.positions = np.zeros((self.capacity, 4), dtype=np.float32)
+        self.colors = np.ones((self.capacity, 4), dtype=np.float32)
+        self.uniforms: dict[str, Any] = {}
+        self.count = 0
+        self.uploads = 0
+        self.enabled = True
+        self.parent: Optional[Any] = None
+
+    def set_uniform(self, name: str, value: Any) -> None:
+        self.uniforms[name] = value
+
+    def update(self, positions: np.ndarray, colors: Optional[np.ndarray] = None) -> None:
+        count = min(len(positions), self.capacity)
+        self.positions[:count, : positions.shape[1]] = positions[:count]
+        if colors is not None:
+            self.colors[:count] = colors[:count]
+        self.count = count
+        self.uploads += 1
+
+
+class NullFlatMesh:
+    """Static mesh stand-in: quads baked once, animated only by uniforms."""
+
+    def __init__(self, quads: Sequence[FlatQuad]) -> None:
+        self.quads = tuple(quads)
+        self.uniforms: dict[str, Any] = {}
+        self.enabled = True
+        self.parent: Optional[Any] = None
+        self.position = NullVec3()
+
+    def set_uniform(self, name: str, value: Any) -> None:
+        self.uniforms[name] = value
+
+
+class RenderBackend:
+    name = "base"
+    headless = False
+    # Whether baked assets outlive the process (worth caching on disk).
+    persistent_assets = True
+    baked_asset_extension = ".bin"
+
+    def __init__(self) -> None:
+        self._asset_specs: dict[str, AssetSpec] = {spec.name: spec for spec in ASSET_SPECS}
+        self._baked_assets: dict[str, Any] = {}
+
+    def register_assets(self, specs: Sequence[AssetSpec], baked: Optional[dict[str, Any]] = None) -> None:
+        for spec in specs:
+            self._asset_specs[spec.name] = spec
+        if baked:
+            self._baked_assets.update(baked)
+
+    def asset(self, name: str) -> dict[str, Any]:
+        # Entity kwargs for a named asset: the baked model when one is loaded,
+        # otherwise the model/texture names it is built from.
+        baked = self._baked_assets.get(name)
+        if baked is not None:
+            return {"model": self.instance_baked(baked)}
+        spec = self._asset_specs[name]
+        if spec.texture is None:
+            return {"model": spec.model}
+        return {"model": spec.model, "texture": spec.texture}
+
+    def instance_baked(self, baked: Any) -> Any:
+        return baked
+
+    def bake_assets(self, specs: Sequence[AssetSpec]) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def save_baked_assets(self, baked: dict[str, Any], path: str) -> bool:
+        raise NotImplementedError
+
+    def load_baked_assets(self, path: str) -> Optional[dict[str, Any]]:
+        raise NotImplementedError
+
+    @property
+    def ui(self) -> Any:
+        raise NotImplementedError
+
+    def entity(self, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def text(self, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def destroy(self, node: Any) -> None:
+        raise NotImplementedError
+
+    def scene_node_count(self) -> int:
+        # Nodes currently in the scene graph (leak tracking in soak runs).
+        raise NotImplementedError
+
+    def instanced_batch(
+        self,
+        model: str,
+        capacity: int,
+        scale: tuple[float, float, float],
+        effect: str = "flat",
+        parent: Optional[Any] = None,
+    ) -> Any:
+        # One node and one draw call for up to `capacity` copies of `model`;
+        # per-instance positions/colors are uploaded via `batch.update(...)`,
+        # shared animation inputs via `batch.set_uniform(...)`.
+        raise NotImplementedError
+
+    def flat_mesh(self, quads: Sequence[FlatQuad], parent: Optional[Any] = None) -> Any:
+        # One node and one draw call for static horizontal quads. Its shader
+        # draws cross stripes (`FlatQuad.stripes`) every `stripe_spacing`
+        # along z, shifted by the `scroll` uniform, and skips everything past
+        # the `draw_distance` uniform; set them via `mesh.set_uniform(...)`.
+        raise NotImplementedError
+
+    def rgba(self, r: int, g: int, b: int, a: int = 255) -> Any:
+        raise NotImplementedError
+
+    def rgb(self, r: int, g: int, b: int) -> Any:
+        return self.rgba(r, g, b, 255)
+
+    def named_color(self, name: str) -> Any:
+        raise NotImplementedError
+
+    def aspect_ratio(self) -> float:
+        raise NotImplementedError
+
+    def set_window(self, title: str, background: Any) -> None:
+        raise NotImplementedError
+
+    def set_camera(self, position: tuple[float, float, float], rotation_x: float, fov: float) -> None:
+        raise NotImplementedError
+
+    def set_view_offset(self, z: float) -> None:
+        # Shifts the camera back by `z` so uniformly scrolling world objects
+        # render as if they had not finished the last simulation step.
+        raise NotImplementedError
+
+
+class NullBackend(RenderBackend):
+    name = "null"
+    headless = True
+    persistent_assets = False
+    baked_asset_extension = ".json"
+
+    _NAMED_COLORS = {
+        "cyan": (0, 255, 255),
+        "azure": (0, 127, 255),
+        "light_gray": (191, 191, 191),
+        "white": (255, 255, 255),
+    }
+
+    def __init__(self, aspect_ratio: float = 16.0 / 9.0) -> None:
+        super().__init__()
+        self._aspect_ratio = aspect_ratio
+        self._ui = NullEntity(self)
+        self.window_title = ""
+        self.window_color: Any = None
+        self.camera = NullEntity(self, fov=40.0)
+        self.camera_base_z = 0.0
+        self.view_offset = 0.0
+        self.live_nodes = 0
+
+    @property
+    def ui(self) -> NullEntity:
+        return self._ui
+
+    def scene_node_count(self) -> int:
+        return self.live_nodes
+
+    def entity(self, **kwargs: Any) -> NullEntity:
+        self.live_nodes += 1
+        return NullEntity(self, **kwargs)
+
+    def text(self, **kwargs: Any) -> NullText:
+        kwargs.setdefault("parent", self._ui)
+        self.live_nodes += 1
+        return NullText(self, **kwargs)
+
+    def instanced_batch(
+        self,
+        model: str,
+        capacity: int,
+        scale: tuple[float, float, float],
+        effect: str = "flat",
+        parent: Optional[Any] = None,
+    ) -> NullInstancedBatch:
+        self.live_nodes += 1
+        batch = NullInstancedBatch(model, capacity, scale, effect=effect)
+        batch.parent = parent
+        return batch
+
+    def flat_mesh(self, quads: Sequence[FlatQuad], parent: Optional[Any] = None) -> NullFlatMesh:
+        self.live_nodes += 1
+        mesh = NullFlatMesh(quads)
+        mesh.parent = parent
+        return mesh
+
+    def destroy(self, node: Any) -> None:
+        for child in list(getattr(node, "children", ())):
+            self.destroy(child)
+        node.parent = None
+        node.enabled = False
+        self.live_nodes = max(0, self.live_nodes - 1)
+
+    def bake_assets(self, specs: Sequence[AssetSpec]) -> dict[str, Any]:
+        return {spec.name: spec for spec in specs}
+
+    def save_baked_assets(self, baked: dict[str, Any], path: str) -> bool:
+        try:
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump({name: list(spec) for name, spec in baked.items()}, handle)
+        except OSError:
+            return False
+        return True
+
+    def load_baked_assets(self, path: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return {name: AssetSpec(*values) for name, values in data.items()}
+
+    def instance_baked(self, baked: Any) -> Any:
+        return baked.model
+
+    def rgba(self, r: int, g: int, b: int, a: int = 255) -> tuple[float, float, float, float]:
+        return (r / 255.0, g / 255.0, b / 255.0, a / 255.0)
+
+    def named_color(self, name: str) -> tuple[float, float, float, float]:
+        r, g, b = self._NAMED_COLORS.get(name, (255, 255, 255))
+        return self.rgb(r, g, b)
+
+    def aspect_ratio(self) -> float:
+        return self._aspect_ratio
+
+    def set_window(self, title: str, background: Any) -> None:
+        self.window_title = title
+        self.window_color = background
+
+    def set_camera(self, position: tuple[float, float, float], rotation_x: float, fov: float) -> None:
+        self.camera.position = position
+        self.camera.rotation_x = rotation_x
+        self.camera.fov = fov
+        self.camera_base_z = float(position[2])
+        self.camera.z = self.camera_base_z - self.view_offset
+
+    def set_view_offset(self, z: float) -> None:
+        self.view_offset = z
+        self.camera.z = self.camera_base_z - z
+
+
+_active_backend: Optional[RenderBackend] = None
+
+
+def set_backend(backend: Optional[RenderBackend]) -> None:
+    global _active_backend
+    _active_backend = backend
+
+
+def get_backend() -> RenderBackend:
+    global _active_backend
+    if _active_backend is None:
+        from game.ursina_backend import UrsinaBackend
+
+        _active_backend = UrsinaBackend()
+    return _active_backend
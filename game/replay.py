@@ -0,0 +1,215 @@
+"""Compact binary input replays.
+
+A replay covers one run: the run seed, a hash of the gameplay config and
+every lane input stamped with the fixed tick it was applied before. The
+simulation only reads lane inputs and its own RNG streams, so replaying the
+inputs at the same ticks with the same seed reproduces the run exactly,
+whatever the frame rate of the original session.
+
+File layout (little endian)::
+
+    header  "NDRP" u8 version  u64 seed  8s config hash  u32 ticks  u32 score  u32 input count
+    inputs  one unsigned LEB128 varint per input: (tick delta << 1) | (1 if right else 0)
+"""
+
+import hashlib
+import json
+import os
+import struct
+from dataclasses import asdict
+from typing import TYPE_CHECKING, NamedTuple
+
+from config import GameConfig
+from game.patterns import pattern_mode
+from game.state_machine import GameState
+
+if TYPE_CHECKING:
+    from game.core import NeonDashGame
+
+REPLAY_MAGIC = b"NDRP"
+REPLAY_VERSION = 1
+_HEADER = struct.Struct("<4sBQ8sIII")
+
+MOVE_LEFT = -1
+MOVE_RIGHT = 1
+
+
+def config_hash(config: GameConfig) -> bytes:
+    """Hash of the config sections that affect the simulation."""
+    payload = {
+        "lane": asdict(config.lane),
+        "player": asdict(config.player),
+        "movement": asdict(config.movement),
+        "world": asdict(config.world),
+        "spawner": asdict(config.spawner),
+        "collectible": asdict(config.collectible),
+        "difficulty": asdict(config.difficulty),
+        "simulation": asdict(config.simulation),
+        # Idle and thread planning produce the same patterns.
+        "lookahead": pattern_mode(config) != "inline",
+    }
+    if config.quality.adjust_spawn_caps:
+        # Collectible caps then follow the machine's frame rate.
+        payload["adaptive_spawn_caps"] = True
+    # Render/pool-only fields do not change gameplay.
+    for section, fields in (
+        ("world", ("moving_track", "track_rebase_distance", "render_mode", "stripe_spacing")),
+        ("spawner", ("pool_initial_size", "instanced_rendering")),
+        ("collectible", ("pool_initial_size", "render_mode", "lod_near_z", "lod_far_anim_interval")),
+    ):
+        for field in fields:
+            payload[section].pop(field, None)
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).digest()[:8]
+
+
+class ReplayError(ValueError):
+    pass
+
+
+class Replay(NamedTuple):
+    seed: int
+    config_hash: bytes
+    # (tick, direction) pairs in tick order; the input is applied when
+    # `tick` ticks of the run have completed.
+    inputs: list[tuple[int, int]]
+    ticks: int
+    score: int
+
+    def encode(self) -> bytes:
+        out = bytearray(
+            _HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                self.seed & 0xFFFFFFFFFFFFFFFF,
+                self.config_hash,
+                self.ticks,
+                self.score,
+                len(self.inputs),
+            )
+        )
+        last_tick = 0
+        for tick, direction in self.inputs:
+            value = ((tick - last_tick) << 1) | (1 if direction > 0 else 0)
+            last_tick = tick
+            while value >= 0x80:
+                out.append((value & 0x7F) | 0x80)
+                value >>= 7
+            out.append(value)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size:
+            raise ReplayError("replay file is truncated")
+        magic, version, seed, digest, ticks, score, count = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ReplayError("not a replay file")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"unsupported replay version {version}")
+        inputs: list[tuple[int, int]] = []
+        offset = _HEADER.size
+        tick = 0
+        for _ in range(count):
+            value = 0
+            shift = 0
+            while True:
+                if offset >= len(data):
+                    raise ReplayError("replay file is truncated")
+                byte = data[offset]
+                offset += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            tick += value >> 1
+            inputs.append((tick, MOVE_RIGHT if value & 1 else MOVE_LEFT))
+        return cls(seed, digest, inputs, ticks, score)
+
+    def save(self, path: str) -> str:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.write(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as handle:
+            return cls.decode(handle.read())
+
+
+class ReplayRecorder:
+    """Collects the lane inputs of the current run."""
+
+    def __init__(self) -> None:
+        self.seed = 0
+        self.config_hash = b""
+        self.inputs: list[tuple[int, int]] = []
+        self.recording = False
+
+    def begin(self, seed: int, digest: bytes) -> None:
+        self.seed = seed
+        self.config_hash = digest
+        self.inputs = []
+        self.recording = True
+
+    def record(self, tick: int, direction: int) -> None:
+        if self.recording:
+            self.inputs.append((tick, direction))
+
+    def snapshot(self, ticks: int, score: int) -> Replay:
+        return Replay(self.seed, self.config_hash, list(self.inputs), ticks, score)
+
+    def finish(self, ticks: int, score: int) -> Replay:
+        self.recording = False
+        return self.snapshot(ticks, score)
+
+
+class ReplayResult(NamedTuple):
+    ticks: int
+    score: int
+    game_over: bool
+
+    def matches(self, replay: Replay) -> bool:
+        return self.ticks == replay.ticks and self.score == replay.score
+
+
+class ReplayPlayer:
+    """Feeds a replay into a game, one fixed tick per `step`."""
+
+    def __init__(self, game: "NeonDashGame", replay: Replay, check_config: bool = True) -> None:
+        if check_config and replay.config_hash != config_hash(game.config):
+            raise ReplayError("replay was recorded with a different gameplay config")
+        self.game = game
+        self.replay = replay
+        self._next_input = 0
+
+    @property
+    def done(self) -> bool:
+        return not self.game.state.is_state(GameState.PLAYING) or self.game.tick_count >= self.replay.ticks
+
+    def start(self) -> None:
+        self._next_input = 0
+        self.game.start_run(seed=self.replay.seed)
+
+    def _apply_due_inputs(self) -> None:
+        inputs = self.replay.inputs
+        tick = self.game.tick_count
+        while self._next_input < len(inputs) and inputs[self._next_input][0] <= tick:
+            self.game.move_lane(inputs[self._next_input][1])
+            self._next_input += 1
+
+    def step(self) -> None:
+        self._apply_due_inputs()
+        self.game.update(self.game.tick_dt)
+
+    def run(self) -> ReplayResult:
+        self.start()
+        while not self.done:
+            self.step()
+        return self.result()
+
+    def result(self) -> ReplayResult:
+        return ReplayResult(self.game.tick_count, self.game.score // 10, self.game.state.is_state(GameState.GAME_OVER))
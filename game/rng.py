@@ -0,0 +1,36 @@
+import hashlib
+import random
+from typing import Optional
+
+
+def derive_seed(seed: int, name: str) -> int:
+    """Stable 64-bit seed for stream `name` (independent of PYTHONHASHSEED)."""
+    digest = hashlib.sha256(f"{seed}:{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class RandomStreams:
+    """Named `random.Random` streams derived from one seed.
+
+    Each subsystem draws from its own stream, so adding or removing draws in
+    one system does not shift the sequence another one sees. `reseed` reseeds
+    the existing generators in place; systems keep their references.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        # No fixed seed: take one from the global generator, so callers that
+        # seed `random` (tests, headless scripts) stay reproducible.
+        self.seed = random.getrandbits(63) if seed is None else int(seed)
+        self._streams: dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(derive_seed(self.seed, name))
+            self._streams[name] = rng
+        return rng
+
+    def reseed(self, seed: int) -> None:
+        self.seed = int(seed)
+        for name, rng in self._streams.items():
+            rng.seed(derive_seed(self.seed, name))
@@ -1,29 +1,77 @@
 import random
-from typing import AbstractSet, Optional
+from typing import AbstractSet, Any, Iterable, Optional
 
-from ursina import Entity, color
+import numpy as np
 
 from config import LaneConfig, SpawnerConfig, WorldConfig
+from game.entity_store import EntityStore
+from game.pool import ObjectPool
+from game.render import RenderBackend, get_backend
+from game.track import Track
 
 
 class ObstacleSpawner:
+    OBSTACLE_COLOR = (255, 93, 125)
+    OBSTACLE_SCALE = (1.2, 2.0, 1.4)
+    OBSTACLE_Y = 1.0
+
     def __init__(
         self,
         lane_cfg: LaneConfig,
         world_cfg: WorldConfig,
         spawner_cfg: SpawnerConfig,
+        backend: Optional[RenderBackend] = None,
+        track: Optional[Track] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
+        self.backend = backend or get_backend()
+        self.rng = rng or random.Random(random.getrandbits(63))
+        self.track = track or Track(world_cfg, self.backend)
         self.lane_cfg = lane_cfg
         self.world_cfg = world_cfg
         self.spawner_cfg = spawner_cfg
         self.spawn_timer = 0.0
         self.next_interval = self._pick_next_interval(0.0)
-        self.obstacles: list[Entity] = []
-        self._pool: list[Entity] = []
-        self._created_count = 0
-        self._pool_max_size = max(1, self.spawner_cfg.pool_max_size)
-        self._pool_initial_size = max(0, min(self.spawner_cfg.pool_initial_size, self._pool_max_size))
-        self._prewarm_pool()
+        pool_max_size = max(1, self.spawner_cfg.pool_max_size)
+        self.store = EntityStore(
+            pool_max_size,
+            len(self.lane_cfg.x_positions),
+            track_space=self.track.enabled,
+        )
+        self._lane_x = np.asarray(self.lane_cfg.x_positions, dtype=np.float64)
+        self._batch: Optional[Any] = None
+        self._batch_dirty = True
+        self._instance_colors = np.ones((self.store.capacity, 4), dtype=np.float32)
+        if self.spawner_cfg.instanced_rendering:
+            self._batch = self.backend.instanced_batch(
+                "cube",
+                self.store.capacity,
+                self.OBSTACLE_SCALE,
+                **self.track.parent_kwargs(),
+            )
+        self.pool: ObjectPool[int] = ObjectPool(
+            "obstacles",
+            self._create_obstacle_slot,
+            pool_max_size,
+        )
+        self.pool.prewarm(self.spawner_cfg.pool_initial_size)
+        # Idle slots above this are destroyed (see `apply_config`).
+        self._trim_size = self.pool.max_size
+
+    @property
+    def obstacles(self) -> list[Any]:
+        if self._batch is not None:
+            return []
+        return [self.store.nodes[slot] for slot in self.store.active_slots().tolist()]
+
+    @property
+    def draw_nodes(self) -> int:
+        if self._batch is not None:
+            return 1
+        return self.pool.created
+
+    def active_slots(self) -> np.ndarray:
+        return self.store.active_slots()
 
     @staticmethod
     def _lerp(a: float, b: float, t: float) -> float:
@@ -40,69 +88,122 @@ class ObstacleSpawner:
             self.spawner_cfg.end_max_spawn_interval,
             difficulty_t,
         )
-        return random.uniform(
+        return self.rng.uniform(
             min_interval,
             max_interval,
         )
 
-    def _prewarm_pool(self) -> None:
-        for _ in range(self._pool_initial_size):
-            obstacle = self._create_obstacle_entity()
-            obstacle._in_pool = True
-            self._pool.append(obstacle)
-
-    def _create_obstacle_entity(self) -> Entity:
-        obstacle = Entity(
-            model="cube",
-            color=color.rgb(255, 93, 125),
+    def _create_obstacle_entity(self) -> Any:
+        return self.backend.entity(
+            **self.backend.asset("obstacle"),
+            color=self.backend.rgb(*self.OBSTACLE_COLOR),
             position=(0, -1000, self.world_cfg.obstacle_cleanup_z - 100.0),
-            scale=(1.2, 2.0, 1.4),
-            collider="box",
+            scale=self.OBSTACLE_SCALE,
             enabled=False,
+            **self.track.parent_kwargs(),
         )
-        obstacle.lane_index = 1
-        obstacle._in_pool = False
-        self._created_count += 1
-        return obstacle
-
-    def _acquire_obstacle(self) -> Optional[Entity]:
-        obstacle: Optional[Entity] = None
-        if self._pool:
-            obstacle = self._pool.pop()
-        elif self._created_count < self._pool_max_size:
-            obstacle = self._create_obstacle_entity()
-        if obstacle is None:
+
+    def _create_obstacle_slot(self) -> int:
+        slot = self.pool.created
+        if self._batch is None:
+            self.store.nodes[slot] = self._create_obstacle_entity()
+        else:
+            r, g, b = self.OBSTACLE_COLOR
+            self._instance_colors[slot] = (r / 255.0, g / 255.0, b / 255.0, 1.0)
+        return slot
+
+    def apply_config(self, spawner_cfg: SpawnerConfig, prewarm: Optional[int] = None) -> int:
+        """Switch tuning and pool limits in place; returns the pool size.
+
+        The store and batch grow when `pool_max_size` goes up. Idle slots
+        above the new prewarm size (`pool_initial_size` unless given) are
+        destroyed from the top down; slots still in use go at the next
+        `reset`. `instanced_rendering` is fixed at construction.
+        """
+        self.spawner_cfg = spawner_cfg
+        pool_max_size = max(1, spawner_cfg.pool_max_size)
+        if pool_max_size > self.store.capacity:
+            extra = pool_max_size - self.store.capacity
+            self.store.grow(pool_max_size)
+            self._instance_colors = np.concatenate((self._instance_colors, np.ones((extra, 4), dtype=np.float32)))
+            if self._batch is not None:
+                self.backend.destroy(self._batch)
+                self._batch = self.backend.instanced_batch(
+                    "cube",
+                    self.store.capacity,
+                    self.OBSTACLE_SCALE,
+                    **self.track.parent_kwargs(),
+                )
+                self._batch_dirty = True
+        self.pool.max_size = pool_max_size
+        self._trim_size = min(pool_max_size, spawner_cfg.pool_initial_size if prewarm is None else prewarm)
+        self._trim_pool()
+        self.pool.prewarm(self._trim_size)
+        self._sync_render()
+        return self.pool.created
+
+    def _trim_pool(self) -> None:
+        # Slot index == creation order, so only the topmost slot can go.
+        pool = self.pool
+        while pool.created > self._trim_size:
+            slot = pool.created - 1
+            if self.store.active[slot] or not pool.discard(slot):
+                return
+            obstacle = self.store.nodes[slot]
+            if obstacle is not None:
+                self.backend.destroy(obstacle)
+                self.store.nodes[slot] = None
+
+    def _acquire_obstacle(self) -> Optional[int]:
+        slot = self.pool.acquire()
+        if slot is None:
             return None
-        obstacle._in_pool = False
-        obstacle.enabled = True
-        return obstacle
+        obstacle = self.store.nodes[slot]
+        if obstacle is not None:
+            obstacle.enabled = True
+        return slot
 
-    def _release_obstacle(self, obstacle: Entity) -> None:
-        if getattr(obstacle, "_in_pool", False):
+    def _release_obstacle(self, slot: int) -> None:
+        if not self.store.deactivate(slot):
             return
-        obstacle.enabled = False
-        obstacle.position = (0, -1000, self.world_cfg.obstacle_cleanup_z - 100.0)
-        obstacle._in_pool = True
-        self._pool.append(obstacle)
+        obstacle = self.store.nodes[slot]
+        if obstacle is not None:
+            obstacle.enabled = False
+            obstacle.position = (0, -1000, self.world_cfg.obstacle_cleanup_z - 100.0)
+        self.pool.release(slot)
+        self._batch_dirty = True
 
     def reset(self) -> None:
         self.spawn_timer = 0.0
         self.next_interval = self._pick_next_interval(0.0)
-        for obstacle in self.obstacles:
-            self._release_obstacle(obstacle)
-        self.obstacles.clear()
+        for slot in self.store.active_slots().tolist():
+            self._release_obstacle(slot)
+        self._trim_pool()
+        self.store.rebase()
+        self._sync_render()
+
+    def rebase(self) -> None:
+        # Track origin moved back to 0: shift track-local z of live objects.
+        self.store.rebase()
+        slots = np.flatnonzero(self.store.active)
+        if self._batch is None:
+            self.store.sync_z(slots)
+        self._batch_dirty = True
 
     def _spawn_obstacle(self, lane_index: int) -> bool:
-        obstacle = self._acquire_obstacle()
-        if obstacle is None:
+        slot = self._acquire_obstacle()
+        if slot is None:
             return False
-        obstacle.position = (
-            self.lane_cfg.x_positions[lane_index],
-            1.0,
-            self.world_cfg.obstacle_spawn_z,
-        )
-        obstacle.lane_index = lane_index
-        self.obstacles.append(obstacle)
+        spawn_z = self.world_cfg.obstacle_spawn_z
+        self.store.activate(slot, lane_index, spawn_z)
+        self._batch_dirty = True
+        obstacle = self.store.nodes[slot]
+        if obstacle is not None:
+            obstacle.position = (
+                self.lane_cfg.x_positions[lane_index],
+                self.OBSTACLE_Y,
+                self.store.z[slot],
+            )
         return True
 
     def _spawn_pattern(
@@ -122,32 +223,54 @@ class ObstacleSpawner:
             difficulty_t,
         )
         lane_count = 1
-        if random.random() < two_obstacle_chance:
+        if self.rng.random() < two_obstacle_chance:
             lane_count = 2
         lane_count = min(lane_count, len(lanes))
-        blocked = random.sample(lanes, k=lane_count)
+        blocked = self.rng.sample(lanes, k=lane_count)
         for lane in blocked:
             self._spawn_obstacle(lane)
 
+    def place(self, lanes: Iterable[int]) -> None:
+        """Spawn a pre-planned pattern (see `game.patterns`)."""
+        for lane in lanes:
+            self._spawn_obstacle(lane)
+
+    def collides_with(self, lane_index: int, z: float, threshold: float) -> bool:
+        return self.store.any_within(z, threshold, lane=lane_index)
+
     def update(
         self,
         dt: float,
         speed: float,
         difficulty_t: float,
         blocked_lanes: Optional[AbstractSet[int]] = None,
+        timed_spawns: bool = True,
     ) -> None:
+        # timed_spawns=False: spawns come from `place` (lookahead planner).
         self.spawn_timer += dt
-        if self.spawn_timer >= self.next_interval:
+        if timed_spawns and self.spawn_timer >= self.next_interval:
             self.spawn_timer = 0.0
             self.next_interval = self._pick_next_interval(difficulty_t)
             self._spawn_pattern(difficulty_t, blocked_lanes)
 
-        cleanup_z = self.world_cfg.obstacle_cleanup_z
-        active_obstacles: list[Entity] = []
-        for obstacle in self.obstacles:
-            obstacle.z -= speed * dt
-            if obstacle.z > cleanup_z:
-                active_obstacles.append(obstacle)
-            else:
-                self._release_obstacle(obstacle)
-        self.obstacles = active_obstacles
+        self.store.advance(speed * dt)
+        for slot in self.store.slots_behind(self.world_cfg.obstacle_cleanup_z).tolist():
+            self._release_obstacle(slot)
+        self._sync_render()
+
+    def _sync_render(self) -> None:
+        if self._batch is None:
+            # In track mode nodes already sit at their track-local z and the
+            # root scrolls, so there is nothing to write per tick.
+            if not self.track.enabled:
+                self.store.sync_z(np.flatnonzero(self.store.active))
+            return
+        if self.track.enabled and not self._batch_dirty:
+            return
+        self._batch_dirty = False
+        slots = np.flatnonzero(self.store.active)
+        positions = np.empty((slots.size, 3), dtype=np.float32)
+        positions[:, 0] = self._lane_x[self.store.lane[slots]]
+        positions[:, 1] = self.OBSTACLE_Y
+        positions[:, 2] = self.store.z[slots]
+        self._batch.update(positions, self._instance_colors[slots])
@@ -0,0 +1,43 @@
+from typing import Any, Optional
+
+from config import WorldConfig
+from game.render import RenderBackend
+
+
+class Track:
+    """Scrolling root for world-bound objects in moving-track mode.
+
+    Obstacles, collectibles and ground segments are parented to `root` at
+    track-local z; advancing the run only moves the root, so per-tick
+    movement is one transform write instead of one per entity.
+    """
+
+    def __init__(self, world_cfg: WorldConfig, backend: RenderBackend) -> None:
+        self.enabled = world_cfg.moving_track
+        self.rebase_distance = max(1.0, world_cfg.track_rebase_distance)
+        self.distance = 0.0
+        self.root: Optional[Any] = backend.entity(position=(0, 0, 0)) if self.enabled else None
+
+    def parent_kwargs(self) -> dict[str, Any]:
+        if self.root is None:
+            return {}
+        return {"parent": self.root}
+
+    def advance(self, dz: float) -> None:
+        if self.root is None:
+            return
+        self.distance += dz
+        self.root.z = -self.distance
+
+    def needs_rebase(self) -> bool:
+        return self.root is not None and self.distance >= self.rebase_distance
+
+    def rebase(self) -> float:
+        shift = self.distance
+        self.distance = 0.0
+        if self.root is not None:
+            self.root.z = 0.0
+        return shift
+
+    def reset(self) -> None:
+        self.rebase()
@@ -0,0 +1,380 @@
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from panda3d.core import (
+    BamEnums,
+    BamFile,
+    ClockObject,
+    ConfigVariableBool,
+    ConfigVariableDouble,
+    ConfigVariableString,
+    Filename,
+    Loader,
+    LoaderOptions,
+    NodePath,
+    OmniBoundingVolume,
+    PTA_LVecBase4f,
+    TransparencyAttrib,
+)
+from ursina import Entity, Mesh, Shader, Text, application, camera, color, destroy, scene, window
+
+from game.pacing import PacingPlan
+from game.render import AssetSpec, FlatQuad, RenderBackend
+
+
+_INSTANCED_VERTEX = """
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform vec4 instance_offsets[{capacity}];
+uniform vec4 instance_colors[{capacity}];
+uniform vec3 instance_scale;
+in vec4 p3d_Vertex;
+out vec4 v_color;
+
+void main() {{
+    vec3 local = p3d_Vertex.xyz * instance_scale + instance_offsets[gl_InstanceID].xyz;
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(local, 1.0);
+    v_color = instance_colors[gl_InstanceID];
+}}
+"""
+
+_INSTANCED_FRAGMENT = """
+#version 140
+in vec4 v_color;
+out vec4 fragColor;
+
+void main() {
+    fragColor = v_color;
+}
+"""
+
+
+_COLLECTIBLE_PULSE_VERTEX = """
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform vec4 instance_offsets[{capacity}];
+uniform vec4 instance_colors[{capacity}];
+uniform vec3 instance_scale;
+// x: bob speed, y: bob amplitude, z: spin speed (rad/s), w: base glow alpha (0-1)
+uniform vec4 anim_params;
+uniform float anim_time;
+in vec4 p3d_Vertex;
+in vec3 p3d_Normal;
+out vec4 v_color;
+out float v_glow;
+out float v_rim;
+
+void main() {{
+    vec4 instance = instance_offsets[gl_InstanceID];
+    float phase = instance.w;
+    float bob = sin(anim_time * anim_params.x + phase) * anim_params.y;
+    float pulse = 1.0 + 0.18 * sin(anim_time * anim_params.x * 1.7 + phase);
+    float angle = anim_time * anim_params.z + phase;
+    mat3 spin = mat3(
+        cos(angle), 0.0, -sin(angle),
+        0.0, 1.0, 0.0,
+        sin(angle), 0.0, cos(angle)
+    );
+    vec3 local = spin * (p3d_Vertex.xyz * instance_scale * (0.96 + 0.08 * pulse));
+    vec3 world = local + instance.xyz + vec3(0.0, bob, 0.0);
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(world, 1.0);
+    v_color = instance_colors[gl_InstanceID];
+    v_glow = clamp(
+        anim_params.w + (34.0 / 255.0) * sin(anim_time * anim_params.x * 2.1 + phase),
+        45.0 / 255.0,
+        180.0 / 255.0
+    );
+    v_rim = 1.0 - abs(normalize(spin * p3d_Normal).z);
+}}
+"""
+
+_COLLECTIBLE_PULSE_FRAGMENT = """
+#version 140
+in vec4 v_color;
+in float v_glow;
+in float v_rim;
+out vec4 fragColor;
+
+void main() {
+    vec3 glow = vec3(1.0, 0.88, 0.5) * v_glow * (0.4 + v_rim);
+    fragColor = vec4(min(v_color.rgb + glow, vec3(1.0)), 1.0);
+}
+"""
+
+_INSTANCED_EFFECTS = {
+    "flat": (_INSTANCED_VERTEX, _INSTANCED_FRAGMENT),
+    "collectible_pulse": (_COLLECTIBLE_PULSE_VERTEX, _COLLECTIBLE_PULSE_FRAGMENT),
+}
+
+
+_SCROLL_MESH_VERTEX = """
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+in vec4 p3d_Vertex;
+in vec4 p3d_Color;
+// x: stripe strength, y: z along the track
+in vec2 p3d_MultiTexCoord0;
+out vec4 v_color;
+out vec2 v_track;
+
+void main() {
+    gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+    v_color = p3d_Color;
+    v_track = p3d_MultiTexCoord0;
+}
+"""
+
+_SCROLL_MESH_FRAGMENT = """
+#version 140
+uniform float scroll;
+uniform float stripe_spacing;
+uniform float draw_distance;
+in vec4 v_color;
+in vec2 v_track;
+out vec4 fragColor;
+
+void main() {
+    if (v_track.y > draw_distance) {
+        discard;
+    }
+    float band = fract((v_track.y + scroll) / stripe_spacing);
+    float line = 1.0 - smoothstep(0.0, 0.04, min(band, 1.0 - band));
+    fragColor = vec4(v_color.rgb + vec3(0.05, 0.08, 0.11) * line * v_track.x, v_color.a);
+}
+"""
+
+
+def _pta_view(pta: PTA_LVecBase4f, rows: int) -> np.ndarray:
+    return np.frombuffer(memoryview(pta).cast("B"), dtype=np.float32).reshape(rows, 4)
+
+
+def configure_frame_pacing(plan: PacingPlan) -> None:
+    """Re-apply `plan` to the global clock once the window exists.
+
+    The prc settings cover window creation, but Ursina's own frame-rate
+    handling can reset the clock, so its limit is cleared first.
+    """
+    if hasattr(application, "target_frame_rate"):
+        application.target_frame_rate = 0
+    clock = ClockObject.getGlobalClock()
+    if plan.frame_rate > 0.0:
+        clock.setMode(ClockObject.MLimited)
+        clock.setFrameRate(plan.frame_rate)
+    else:
+        clock.setMode(ClockObject.MNormal)
+    if hasattr(window, "fps_counter") and window.fps_counter:
+        window.fps_counter.enabled = False
+    print(
+        "[FPS-Config] "
+        f"mode={plan.mode}, "
+        f"sync-video={bool(ConfigVariableBool('sync-video').getValue())}, "
+        f"clock-mode={ConfigVariableString('clock-mode').getValue()}, "
+        f"clock-frame-rate={float(ConfigVariableDouble('clock-frame-rate').getValue())}, "
+        f"window.vsync={getattr(window, 'vsync', None)}, "
+        f"target_frame_rate={getattr(application, 'target_frame_rate', None)}",
+    )
+
+
+class UrsinaInstancedBatch:
+    def __init__(
+        self,
+        model: str,
+        capacity: int,
+        scale: tuple[float, float, float],
+        effect: str = "flat",
+        parent: Optional[Any] = None,
+    ) -> None:
+        self.capacity = max(1, capacity)
+        vertex, fragment = _INSTANCED_EFFECTS[effect]
+        self.entity = Entity(
+            parent=parent if parent is not None else scene,
+            model=model,
+            shader=Shader(
+                language=Shader.GLSL,
+                vertex=vertex.format(capacity=self.capacity),
+                fragment=fragment,
+            ),
+        )
+        self._offsets = PTA_LVecBase4f.emptyArray(self.capacity)
+        self._colors = PTA_LVecBase4f.emptyArray(self.capacity)
+        self._offset_view = _pta_view(self._offsets, self.capacity)
+        self._color_view = _pta_view(self._colors, self.capacity)
+        self.entity.setShaderInput("instance_offsets", self._offsets)
+        self.entity.setShaderInput("instance_colors", self._colors)
+        self.entity.setShaderInput("instance_scale", scale)
+        # Bounds describe one instance only; never cull the batch as a whole.
+        self.entity.node().setBounds(OmniBoundingVolume())
+        self.entity.node().setFinal(True)
+        self.entity.setInstanceCount(0)
+        self.count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.entity.enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.entity.enabled = value
+
+    def set_uniform(self, name: str, value: Any) -> None:
+        self.entity.setShaderInput(name, value)
+
+    def update(self, positions: np.ndarray, colors: Optional[np.ndarray] = None) -> None:
+        count = min(len(positions), self.capacity)
+        self._offset_view[:count, : positions.shape[1]] = positions[:count]
+        if colors is not None:
+            self._color_view[:count] = colors[:count]
+        if count != self.count:
+            self.entity.setInstanceCount(count)
+            self.count = count
+
+
+class UrsinaFlatMesh:
+    def __init__(self, quads: Sequence[FlatQuad], parent: Optional[Any] = None) -> None:
+        vertices: list[tuple[float, float, float]] = []
+        colors: list[tuple[float, float, float, float]] = []
+        uvs: list[tuple[float, float]] = []
+        triangles: list[int] = []
+        for quad in quads:
+            left, right = quad.x - quad.width / 2.0, quad.x + quad.width / 2.0
+            base = len(vertices)
+            for x, z in ((left, quad.z_min), (left, quad.z_max), (right, quad.z_max), (right, quad.z_min)):
+                vertices.append((x, quad.y, z))
+                colors.append(quad.color)
+                uvs.append((quad.stripes, z))
+            triangles.extend((base, base + 1, base + 2, base, base + 2, base + 3))
+        self.entity = Entity(
+            parent=parent if parent is not None else scene,
+            model=Mesh(vertices=vertices, triangles=triangles, colors=colors, uvs=uvs, static=True),
+            shader=Shader(language=Shader.GLSL, vertex=_SCROLL_MESH_VERTEX, fragment=_SCROLL_MESH_FRAGMENT),
+            double_sided=True,
+        )
+        self.entity.setTransparency(TransparencyAttrib.MAlpha)
+        self.entity.setShaderInput("scroll", 0.0)
+        self.entity.setShaderInput("stripe_spacing", 1.0)
+        self.entity.setShaderInput("draw_distance", 1.0e6)
+
+    @property
+    def enabled(self) -> bool:
+        return self.entity.enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.entity.enabled = value
+
+    def set_uniform(self, name: str, value: Any) -> None:
+        self.entity.setShaderInput(name, value)
+
+
+class UrsinaBackend(RenderBackend):
+    name = "ursina"
+    headless = False
+    baked_asset_extension = ".bam"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._camera_base_z = float(camera.z)
+        self._view_offset = 0.0
+
+    @property
+    def ui(self) -> Any:
+        return camera.ui
+
+    def entity(self, **kwargs: Any) -> Entity:
+        return Entity(**kwargs)
+
+    def text(self, **kwargs: Any) -> Text:
+        return Text(**kwargs)
+
+    def destroy(self, node: Any) -> None:
+        destroy(getattr(node, "entity", node))
+
+    def scene_node_count(self) -> int:
+        # Everything under `render`, including the camera and its UI root.
+        return scene.find_all_matches("**").get_num_paths()
+
+    def instanced_batch(
+        self,
+        model: str,
+        capacity: int,
+        scale: tuple[float, float, float],
+        effect: str = "flat",
+        parent: Optional[Any] = None,
+    ) -> UrsinaInstancedBatch:
+        return UrsinaInstancedBatch(model, capacity, scale, effect=effect, parent=parent)
+
+    def flat_mesh(self, quads: Sequence[FlatQuad], parent: Optional[Any] = None) -> UrsinaFlatMesh:
+        return UrsinaFlatMesh(quads, parent=parent)
+
+    def bake_assets(self, specs: Sequence[AssetSpec]) -> dict[str, Any]:
+        # Resolve each model/texture the way Entity would, then keep a detached
+        # copy of the geometry + texture state without the entity's color.
+        baked: dict[str, Any] = {}
+        for spec in specs:
+            source_kwargs: dict[str, Any] = {"model": spec.model}
+            if spec.texture is not None:
+                source_kwargs["texture"] = spec.texture
+            source = Entity(add_to_scene_entities=False, **source_kwargs)
+            template = source.model.copyTo(NodePath(spec.name))
+            template.setName(spec.name)
+            template.clearColor()
+            template.clearColorScale()
+            destroy(source)
+            baked[spec.name] = template
+        return baked
+
+    def save_baked_assets(self, baked: dict[str, Any], path: str) -> bool:
+        root = NodePath("neon_dash_assets")
+        for name, template in baked.items():
+            template.copyTo(root).setName(name)
+        bam = BamFile()
+        if not bam.openWrite(Filename.fromOsSpecific(path)):
+            return False
+        # Embed texture images so a cache hit needs no texture file lookups.
+        bam.getWriter().setFileTextureMode(BamEnums.BTM_rawdata)
+        written = bam.writeObject(root.node())
+        bam.close()
+        return bool(written)
+
+    def load_baked_assets(self, path: str) -> Optional[dict[str, Any]]:
+        options = LoaderOptions(LoaderOptions.LF_no_cache | LoaderOptions.LF_report_errors)
+        node = Loader.getGlobalPtr().loadSync(Filename.fromOsSpecific(path), options)
+        if node is None:
+            return None
+        root = NodePath(node)
+        return {child.getName(): child for child in root.getChildren()}
+
+    def instance_baked(self, baked: Any) -> Any:
+        # Each entity gets its own holder node sharing the baked geometry.
+        holder = NodePath(baked.getName())
+        baked.instanceTo(holder)
+        return holder
+
+    def rgba(self, r: int, g: int, b: int, a: int = 255) -> Any:
+        return color.rgba(r, g, b, a)
+
+    def rgb(self, r: int, g: int, b: int) -> Any:
+        return color.rgb(r, g, b)
+
+    def named_color(self, name: str) -> Any:
+        return getattr(color, name)
+
+    def aspect_ratio(self) -> float:
+        return float(window.aspect_ratio)
+
+    def set_window(self, title: str, background: Any) -> None:
+        window.title = title
+        window.color = background
+
+    def set_camera(self, position: tuple[float, float, float], rotation_x: float, fov: float) -> None:
+        camera.position = position
+        camera.rotation_x = rotation_x
+        camera.fov = fov
+        self._camera_base_z = float(position[2])
+        camera.z = self._camera_base_z - self._view_offset
+
+    def set_view_offset(self, z: float) -> None:
+        if z == self._view_offset:
+            return
+        self._view_offset = z
+        camera.z = self._camera_base_z - z
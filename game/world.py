@@ -1,48 +1,165 @@
-from ursina import Entity, color
+from typing import Any, Optional
 
 from config import LaneConfig, WorldConfig
+from game.render import FlatQuad, RenderBackend, get_backend
+from game.track import Track
+
+WORLD_RENDER_MODES = ("segments", "scroll")
 
 
 class WorldSystem:
-    def __init__(self, world_cfg: WorldConfig, lane_cfg: LaneConfig) -> None:
+    def __init__(
+        self,
+        world_cfg: WorldConfig,
+        lane_cfg: LaneConfig,
+        backend: Optional[RenderBackend] = None,
+        track: Optional[Track] = None,
+    ) -> None:
+        self.backend = backend or get_backend()
+        self.track = track or Track(world_cfg, self.backend)
         self.world_cfg = world_cfg
         self.lane_cfg = lane_cfg
-        self.ground_segments: list[Entity] = []
-        self.lane_guides: list[Entity] = []
-        self._create_ground()
-        self._create_lane_guides()
+        if world_cfg.render_mode not in WORLD_RENDER_MODES:
+            raise ValueError(f"unknown world render mode {world_cfg.render_mode!r}")
+        self.ground_segments: list[Any] = []
+        self.lane_guides: list[Any] = []
+        # "scroll" mode: road and guides in one static mesh.
+        self.mesh: Optional[Any] = None
+        self._scroll = 0.0
+        self._stripe_spacing = max(0.1, world_cfg.stripe_spacing)
+        # Index of the segment nearest the player; it is the next to wrap.
+        self._rear_segment = 0
+        # Nearest segments drawn (quality tiers); the rest are hidden.
+        self.visible_segments = self.world_cfg.ground_segments
+        if world_cfg.render_mode == "scroll":
+            self._create_mesh()
+        else:
+            self._create_ground()
+            self._create_lane_guides()
+
+    @property
+    def draw_nodes(self) -> int:
+        if self.mesh is not None:
+            return 1
+        return len(self.ground_segments) + len(self.lane_guides)
+
+    def _track_span(self) -> tuple[float, float]:
+        # The z range the wrapping segments cover.
+        length = self.world_cfg.ground_segment_length
+        return -length, length * (self.world_cfg.ground_segments - 1)
+
+    def _rgba(self, r: int, g: int, b: int, a: int = 255) -> tuple[float, float, float, float]:
+        # Plain floats for vertex colors, whatever the backend's color type.
+        red, green, blue, alpha = self.backend.rgba(r, g, b, a)
+        return (float(red), float(green), float(blue), float(alpha))
+
+    def _create_mesh(self) -> None:
+        z_min, z_max = self._track_span()
+        # Same surfaces as the segment mode: the cube tops at y=0.1 / 0.125.
+        quads = [FlatQuad(0.0, self.world_cfg.road_width, 0.1, z_min, z_max, self._rgba(17, 20, 30), stripes=1.0)]
+        quads.extend(
+            FlatQuad(x, 0.06, 0.125, z_min, z_max, self._rgba(65, 248, 255, 160))
+            for x in self.lane_cfg.x_positions
+        )
+        # Static: deliberately not parented to the moving track root.
+        self.mesh = self.backend.flat_mesh(quads)
+        self.mesh.set_uniform("stripe_spacing", self._stripe_spacing)
+        self.mesh.set_uniform("scroll", 0.0)
+        self.mesh.set_uniform("draw_distance", z_max)
 
     def _create_ground(self) -> None:
         length = self.world_cfg.ground_segment_length
         for i in range(self.world_cfg.ground_segments):
-            segment = Entity(
-                model="cube",
-                color=color.rgb(17, 20, 30),
+            segment = self.backend.entity(
+                **self.backend.asset("ground_segment"),
+                color=self.backend.rgb(17, 20, 30),
                 position=(0, 0, i * length),
                 scale=(self.world_cfg.road_width, 0.2, length),
+                **self.track.parent_kwargs(),
             )
             self.ground_segments.append(segment)
 
     def _create_lane_guides(self) -> None:
         for x in self.lane_cfg.x_positions:
-            line = Entity(
-                model="cube",
-                color=color.rgba(65, 248, 255, 160),
+            line = self.backend.entity(
+                **self.backend.asset("lane_guide"),
+                color=self.backend.rgba(65, 248, 255, 160),
                 position=(x, 0.11, 0),
                 scale=(0.06, 0.03, self.world_cfg.ground_segment_length * self.world_cfg.ground_segments),
             )
             self.lane_guides.append(line)
 
+    def set_visible_segments(self, count: int) -> None:
+        """Draw only the `count` nearest ground segments (<= 0 => all)."""
+        total = self.world_cfg.ground_segments
+        self.visible_segments = total if count <= 0 else min(count, total)
+        if self.mesh is not None:
+            # Same reach as that many segments, clipped in the shader.
+            z_min, _ = self._track_span()
+            self.mesh.set_uniform("draw_distance", z_min + self.visible_segments * self.world_cfg.ground_segment_length)
+            return
+        self._refresh_visibility()
+
+    def _refresh_visibility(self) -> None:
+        # Called when segment order changes (wraps, reset); cheap for a handful
+        # of segments, and a no-op write-wise when everything is drawn.
+        if self.visible_segments >= len(self.ground_segments):
+            for segment in self.ground_segments:
+                if not segment.enabled:
+                    segment.enabled = True
+            return
+        ordered = sorted(self.ground_segments, key=lambda segment: segment.z)
+        for rank, segment in enumerate(ordered):
+            segment.enabled = rank < self.visible_segments
+
     def reset(self) -> None:
+        if self.mesh is not None:
+            self._scroll = 0.0
+            self.mesh.set_uniform("scroll", 0.0)
+            return
         length = self.world_cfg.ground_segment_length
         for i, segment in enumerate(self.ground_segments):
             segment.z = i * length
+        self._rear_segment = 0
+        self._refresh_visibility()
+
+    def rebase(self, shift: float) -> None:
+        for segment in self.ground_segments:
+            segment.z -= shift
 
     def update(self, dt: float, speed: float) -> None:
+        if self.mesh is not None:
+            # One uniform write per tick. Kept within one stripe period so
+            # the float32 uniform stays exact on long runs.
+            self._scroll = (self._scroll + speed * dt) % self._stripe_spacing
+            self.mesh.set_uniform("scroll", self._scroll)
+            return
         length = self.world_cfg.ground_segment_length
         total_length = length * len(self.ground_segments)
+        if self.track.enabled:
+            self._wrap_track_segments(length, total_length)
+            return
+        wrapped = False
         for segment in self.ground_segments:
             segment.z -= speed * dt
             if segment.z < -length:
                 segment.z += total_length
+                wrapped = True
+        if wrapped and self.visible_segments < len(self.ground_segments):
+            self._refresh_visibility()
+
+    def _wrap_track_segments(self, length: float, total_length: float) -> None:
+        # Segments sit at track-local z under the scrolling root; only the rear
+        # one can fall behind, so this is O(1) per tick.
+        if not self.ground_segments:
+            return
+        distance = self.track.distance
+        while True:
+            segment = self.ground_segments[self._rear_segment]
+            if segment.z - distance >= -length:
+                return
+            segment.z += total_length
+            self._rear_segment = (self._rear_segment + 1) % len(self.ground_segments)
+            if self.visible_segments < len(self.ground_segments):
+                self._refresh_visibility()
 
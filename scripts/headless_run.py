@@ -0,0 +1,68 @@
+"""Run the Neon Dash game loop without a window (null render backend)."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CONFIG  # noqa: E402
+from game.core import NeonDashGame  # noqa: E402
+from game.render import NullBackend  # noqa: E402
+from game.state_machine import GameState  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=300.0, help="simulated seconds to run")
+    parser.add_argument("--fps", type=float, default=60.0, help="simulated frame rate")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument(
+        "--switch-every",
+        type=int,
+        default=45,
+        help="frames between random lane switches (0 disables input)",
+    )
+    parser.add_argument("--profile", action="store_true", help="print per-phase frame timings at the end")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    random.seed(args.seed)
+    game = NeonDashGame(CONFIG, backend=NullBackend())
+    dt = 1.0 / max(args.fps, 1.0)
+    frames = int(args.seconds * args.fps)
+    runs = 0
+    best_score = 0
+
+    started = time.perf_counter()
+    for frame in range(frames):
+        if game.state.state in {GameState.START, GameState.GAME_OVER}:
+            best_score = max(best_score, game.score // 10)
+            runs += 1
+            game.input("space")
+        elif args.switch_every > 0 and frame % args.switch_every == 0:
+            game.input(random.choice(("a", "d")))
+        game.update(dt)
+    wall = time.perf_counter() - started
+    best_score = max(best_score, game.score // 10)
+
+    print(f"[Headless] frames={frames} simulated={args.seconds:.1f}s wall={wall:.3f}s")
+    print(f"[Headless] throughput={frames / max(wall, 1e-9):.0f} frames/s runs={runs} best_score={best_score}")
+    if args.profile:
+        print(game.profiler.format_summary())
+    for pool in game.pool_stats():
+        print(
+            f"[Headless] pool={pool.name} created={pool.created}/{pool.max_size} "
+            f"high_water={pool.high_water} hits={pool.hits} misses={pool.misses} cap_hits={pool.cap_hits}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,7 @@ from typing import Optional
 REQUIRED_PACKAGES = {
     "ursina": "5.2.0",
     "panda3d": "1.10.16",
+    "numpy": "1.26.4",
 }
 
 PYTHON_MIN = (3, 9)
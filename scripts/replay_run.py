@@ -0,0 +1,59 @@
+"""Play a recorded `.ndr` replay headlessly and check it reproduces the run."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CONFIG  # noqa: E402
+from game.core import NeonDashGame  # noqa: E402
+from game.render import NullBackend  # noqa: E402
+from game.replay import Replay, ReplayError, ReplayPlayer  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("replay", help="path to a .ndr replay file")
+    parser.add_argument("--repeat", type=int, default=1, help="play the replay this many times")
+    parser.add_argument("--force", action="store_true", help="play even if the gameplay config hash differs")
+    parser.add_argument("--profile", action="store_true", help="print per-phase frame timings at the end")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    replay = Replay.load(args.replay)
+    print(
+        f"[Replay] seed={replay.seed} ticks={replay.ticks} score={replay.score} "
+        f"inputs={len(replay.inputs)} config={replay.config_hash.hex()}"
+    )
+    game = NeonDashGame(CONFIG, backend=NullBackend())
+    game.finish_loading()
+    try:
+        player = ReplayPlayer(game, replay, check_config=not args.force)
+    except ReplayError as exc:
+        print(f"[Replay] {exc} (use --force to play anyway)")
+        return 2
+
+    mismatches = 0
+    for _ in range(max(1, args.repeat)):
+        started = time.perf_counter()
+        result = player.run()
+        wall = time.perf_counter() - started
+        ok = result.matches(replay)
+        mismatches += 0 if ok else 1
+        print(
+            f"[Replay] ticks={result.ticks} score={result.score} game_over={result.game_over} "
+            f"wall={wall:.3f}s {'OK' if ok else 'MISMATCH'}"
+        )
+    if args.profile:
+        print(game.profiler.format_summary())
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""Measure launch-to-START time with and without the baked asset cache.
+
+Each launch runs `main.py` in a fresh process that exits as soon as startup
+loading is done, and parses its `[Startup]` line. Modes:
+
+- rebuild: baked cache disabled (models/textures resolved by name every time)
+- cold:    empty cache directory, so the bundle is baked and written
+- warm:    cache directory already holds the bundle for the current config
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STARTUP_LINE = re.compile(r"\[Startup\].*")
+_FIELD = re.compile(r"(first_frame|warm)=([0-9.]+)ms")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="launches per mode")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds before a launch is abandoned")
+    return parser.parse_args()
+
+
+def _launch(cache_dir: str, baked: bool, timeout: float) -> dict[str, float]:
+    env = dict(os.environ)
+    env["NEON_DASH_EXIT_AFTER_STARTUP"] = "1"
+    env["NEON_DASH_ASSET_CACHE_DIR"] = cache_dir
+    env["NEON_DASH_BAKED_ASSETS"] = "1" if baked else "0"
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "main.py")],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    match = _STARTUP_LINE.search(result.stdout)
+    if match is None:
+        raise RuntimeError(f"no [Startup] line (exit {result.returncode}):\n{result.stderr[-2000:]}")
+    return {name: float(value) for name, value in _FIELD.findall(match.group(0))}
+
+
+def _summarize(mode: str, samples: list[dict[str, float]]) -> None:
+    first = [sample["first_frame"] for sample in samples]
+    warm = [sample["warm"] for sample in samples]
+    print(
+        f"[StartupBench] mode={mode:<7} runs={len(samples)} "
+        f"first_frame_median={statistics.median(first):.1f}ms min={min(first):.1f}ms "
+        f"warm_median={statistics.median(warm):.1f}ms",
+    )
+
+
+def main() -> int:
+    args = _parse_args()
+    runs = max(1, args.runs)
+    results: dict[str, list[dict[str, float]]] = {"rebuild": [], "cold": [], "warm": []}
+    with tempfile.TemporaryDirectory() as scratch:
+        for index in range(runs):
+            results["rebuild"].append(_launch(os.path.join(scratch, f"off-{index}"), False, args.timeout))
+            results["cold"].append(_launch(os.path.join(scratch, f"cold-{index}"), True, args.timeout))
+        warm_dir = os.path.join(scratch, "warm")
+        _launch(warm_dir, True, args.timeout)
+        for _ in range(runs):
+            results["warm"].append(_launch(warm_dir, True, args.timeout))
+
+    for mode, samples in results.items():
+        _summarize(mode, samples)
+    rebuild = statistics.median(sample["first_frame"] for sample in results["rebuild"])
+    warm = statistics.median(sample["first_frame"] for sample in results["warm"])
+    print(f"[StartupBench] warm cache vs rebuild: {rebuild - warm:+.1f}ms ({(rebuild - warm) / max(rebuild, 1e-9):+.1%})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
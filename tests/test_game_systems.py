@@ -1,29 +1,56 @@
+import json
+import math
+import os
 import random
+import sys
+import tempfile
 import unittest
+from dataclasses import replace
 
-from ursina import Entity, Ursina, application, destroy
+import numpy as np
 
-from config import CollectibleConfig, LaneConfig, SpawnerConfig, WorldConfig
-from game.collectibles import CollectibleSystem
+from config import (
+    CONFIG,
+    LOW_SPEC_STABILITY_CONFIG,
+    CollectibleConfig,
+    GameConfig,
+    InputConfig,
+    LaneConfig,
+    PacingConfig,
+    PatternConfig,
+    ProfilerConfig,
+    QualityConfig,
+    SimulationConfig,
+    SpawnerConfig,
+    StartupConfig,
+    WorldConfig,
+)
+from benchmarks.harness import DodgeBot, compare, run_benchmark
+from benchmarks.soak import SoakSettings, find_growth, run_soak
+from benchmarks.tuner import TuneJob, apply_overrides, make_jobs, run_job, run_jobs, summarize, tuning_config
+from game.assets import BakedAssetCache, asset_key
+from game.batch_sim import BatchSimulator
+from game.collectibles import CollectibleSystem, compute_collectible_animation
+from game.core import NeonDashGame
+from game.hud import HudView
+from game.latency import LatencyTracker
+from game.pacing import FrameJitter, pacing_plan
+from game.patterns import PatternGenerator, PatternQueue
+from game.entity_store import EntityStore
+from game.profiler import PHASES, FrameProfiler
+from game.profiles import ProfileError, ProfileRegistry, config_from_dict, live_config
+from game.quality import QUALITY_TIERS, QualityController
+from game.render import ASSET_SPECS, NullBackend
+from game.rng import RandomStreams
+from game.replay import MOVE_LEFT, MOVE_RIGHT, Replay, ReplayError, ReplayPlayer, config_hash
 from game.spawner import ObstacleSpawner
-
-
-_TEST_APP = None
-
-
-def _ensure_test_app() -> None:
-    global _TEST_APP
-    existing_base = getattr(application, "base", None)
-    if existing_base is not None:
-        _TEST_APP = existing_base
-        return
-    if _TEST_APP is None:
-        _TEST_APP = Ursina(window_type="offscreen")
+from game.state_machine import GameState
+import main
 
 
 class TestObstacleSpawner(unittest.TestCase):
     def setUp(self) -> None:
-        _ensure_test_app()
+        self.backend = NullBackend()
         self.lane_cfg = LaneConfig(x_positions=(-2.0, 0.0, 2.0))
         self.world_cfg = WorldConfig(obstacle_spawn_z=40.0, obstacle_cleanup_z=-10.0)
         self.spawner_cfg = SpawnerConfig(
@@ -34,7 +61,7 @@ class TestObstacleSpawner(unittest.TestCase):
             start_two_obstacle_chance=0.0,
             end_two_obstacle_chance=0.0,
         )
-        self.spawner = ObstacleSpawner(self.lane_cfg, self.world_cfg, self.spawner_cfg)
+        self.spawner = ObstacleSpawner(self.lane_cfg, self.world_cfg, self.spawner_cfg, backend=self.backend)
         random.seed(7)
 
     def tearDown(self) -> None:
@@ -43,11 +70,12 @@ class TestObstacleSpawner(unittest.TestCase):
     def test_spawn_pattern_respects_blocked_lanes(self) -> None:
         self.spawner._spawn_pattern(difficulty_t=0.0, blocked_lanes={1, 2})
         self.assertEqual(len(self.spawner.obstacles), 1)
-        self.assertEqual(self.spawner.obstacles[0].lane_index, 0)
+        slot = self.spawner.active_slots()[0]
+        self.assertEqual(self.spawner.store.lane[slot], 0)
 
     def test_cleanup_removes_obstacles_behind_line(self) -> None:
         self.spawner._spawn_obstacle(0)
-        self.spawner.obstacles[0].z = self.world_cfg.obstacle_cleanup_z - 1.0
+        self.spawner.store.z[self.spawner.active_slots()[0]] = self.world_cfg.obstacle_cleanup_z - 1.0
         self.spawner.update(dt=0.0, speed=0.0, difficulty_t=0.0, blocked_lanes=None)
         self.assertEqual(len(self.spawner.obstacles), 0)
 
@@ -61,7 +89,7 @@ class TestObstacleSpawner(unittest.TestCase):
 
 class TestCollectibleSystem(unittest.TestCase):
     def setUp(self) -> None:
-        _ensure_test_app()
+        self.backend = NullBackend()
         self.lane_cfg = LaneConfig(x_positions=(-2.0, 0.0, 2.0))
         self.world_cfg = WorldConfig(obstacle_spawn_z=50.0, obstacle_cleanup_z=-10.0)
         self.collectible_cfg = CollectibleConfig(
@@ -72,32 +100,32 @@ class TestCollectibleSystem(unittest.TestCase):
             min_obstacle_distance_z=8.0,
             max_active=2,
             pickup_z_threshold=1.2,
+            # Full detail everywhere; LOD has its own tests.
+            lod_near_z=self.world_cfg.obstacle_spawn_z,
         )
-        self.system = CollectibleSystem(self.lane_cfg, self.world_cfg, self.collectible_cfg)
+        self.system = CollectibleSystem(self.lane_cfg, self.world_cfg, self.collectible_cfg, backend=self.backend)
         random.seed(11)
 
     def tearDown(self) -> None:
         self.system.reset()
 
     def test_try_spawn_avoids_unsafe_lane(self) -> None:
-        obstacle = Entity(model="cube")
-        obstacle.lane_index = 0
-        obstacle.z = self.world_cfg.obstacle_spawn_z
-        self.system._try_spawn([obstacle])
+        obstacles = EntityStore(4)
+        obstacles.activate(0, lane=0, z=self.world_cfg.obstacle_spawn_z)
+        self.system._try_spawn(obstacles)
         self.assertEqual(len(self.system.collectibles), 1)
-        self.assertIn(self.system.collectibles[0].lane_index, {1, 2})
-        destroy(obstacle)
+        self.assertIn(self.system.store.lane[self.system.active_slots()[0]], {1, 2})
 
     def test_max_active_limit_is_respected(self) -> None:
         self.system._spawn_collectible(0)
         self.system._spawn_collectible(1)
         self.assertEqual(len(self.system.collectibles), self.collectible_cfg.max_active)
-        self.system._try_spawn([])
+        self.system._try_spawn(EntityStore(1))
         self.assertEqual(len(self.system.collectibles), self.collectible_cfg.max_active)
 
     def test_collect_at_removes_collectible_and_returns_count(self) -> None:
         self.system._spawn_collectible(1)
-        self.system.collectibles[0].z = -2.0
+        self.system.store.z[self.system.active_slots()[0]] = -2.0
         count = self.system.collect_at(player_lane=1, player_z=-2.0, threshold=1.2)
         self.assertEqual(count, 1)
         self.assertEqual(len(self.system.collectibles), 0)
@@ -105,11 +133,106 @@ class TestCollectibleSystem(unittest.TestCase):
     def test_lanes_blocked_near_spawn(self) -> None:
         self.system._spawn_collectible(0)
         self.system._spawn_collectible(2)
-        self.system.collectibles[0].z = self.world_cfg.obstacle_spawn_z - 1.0
-        self.system.collectibles[1].z = self.world_cfg.obstacle_spawn_z + 20.0
+        first, second = self.system.active_slots()
+        self.system.store.z[first] = self.world_cfg.obstacle_spawn_z - 1.0
+        self.system.store.z[second] = self.world_cfg.obstacle_spawn_z + 20.0
         blocked = self.system.lanes_blocked_near_spawn(min_distance_z=8.0)
         self.assertEqual(blocked, {0})
 
+    def test_animation_kernel_matches_scalar_formulas(self) -> None:
+        cfg = self.collectible_cfg
+        phases = [0.0, 1.3, 4.9]
+        frame = compute_collectible_animation(cfg, 2.5, np.asarray(phases), np.asarray([0.5, 0.5, 0.5]))
+        for i, phase in enumerate(phases):
+            bob = cfg.y + math.sin(2.5 * cfg.bob_speed + phase) * cfg.bob_amplitude
+            pulse = 1.0 + 0.18 * math.sin(2.5 * (cfg.bob_speed * 1.7) + phase)
+            alpha = int(cfg.glow_alpha + 34 * math.sin(2.5 * (cfg.bob_speed * 2.1) + phase))
+            self.assertAlmostEqual(frame.body_y[i], bob)
+            self.assertAlmostEqual(frame.glow_scale[i], cfg.scale * (cfg.glow_scale + 0.55) * pulse)
+            self.assertEqual(frame.glow_alpha[i], max(45, min(180, alpha)))
+            self.assertAlmostEqual(frame.spin_y[i], cfg.spin_speed * 0.5)
+
+    def test_update_writes_animation_to_nodes(self) -> None:
+        self.system._spawn_collectible(1)
+        slot = self.system.active_slots()[0]
+        self.system.update(dt=0.25, speed=4.0, difficulty_t=0.0, obstacles=EntityStore(1))
+        node = self.system.store.nodes[slot]
+        self.assertAlmostEqual(node.z, self.world_cfg.obstacle_spawn_z - 1.0)
+        self.assertAlmostEqual(node.x, self.lane_cfg.x_positions[1])
+        self.assertAlmostEqual(node.rotation_y, self.collectible_cfg.spin_speed * 0.25)
+        self.assertNotAlmostEqual(node.y, 0.0)
+
+    def test_large_pool_animates_every_active_collectible(self) -> None:
+        cfg = CollectibleConfig(
+            max_active=64,
+            pool_initial_size=64,
+            pool_max_size=64,
+            lod_near_z=self.world_cfg.obstacle_spawn_z,
+        )
+        system = CollectibleSystem(self.lane_cfg, self.world_cfg, cfg, backend=self.backend)
+        for i in range(64):
+            system._spawn_collectible(i % 3)
+        system.update(dt=1.0 / 60.0, speed=10.0, difficulty_t=0.0, obstacles=EntityStore(1))
+        self.assertEqual(len(system.collectibles), 64)
+        self.assertTrue(all(node.rotation_y > 0.0 for node in system.collectibles))
+
+    def test_shader_mode_uses_one_node_and_uploads_phase(self) -> None:
+        cfg = CollectibleConfig(render_mode="shader", max_active=5, pool_initial_size=5, pool_max_size=5)
+        backend = NullBackend()
+        system = CollectibleSystem(self.lane_cfg, self.world_cfg, cfg, backend=backend)
+        self.assertEqual(backend.live_nodes, 1)
+        system._spawn_collectible(0)
+        system._spawn_collectible(2)
+        system.update(dt=0.5, speed=2.0, difficulty_t=0.0, obstacles=EntityStore(1))
+        batch = system._batch
+        self.assertEqual(batch.count, 2)
+        self.assertEqual(batch.uniforms["anim_time"], 0.5)
+        slots = np.flatnonzero(system.store.active)
+        np.testing.assert_allclose(batch.positions[:2, 2], system.store.z[slots], rtol=1e-6)
+        np.testing.assert_allclose(batch.positions[:2, 3], system.store.phase[slots], rtol=1e-6)
+        self.assertEqual(system.collect_at(player_lane=0, player_z=self.world_cfg.obstacle_spawn_z - 1.0, threshold=0.5), 1)
+        self.assertEqual(backend.live_nodes, 1)
+
+    def test_far_collectibles_are_billboards_until_they_cross_the_lod_band(self) -> None:
+        cfg = CollectibleConfig(max_active=4, pool_initial_size=4, lod_near_z=30.0, lod_far_anim_interval=0)
+        backend = NullBackend()
+        system = CollectibleSystem(self.lane_cfg, self.world_cfg, cfg, backend=backend)
+        self.assertEqual(backend.live_nodes, system.draw_nodes)
+        system._spawn_collectible(1)
+        slot = int(system.active_slots()[0])
+        node, impostor = system.store.nodes[slot], system._impostors[slot]
+        self.assertFalse(node.enabled)
+        self.assertTrue(impostor.enabled)
+        # 50 -> 34: still far; neither the node tree nor the billboard moves.
+        system.update(dt=1.0, speed=16.0, difficulty_t=0.0, obstacles=EntityStore(1))
+        self.assertEqual(node.rotation_y, 0.0)
+        self.assertAlmostEqual(impostor.z, 34.0)
+        self.assertAlmostEqual(impostor.y, cfg.y)
+        # 34 -> 26: full detail, animated from this tick on.
+        system.update(dt=0.5, speed=16.0, difficulty_t=0.0, obstacles=EntityStore(1))
+        self.assertTrue(node.enabled)
+        self.assertFalse(impostor.enabled)
+        self.assertAlmostEqual(node.z, 26.0)
+        self.assertAlmostEqual(node.rotation_y, cfg.spin_speed * 1.5)
+        system.reset()
+        self.assertFalse(impostor.enabled)
+
+    def test_far_billboards_bob_at_a_reduced_rate(self) -> None:
+        cfg = CollectibleConfig(max_active=4, pool_initial_size=4, lod_near_z=10.0, lod_far_anim_interval=3)
+        system = CollectibleSystem(self.lane_cfg, self.world_cfg, cfg, backend=NullBackend())
+        system._spawn_collectible(0)
+        impostor = system._impostors[int(system.active_slots()[0])]
+        heights = []
+        for _ in range(6):
+            system.update(dt=0.1, speed=1.0, difficulty_t=0.0, obstacles=EntityStore(1))
+            heights.append(impostor.y)
+        self.assertEqual(heights[0], heights[1])
+        self.assertNotEqual(heights[1], heights[2])
+        self.assertEqual(heights[2], heights[4])
+        self.assertNotEqual(heights[4], heights[5])
+        # Skipped ticks still follow the scroll.
+        self.assertAlmostEqual(impostor.z, self.world_cfg.obstacle_spawn_z - 0.6)
+
     def test_reset_clears_collectibles(self) -> None:
         self.system._spawn_collectible(0)
         self.system._spawn_collectible(2)
@@ -118,5 +241,1201 @@ class TestCollectibleSystem(unittest.TestCase):
         self.assertEqual(len(self.system.collectibles), 0)
 
 
+class TestEntityStore(unittest.TestCase):
+    def test_bulk_advance_and_cleanup_queries(self) -> None:
+        store = EntityStore(4)
+        store.activate(2, lane=1, z=10.0)
+        store.activate(0, lane=0, z=3.0)
+        self.assertEqual(store.active_slots().tolist(), [2, 0])
+        store.advance(4.0)
+        self.assertEqual(store.slots_behind(0.0).tolist(), [0])
+        self.assertTrue(store.any_within(6.0, 0.5, lane=1))
+        self.assertFalse(store.any_within(6.0, 0.5, lane=0))
+        self.assertEqual(store.lanes_within(5.0, 2.0), {1})
+        self.assertEqual(store.lanes_within(5.0, 1.0, strict=True), set())
+
+    def test_lane_index_stays_z_ordered(self) -> None:
+        store = EntityStore(6)
+        store.activate(0, lane=1, z=20.0)
+        store.advance(5.0)
+        store.activate(1, lane=1, z=20.0)
+        store.activate(2, lane=1, z=10.0)
+        self.assertEqual(list(store.lanes[1]), [2, 0, 1])
+        self.assertTrue(store.any_within(15.0, 0.0, lane=1))
+        self.assertFalse(store.any_within(12.5, 2.0, lane=1))
+        self.assertEqual(store.slots_within(17.0, 4.0, lane=1).tolist(), [0, 1])
+
+        store.advance(11.0)
+        self.assertEqual(store.slots_behind(0.0).tolist(), [2])
+        store.deactivate(2)
+        self.assertEqual(list(store.lanes[1]), [0, 1])
+        store.deactivate(1)
+        self.assertEqual(list(store.lanes[1]), [0])
+
+    def test_sync_writes_node_transforms(self) -> None:
+        backend = NullBackend()
+        store = EntityStore(2)
+        store.nodes[0] = backend.entity()
+        store.activate(0, lane=0, z=8.0)
+        store.advance(1.5)
+        store.sync_z(store.active_slots())
+        self.assertAlmostEqual(store.nodes[0].z, 6.5)
+
+
+class TestHeadlessGameLoop(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(5)
+        self.backend = NullBackend()
+        self.game = NeonDashGame(GameConfig(), backend=self.backend)
+
+    def test_loop_runs_without_ursina(self) -> None:
+        self.assertNotIn("ursina", sys.modules)
+        self.game.input("space")
+        self.assertTrue(self.game.state.is_state(GameState.PLAYING))
+        for _ in range(120):
+            self.game.update(1.0 / 60.0)
+        self.assertGreater(self.game.elapsed_time, 1.9)
+        self.assertGreater(self.game.score, 0)
+        self.game.input("escape")
+        self.assertEqual(self.game.hud.score_display, str(self.game.score // 10))
+
+    def test_standing_still_eventually_collides(self) -> None:
+        self.game.input("space")
+        for _ in range(60 * 120):
+            self.game.update(1.0 / 60.0)
+            if self.game.state.is_state(GameState.GAME_OVER):
+                break
+        self.assertTrue(self.game.state.is_state(GameState.GAME_OVER))
+        self.assertLessEqual(
+            self.game.spawner.pool.created,
+            self.game.config.spawner.pool_max_size,
+        )
+
+        self.game.input("r")
+        self.assertTrue(self.game.state.is_state(GameState.PLAYING))
+        self.assertEqual(len(self.game.spawner.obstacles), 0)
+        self.assertEqual(len(self.game.collectibles.collectibles), 0)
+
+
+class TestFixedTimestep(unittest.TestCase):
+    def _run_until_tick(self, frame_rate: float, ticks: int) -> NeonDashGame:
+        random.seed(21)
+        game = NeonDashGame(GameConfig(), backend=NullBackend())
+        game.input("space")
+        while game.tick_count < ticks and game.state.is_state(GameState.PLAYING):
+            game.update(1.0 / frame_rate)
+        return game
+
+    def test_same_run_at_different_frame_rates(self) -> None:
+        slow = self._run_until_tick(30.0, 240)
+        fast = self._run_until_tick(144.0, 240)
+        self.assertEqual(slow.tick_count, fast.tick_count)
+        self.assertEqual(slow.score, fast.score)
+        self.assertAlmostEqual(slow.elapsed_time, fast.elapsed_time, places=9)
+        slow_store, fast_store = slow.spawner.store, fast.spawner.store
+        slow_slots, fast_slots = slow.spawner.active_slots(), fast.spawner.active_slots()
+        self.assertEqual(slow_store.lane[slow_slots].tolist(), fast_store.lane[fast_slots].tolist())
+        self.assertEqual(
+            slow_store.z[slow_slots].round(6).tolist(),
+            fast_store.z[fast_slots].round(6).tolist(),
+        )
+
+    def test_slow_frame_is_capped_by_catchup_steps(self) -> None:
+        config = GameConfig(simulation=SimulationConfig(tick_rate=60.0, max_catchup_steps=4))
+        game = NeonDashGame(config, backend=NullBackend())
+        game.input("space")
+        game.update(1.0)
+        self.assertEqual(game.tick_count, 4)
+        self.assertAlmostEqual(game.elapsed_time, 4.0 / 60.0)
+        self.assertGreater(game.dropped_time, 0.9)
+
+    def test_render_interpolates_between_ticks(self) -> None:
+        backend = NullBackend()
+        game = NeonDashGame(GameConfig(), backend=backend)
+        game.input("space")
+        game.update(1.0 / 60.0 * 1.5)
+        self.assertEqual(game.tick_count, 1)
+        step_distance = game._current_speed() / 60.0
+        self.assertAlmostEqual(backend.view_offset, 0.5 * step_distance, places=6)
+        self.assertAlmostEqual(game.player.entity.z, game.config.player.z - backend.view_offset)
+
+
+class TestMovingTrack(unittest.TestCase):
+    def _config(self, moving_track: bool, rebase_distance: float = 2000.0, **spawner: object) -> GameConfig:
+        return GameConfig(
+            world=WorldConfig(moving_track=moving_track, track_rebase_distance=rebase_distance),
+            spawner=SpawnerConfig(**spawner),
+        )
+
+    def _run(self, config: GameConfig, ticks: int) -> NeonDashGame:
+        random.seed(33)
+        game = NeonDashGame(config, backend=NullBackend())
+        game.input("space")
+        while game.tick_count < ticks and game.state.is_state(GameState.PLAYING):
+            game.update(1.0 / 60.0)
+        return game
+
+    def test_track_mode_matches_per_entity_scrolling(self) -> None:
+        fixed = self._run(self._config(False), 600)
+        moving = self._run(self._config(True, rebase_distance=150.0), 600)
+        self.assertEqual(fixed.tick_count, moving.tick_count)
+        self.assertEqual(fixed.score, moving.score)
+        fixed_slots = fixed.spawner.active_slots()
+        moving_slots = moving.spawner.active_slots()
+        self.assertEqual(
+            fixed.spawner.store.z[fixed_slots].round(6).tolist(),
+            moving.spawner.store.world_z(moving_slots).round(6).tolist(),
+        )
+
+    def test_nodes_keep_local_z_while_root_scrolls(self) -> None:
+        random.seed(5)
+        game = NeonDashGame(self._config(True), backend=NullBackend())
+        game.input("space")
+        while not game.spawner.obstacles:
+            game.update(1.0 / 60.0)
+        obstacle = game.spawner.obstacles[0]
+        slot = int(game.spawner.active_slots()[0])
+        local_z = obstacle.z
+        world_z = float(game.spawner.store.world_z(np.asarray([slot]))[0])
+        game.update(1.0 / 60.0)
+        self.assertEqual(obstacle.z, local_z)
+        self.assertLess(float(game.spawner.store.world_z(np.asarray([slot]))[0]), world_z)
+        self.assertAlmostEqual(obstacle.z + game.track.root.z, float(game.spawner.store.world_z(np.asarray([slot]))[0]))
+
+    def test_rebase_preserves_world_positions(self) -> None:
+        random.seed(5)
+        game = NeonDashGame(self._config(True, rebase_distance=1e9), backend=NullBackend())
+        game.input("space")
+        for _ in range(120):
+            game.update(1.0 / 60.0)
+        slots = game.spawner.active_slots()
+        before = game.spawner.store.world_z(slots).copy()
+        segments_before = [segment.z + game.track.root.z for segment in game.world.ground_segments]
+        game._rebase_track()
+        self.assertEqual(game.track.distance, 0.0)
+        self.assertEqual(game.spawner.store.offset, 0.0)
+        np.testing.assert_allclose(game.spawner.store.world_z(slots), before)
+        self.assertEqual([node.z for node in game.spawner.obstacles], game.spawner.store.z[slots].tolist())
+        segments_after = [segment.z + game.track.root.z for segment in game.world.ground_segments]
+        np.testing.assert_allclose(segments_after, segments_before)
+
+    def test_instanced_batch_uploads_only_when_active_set_changes(self) -> None:
+        random.seed(5)
+        game = NeonDashGame(self._config(True, instanced_rendering=True), backend=NullBackend())
+        game.input("space")
+        for _ in range(600):
+            game.update(1.0 / 60.0)
+        self.assertLess(game.spawner._batch.uploads, game.tick_count // 4)
+        self.assertIs(game.spawner._batch.parent, game.track.root)
+
+
+class TestScrollingWorld(unittest.TestCase):
+    def _game(self, **world) -> NeonDashGame:
+        config = GameConfig(world=WorldConfig(**{"render_mode": "scroll", **world}))
+        return NeonDashGame(config, backend=NullBackend())
+
+    def test_static_mesh_scrolls_by_uniform_only(self) -> None:
+        random.seed(12)
+        for moving_track in (False, True):
+            game = self._game(moving_track=moving_track, ground_segments=6)
+            world = game.world
+            self.assertEqual(world.draw_nodes, 1)
+            self.assertEqual(world.ground_segments, [])
+            self.assertEqual(len(world.mesh.quads), 1 + len(game.config.lane.x_positions))
+            self.assertIsNone(world.mesh.parent)
+            game.input("space")
+            distance = 0.0
+            for _ in range(300):
+                game.update(1.0 / 60.0)
+                distance += game._last_step_distance
+                if not game.state.is_state(GameState.PLAYING):
+                    break
+            self.assertEqual(tuple(world.mesh.position), (0.0, 0.0, 0.0))
+            scroll = world.mesh.uniforms["scroll"]
+            self.assertGreaterEqual(scroll, 0.0)
+            self.assertLess(scroll, game.config.world.stripe_spacing)
+            self.assertAlmostEqual(scroll, distance % game.config.world.stripe_spacing, places=6)
+
+    def test_quality_tiers_clip_draw_distance_and_replays_ignore_mode(self) -> None:
+        game = self._game()
+        far = game.world.mesh.uniforms["draw_distance"]
+        game.world.set_visible_segments(2)
+        self.assertLess(game.world.mesh.uniforms["draw_distance"], far)
+        game.world.set_visible_segments(0)
+        self.assertEqual(game.world.mesh.uniforms["draw_distance"], far)
+        self.assertEqual(config_hash(game.config), config_hash(GameConfig()))
+        with self.assertRaises(ValueError):
+            self._game(render_mode="tiles")
+
+
+class TestStartupLoading(unittest.TestCase):
+    def _game(self, async_loading: bool = True) -> NeonDashGame:
+        config = GameConfig(
+            startup=StartupConfig(async_loading=async_loading, frame_budget_ms=0.0, log_report=False),
+        )
+        return NeonDashGame(config, backend=NullBackend())
+
+    def test_prewarm_is_spread_across_frames(self) -> None:
+        game = self._game()
+        self.assertTrue(game.loading)
+        self.assertEqual(game.spawner.pool.created, 0)
+        self.assertEqual(game.collectibles.pool.created, 0)
+
+        game.update(1.0 / 60.0)
+        self.assertEqual(game.spawner.pool.created, 1)
+        frames = 1
+        while game.loading:
+            game.update(1.0 / 60.0)
+            frames += 1
+
+        expected = game.config.spawner.pool_initial_size + game.config.collectible.pool_initial_size
+        # Pool items plus the HUD digit glyph slots, one unit per frame.
+        self.assertGreater(frames, expected)
+        self.assertEqual(game.spawner.pool.created, game.config.spawner.pool_initial_size)
+        self.assertEqual(game.collectibles.pool.created, game.config.collectible.pool_initial_size)
+
+        report = game.loader.report()
+        self.assertIsNotNone(report.first_frame_seconds)
+        self.assertGreaterEqual(report.warm_seconds, report.first_frame_seconds)
+        self.assertEqual(report.warm_frames, frames)
+        steps = {phase.name: phase.steps for phase in report.phases}
+        self.assertEqual(steps["obstacle_pool"], game.config.spawner.pool_initial_size)
+        self.assertEqual(steps["collectible_pool"], game.config.collectible.pool_initial_size)
+        self.assertIn("systems", steps)
+        self.assertIn("hud_glyphs", steps)
+        self.assertIn("warm=", report.format())
+
+    def test_space_finishes_loading_before_run_starts(self) -> None:
+        game = self._game()
+        game.update(1.0 / 60.0)
+        game.input("space")
+        self.assertFalse(game.loading)
+        self.assertTrue(game.state.is_state(GameState.PLAYING))
+        self.assertEqual(game.spawner.pool.created, game.config.spawner.pool_initial_size)
+
+    def test_synchronous_loading_builds_everything_up_front(self) -> None:
+        game = self._game(async_loading=False)
+        self.assertFalse(game.loading)
+        self.assertEqual(game.spawner.pool.created, game.config.spawner.pool_initial_size)
+        self.assertEqual(game.collectibles.pool.created, game.config.collectible.pool_initial_size)
+
+
+class TestBakedAssetCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_miss_bakes_then_next_launch_hits(self) -> None:
+        key = asset_key(GameConfig())
+        first = BakedAssetCache(NullBackend(), self.directory, key)
+        self.assertFalse(first.load_or_bake())
+        self.assertTrue(os.path.exists(first.path))
+
+        backend = NullBackend()
+        second = BakedAssetCache(backend, self.directory, key)
+        self.assertTrue(second.load_or_bake())
+        self.assertEqual(backend.asset("collectible_glow"), {"model": "quad"})
+        self.assertEqual(NullBackend().asset("collectible_glow"), {"model": "quad", "texture": "circle"})
+
+    def test_config_change_rebuilds_and_prunes_old_bundle(self) -> None:
+        old_key = asset_key(GameConfig())
+        new_key = asset_key(GameConfig(world=WorldConfig(road_width=12.0)))
+        self.assertNotEqual(old_key, new_key)
+        self.assertEqual(old_key, asset_key(GameConfig()))
+        # Gameplay-only changes and profile switches keep the baked bundle.
+        for config in (
+            GameConfig(spawner=SpawnerConfig(pool_max_size=90, start_min_spawn_interval=0.5)),
+            GameConfig(collectible=CollectibleConfig(max_active=3, reward_score=9)),
+            ProfileRegistry().load("hardcore"),
+        ):
+            self.assertEqual(asset_key(config), old_key)
+
+        old = BakedAssetCache(NullBackend(), self.directory, old_key)
+        old.load_or_bake()
+        new = BakedAssetCache(NullBackend(), self.directory, new_key)
+        self.assertFalse(new.load_or_bake())
+        self.assertEqual(os.listdir(self.directory), [os.path.basename(new.path)])
+
+    def test_unreadable_bundle_falls_back_to_rebuild(self) -> None:
+        cache = BakedAssetCache(NullBackend(), self.directory, "broken")
+        with open(cache.path, "w", encoding="utf-8") as handle:
+            handle.write("not a bundle")
+        self.assertFalse(cache.load_or_bake())
+        self.assertTrue(BakedAssetCache(NullBackend(), self.directory, "broken").load_or_bake())
+
+    def test_systems_build_from_named_assets(self) -> None:
+        backend = NullBackend()
+        BakedAssetCache(backend, self.directory, "k").load_or_bake(ASSET_SPECS)
+        game = NeonDashGame(GameConfig(), backend=backend)
+        game.finish_loading()
+        self.assertIsNone(game.asset_cache)
+        obstacle = game.spawner.store.nodes[0]
+        self.assertEqual(obstacle.model, "cube")
+        self.assertFalse(hasattr(obstacle, "collider"))
+
+
+class _CountingBackend(NullBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.aspect_queries = 0
+
+    def aspect_ratio(self) -> float:
+        self.aspect_queries += 1
+        return super().aspect_ratio()
+
+
+class TestHudView(unittest.TestCase):
+    def _shown_digits(self, counter) -> str:
+        digits = []
+        for glyphs in counter._slots:
+            enabled = [index for index, glyph in enumerate(glyphs) if glyph.enabled]
+            self.assertLessEqual(len(enabled), 1)
+            digits.append(str(enabled[0]) if enabled else " ")
+        return "".join(digits)
+
+    def test_text_fallback_rebuilds_only_at_refresh_rate(self) -> None:
+        hud = HudView(backend=NullBackend(), counter_refresh_rate=10.0, glyph_counters=False)
+        hud.set_state(GameState.PLAYING)
+        writes = hud.text_writes
+        for frame in range(60):
+            hud.update(1.0 / 60.0)
+            hud.set_elapsed_time((frame + 1) / 60.0)
+            hud.set_score(7)
+        self.assertLessEqual(hud.text_writes - writes, 11)
+        self.assertEqual(hud.score_text.text, "Score: 7")
+
+        hud.set_state(GameState.PLAYING)
+        writes = hud.text_writes
+        for _ in range(30):
+            hud.update(1.0 / 60.0)
+            hud.set_elapsed_time(1.0)
+            hud.set_score(7)
+        self.assertEqual(hud.text_writes - writes, 0)
+
+    def test_glyph_counters_show_values_without_text_writes(self) -> None:
+        hud = HudView(backend=NullBackend(), counter_refresh_rate=0.0)
+        hud.build_glyphs()
+        self.assertFalse(hud.score_text.enabled)
+        writes = hud.text_writes
+        hud.set_score(4096)
+        hud.set_elapsed_time(83.456)
+        self.assertEqual(hud.text_writes, writes)
+        self.assertEqual(self._shown_digits(hud.score_counter), "4096     ")
+        self.assertEqual(self._shown_digits(hud.time_counter), "012345")
+        self.assertEqual(hud.time_display, "01:23.45")
+        texts = [glyph.text for glyph in hud.time_counter.static]
+        self.assertEqual(texts, list("Time:") + [":", "."])
+
+        hud.set_elapsed_time(3600 * 2 + 5.5)
+        self.assertEqual(hud.time_display, "02:00:05.50")
+        self.assertFalse(hud.time_counter.enabled)
+        self.assertEqual(self._shown_digits(hud._time_hours_counter), "02000550")
+
+    def test_score_beyond_digit_slots_is_clamped(self) -> None:
+        hud = HudView(backend=NullBackend(), counter_refresh_rate=0.0)
+        hud.build_glyphs()
+        hud.set_score(1234567890)
+        self.assertEqual(self._shown_digits(hud.score_counter), "999999999")
+        self.assertEqual(hud.score_display, "999999999")
+        text_hud = HudView(backend=NullBackend(), counter_refresh_rate=0.0, glyph_counters=False)
+        text_hud.set_score(1234567890)
+        self.assertEqual(text_hud.score_text.text, "Score: 999999999")
+
+    def test_game_over_shows_final_score_and_time(self) -> None:
+        config = GameConfig(
+            hud=replace(GameConfig().hud, counter_refresh_rate=1.0),
+            startup=StartupConfig(async_loading=False, log_report=False),
+        )
+        game = NeonDashGame(config, backend=NullBackend())
+        game.input("space")
+        for _ in range(60 * 120):
+            game.update(1.0 / 60.0)
+            if game.state.is_state(GameState.GAME_OVER):
+                break
+        self.assertTrue(game.state.is_state(GameState.GAME_OVER))
+        self.assertEqual(game.hud.score_display, str(game.score // 10))
+        self.assertEqual(game.hud._shown_centis, int(game.elapsed_time * 100.0))
+        for _ in range(30):
+            game.update(1.0 / 60.0)
+        self.assertEqual(game.hud.score_display, str(game.score // 10))
+
+    def test_layout_polls_aspect_ratio_at_interval(self) -> None:
+        backend = _CountingBackend()
+        hud = HudView(backend=backend, layout_poll_interval=0.5)
+        queries = backend.aspect_queries
+        for _ in range(60):
+            hud.update(1.0 / 60.0)
+        self.assertLessEqual(backend.aspect_queries - queries, 2)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_laps_accumulate_per_phase_and_ring_buffer_wraps(self) -> None:
+        clock = _FakeClock()
+        profiler = FrameProfiler(("a", "b"), capacity=4, clock=clock)
+        for frame in range(6):
+            profiler.begin_frame()
+            clock.now += 0.001
+            profiler.lap(0)
+            clock.now += 0.002 * (frame + 1)
+            profiler.lap(1)
+            clock.now += 0.001
+            profiler.mark()
+            clock.now += 0.001
+            profiler.lap(0)
+            clock.now += 0.0005
+            profiler.end_frame()
+
+        self.assertEqual(profiler.frames, 6)
+        self.assertEqual(profiler.count, 4)
+        recent = profiler.recent()
+        np.testing.assert_allclose(recent[:, 0], [2.0, 2.0, 2.0, 2.0])
+        np.testing.assert_allclose(recent[:, 1], [6.0, 8.0, 10.0, 12.0])
+        np.testing.assert_allclose(recent[:, 2], recent[:, 1] + 3.5)
+        summary = profiler.summary()
+        self.assertAlmostEqual(summary["b"].max, 12.0)
+        self.assertAlmostEqual(summary["b"].p50, 9.0)
+        self.assertLessEqual(summary["frame"].p95, summary["frame"].p99)
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        profiler = FrameProfiler(enabled=False)
+        profiler.begin_frame()
+        profiler.lap(0)
+        profiler.end_frame()
+        self.assertEqual(profiler.count, 0)
+
+    def test_game_times_every_phase_and_dumps(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            config = GameConfig(
+                profiler=ProfilerConfig(output_dir=directory),
+                startup=StartupConfig(log_report=False),
+            )
+            random.seed(4)
+            game = NeonDashGame(config, backend=NullBackend())
+            game.input("space")
+            for _ in range(90):
+                game.update(1.0 / 60.0)
+            self.assertEqual(game.profiler.count, 90)
+            totals = game.profiler.recent().sum(axis=0)
+            self.assertTrue(all(value > 0.0 for value in totals), dict(zip(game.profiler.columns, totals)))
+
+            game.input("f3")
+            self.assertTrue(game.profiler_overlay.visible)
+            game.update(1.0 / 60.0)
+            self.assertIn("collectibles", game.profiler_overlay.text.text)
+
+            json_path, csv_path = game.dump_profile()
+            with open(json_path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+            self.assertEqual(payload["columns"], list(PHASES) + ["frame"])
+            self.assertEqual(len(payload["samples_ms"]), 91)
+            with open(csv_path, encoding="utf-8") as handle:
+                self.assertEqual(len(handle.read().splitlines()), 92)
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_stress_run_is_deterministic_and_compares_against_baseline(self) -> None:
+        first = run_benchmark("stress", seconds=5.0, seed=3, alloc_frames=60)
+        second = run_benchmark("stress", seconds=5.0, seed=3, alloc_frames=60)
+        for metric in ("runs", "score", "peak_obstacles", "peak_collectibles", "cap_hits", "pools"):
+            self.assertEqual(first[metric], second[metric], metric)
+        self.assertGreater(first["peak_obstacles"], 0)
+        self.assertEqual(set(first["pools"]), {"obstacles", "collectibles"})
+        self.assertLessEqual(first["frame_us_p50"], first["frame_us_p99"])
+
+        self.assertGreater(first["calibration_us"], 0.0)
+        self.assertEqual(compare(first, second), [])
+
+        # Timings are reported only, unless gated.
+        slower = dict(first, frame_rel_p95=first["frame_rel_p95"] * 2.0)
+        self.assertEqual(compare(slower, first), [])
+        self.assertEqual(len(compare(slower, first, tolerance=0.25, timings=True)), 1)
+        drifted = dict(first, peak_obstacles=first["peak_obstacles"] + 1)
+        self.assertIn("peak_obstacles", compare(drifted, first)[0])
+        pools = dict(first["pools"], obstacles=dict(first["pools"]["obstacles"], misses=99))
+        self.assertIn("pool obstacles misses", compare(dict(first, pools=pools), first)[0])
+
+class TestReplay(unittest.TestCase):
+    def _record(self, config: GameConfig, frame_rate: float) -> NeonDashGame:
+        game = NeonDashGame(config, backend=NullBackend())
+        game.input("space")
+        frame = 0
+        while game.state.is_state(GameState.PLAYING) and frame < 60 * 60:
+            frame += 1
+            if frame % 37 == 0:
+                game.input("a" if (frame // 37) % 3 else "d")
+            game.update(1.0 / frame_rate)
+        return game
+
+    def test_encode_round_trip(self) -> None:
+        replay = Replay(2**63 - 5, b"\x01" * 8, [(0, MOVE_LEFT), (3, MOVE_RIGHT), (900, MOVE_RIGHT)], 1200, 57)
+        data = replay.encode()
+        self.assertEqual(Replay.decode(data), replay)
+        # Each input is one or two varint bytes after the fixed header.
+        self.assertLessEqual(len(data), 34 + 5)
+        with self.assertRaises(ReplayError):
+            Replay.decode(data[:-1])
+        with self.assertRaises(ReplayError):
+            Replay.decode(b"XXXX" + data[4:])
+
+    def test_seeded_config_repeats_run(self) -> None:
+        config = GameConfig(simulation=SimulationConfig(seed=99))
+        first = self._record(config, 60.0)
+        second = self._record(config, 60.0)
+        self.assertEqual(first.run_seed, second.run_seed)
+        self.assertEqual(first.tick_count, second.tick_count)
+        self.assertEqual(first.score, second.score)
+
+    def test_player_reproduces_recorded_run(self) -> None:
+        config = GameConfig(simulation=SimulationConfig(seed=12), startup=StartupConfig(log_report=False))
+        recorded = self._record(config, 144.0)
+        replay = recorded.current_replay()
+        self.assertGreater(len(replay.inputs), 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = replay.save(os.path.join(directory, "run.ndr"))
+            loaded = Replay.load(path)
+        self.assertEqual(loaded, replay)
+
+        random.seed(1234)
+        game = NeonDashGame(config, backend=NullBackend())
+        result = ReplayPlayer(game, loaded).run()
+        self.assertTrue(result.matches(loaded))
+        self.assertEqual(result.game_over, recorded.state.is_state(GameState.GAME_OVER))
+        self.assertEqual(game.player.lane_index, recorded.player.lane_index)
+
+    def test_player_rejects_other_gameplay_config(self) -> None:
+        replay = Replay(1, config_hash(GameConfig()), [], 10, 0)
+        other = GameConfig(simulation=SimulationConfig(tick_rate=30.0))
+        self.assertNotEqual(config_hash(other), replay.config_hash)
+        self.assertEqual(config_hash(GameConfig(spawner=SpawnerConfig(instanced_rendering=True))), replay.config_hash)
+        with self.assertRaises(ReplayError):
+            ReplayPlayer(NeonDashGame(other, backend=NullBackend()), replay)
+
+
+class TestPatternLookahead(unittest.TestCase):
+    def _config(self, mode: str = "idle") -> GameConfig:
+        return GameConfig(
+            spawner=SpawnerConfig(start_two_obstacle_chance=0.8, end_two_obstacle_chance=0.9),
+            collectible=CollectibleConfig(start_min_spawn_interval=0.2, start_max_spawn_interval=0.3),
+            simulation=SimulationConfig(seed=8),
+            patterns=PatternConfig(mode=mode),
+            startup=StartupConfig(log_report=False),
+        )
+
+    def test_plan_keeps_lanes_open_and_spacing(self) -> None:
+        config = self._config()
+        generator = PatternGenerator(config, random.Random(1), random.Random(2))
+        obstacles, collectibles = [], []
+        distance_before = {}
+        for _ in range(60 * 60):
+            distance_before[generator.tick + 1] = generator.distance
+            for event in generator.plan(1):
+                self.assertLess(len(event.obstacle_lanes), len(config.lane.x_positions))
+                for lane in event.obstacle_lanes:
+                    obstacles.append((distance_before[event.tick], lane))
+                if event.collectible_lane >= 0:
+                    collectibles.append((generator.distance, event.collectible_lane))
+        self.assertGreater(len(obstacles), 50)
+        self.assertGreater(len(collectibles), 50)
+        min_distance = config.collectible.min_obstacle_distance_z
+        for c_distance, c_lane in collectibles:
+            for o_distance, o_lane in obstacles:
+                if o_lane == c_lane:
+                    self.assertGreaterEqual(abs(c_distance - o_distance), min_distance)
+
+    def test_idle_fill_stays_within_horizon(self) -> None:
+        generator = PatternGenerator(self._config(), random.Random(1), random.Random(2))
+        queue = PatternQueue(generator, horizon_ticks=120)
+        queue.reset()
+        queue.fill(budget_ms=1000.0)
+        self.assertEqual(queue.planned_ticks, 120)
+        self.assertEqual(queue.starved_ticks, 0)
+        for tick in range(1, 121):
+            queue.take(tick)
+        self.assertEqual(queue.planned_ticks, 0)
+        queue.take(121)
+        self.assertEqual(queue.starved_ticks, 1)
+
+    def test_thread_and_idle_modes_play_the_same_run(self) -> None:
+        results = []
+        for mode in ("idle", "thread"):
+            game = NeonDashGame(self._config(mode), backend=NullBackend())
+            game.input("space")
+            while game.tick_count < 1200 and game.state.is_state(GameState.PLAYING):
+                if game.tick_count % 50 == 0:
+                    game.input("a" if game.tick_count % 100 else "d")
+                game.update(1.0 / 60.0)
+            game.patterns.stop()
+            slots = game.spawner.active_slots()
+            results.append((game.tick_count, game.score, game.spawner.store.lane[slots].tolist()))
+        self.assertEqual(results[0], results[1])
+
+    def test_config_swap_waits_for_the_worker(self) -> None:
+        faster = replace(
+            self._config(),
+            spawner=replace(self._config().spawner, start_min_spawn_interval=0.3, start_max_spawn_interval=0.4),
+        )
+        results = []
+        for mode in ("idle", "thread"):
+            generator = PatternGenerator(self._config(mode), random.Random(1), random.Random(2))
+            queue = PatternQueue(generator, horizon_ticks=120, mode=mode)
+            queue.reset()
+            queue.fill(budget_ms=1000.0)
+            for tick in range(1, 61):
+                queue.take(tick)
+            queue.fill(budget_ms=1000.0)
+            with queue._cond:
+                while queue.planned_ticks < queue.horizon_ticks:
+                    queue._cond.wait(0.01)
+            worker = queue._worker
+            queue.set_config(faster)
+            self.assertIs(generator.config, faster)
+            if mode == "thread":
+                self.assertIsNot(queue._worker, worker)
+                self.assertTrue(queue._worker.is_alive())
+            queue.fill(budget_ms=1000.0)
+            results.append([queue.take(tick) for tick in range(61, 600)])
+            queue.stop()
+        self.assertEqual(results[0], results[1])
+
+    def test_planned_spawns_fit_the_caps(self) -> None:
+        config = replace(
+            self._config(),
+            spawner=replace(self._config().spawner, pool_max_size=4),
+            collectible=replace(self._config().collectible, max_active=1),
+        )
+        game = NeonDashGame(config, backend=NullBackend())
+        planned, dropped = [0, 0], [0, 0]
+        place_collectible, spawn_obstacle = game.collectibles.place, game.spawner._spawn_obstacle
+
+        def place(lane: int, phase: float) -> None:
+            planned[1] += 1
+            dropped[1] += game.collectibles.store.count >= game.collectibles.max_active
+            place_collectible(lane, phase)
+
+        def spawn(lane: int) -> bool:
+            planned[0] += 1
+            spawned = spawn_obstacle(lane)
+            dropped[0] += not spawned
+            return spawned
+
+        game.collectibles.place = place
+        game.spawner._spawn_obstacle = spawn
+        bot = DodgeBot(game)
+        for _ in range(60 * 60):
+            if not game.state.is_state(GameState.PLAYING):
+                game.input("space")
+            key = bot.act()
+            if key:
+                game.input(key)
+            game.update(1.0 / 60.0)
+        self.assertGreater(planned[0], 20)
+        self.assertGreater(planned[1], 5)
+        # Nothing planned is dropped, so no unplaced spawn blocks a lane.
+        self.assertEqual(dropped, [0, 0])
+
+    def test_adjustable_spawn_caps_plan_inline(self) -> None:
+        config = replace(self._config(), quality=QualityConfig(adjust_spawn_caps=True))
+        self.assertIsNone(NeonDashGame(config, backend=NullBackend()).patterns)
+
+    def test_live_collectibles_keep_clear_of_obstacles(self) -> None:
+        game = NeonDashGame(self._config(), backend=NullBackend())
+        game.input("space")
+        min_distance = game.config.collectible.min_obstacle_distance_z
+        spawn_z = game.config.world.obstacle_spawn_z
+        spawned = 0
+        while game.tick_count < 1800 and game.state.is_state(GameState.PLAYING):
+            game.update(1.0 / 60.0)
+            store = game.collectibles.store
+            for slot in store.slots_within(spawn_z, 1e-6).tolist():
+                spawned += 1
+                lane = int(store.lane[slot])
+                self.assertFalse(game.spawner.store.any_within(spawn_z, min_distance, lane=lane, strict=True))
+        self.assertGreater(spawned, 0)
+
+
+class TestPresetTuner(unittest.TestCase):
+    def test_runs_are_reproducible_and_report_pool_caps(self) -> None:
+        tight = apply_overrides(GameConfig(), ["spawner.pool_max_size=2", "patterns.mode=inline"])
+        self.assertEqual(tight.spawner.pool_max_size, 2)
+        self.assertEqual(tight.patterns.mode, "inline")
+        presets = {"default": GameConfig(), "tight": tight}
+        jobs = make_jobs(presets, runs=3, max_seconds=20.0, chunk=2)
+        self.assertEqual(len(jobs), 4)
+        first = run_jobs(jobs, workers=1)
+        second = run_jobs(jobs, workers=1)
+        self.assertEqual(first, second)
+
+        summary = summarize(GameConfig(), first["default"])
+        self.assertEqual(summary["runs"], 3)
+        self.assertLessEqual(summary["survival_seconds"]["p10"], summary["survival_seconds"]["p90"])
+        self.assertLessEqual(summary["survival_seconds"]["max"], 20.0 + 1e-6)
+        self.assertEqual(summary["cap_hits"], 0)
+        self.assertGreater(summary["obstacles_per_second"], 0.0)
+        self.assertGreater(summarize(tight, first["tight"])["cap_hits"], 0)
+        with self.assertRaises(ValueError):
+            apply_overrides(GameConfig(), ["spawner.nope=1"])
+
+
+class TestBatchSimulator(unittest.TestCase):
+    def test_matches_object_systems_on_the_same_spawn_plans(self) -> None:
+        config = tuning_config(GameConfig())
+        seeds = tuple(range(40, 46))
+        _, runs = run_job(TuneJob("default", config, seeds, max_seconds=30.0))
+        plans = []
+        for seed in seeds:
+            streams = RandomStreams(seed)
+            generator = PatternGenerator(
+                config,
+                streams.stream("obstacle_patterns"),
+                streams.stream("collectible_patterns"),
+            )
+            plans.append(generator.plan(30 * 60))
+        batch = BatchSimulator(config, 0, plans=plans).run(30.0)
+        for index, run in enumerate(runs):
+            self.assertAlmostEqual(float(batch.survival_seconds[index]), run.survival_seconds, places=9)
+            self.assertEqual(bool(batch.crashed[index]), run.crashed)
+            self.assertEqual(int(batch.score[index]), run.score)
+            self.assertEqual(int(batch.pickups[index]), run.pickups)
+            self.assertEqual(int(batch.obstacles_spawned[index]), run.obstacles_spawned)
+            self.assertEqual(int(batch.peak_collectibles[index]), run.peak_collectibles)
+
+    def test_drawn_plans_are_seeded_and_respect_pool_caps(self) -> None:
+        config = GameConfig(spawner=SpawnerConfig(pool_max_size=3))
+        first = BatchSimulator(config, 256, seed=5, bot_interval=0).run(20.0)
+        second = BatchSimulator(config, 256, seed=5, bot_interval=0).run(20.0)
+        np.testing.assert_array_equal(first.score, second.score)
+        self.assertLessEqual(int(first.peak_obstacles.max()), 3)
+        self.assertGreater(int(first.obstacle_cap_hits.sum()), 0)
+        dodging = BatchSimulator(GameConfig(), 256, seed=5).run(20.0)
+        self.assertGreater(dodging.survival_seconds.mean(), first.survival_seconds.mean())
+        self.assertGreater(int(dodging.pickups.sum()), 0)
+
+
+class TestSoak(unittest.TestCase):
+    def test_flags_only_monotonic_growth(self) -> None:
+        series = {
+            "leak": [100.0 + 10.0 * index + (index % 3) for index in range(20)],
+            "plateau": [min(100.0, 20.0 * index) for index in range(20)],
+            "per_run": [float(index % 5) * 30.0 for index in range(20)],
+        }
+        self.assertEqual([growth.series for growth in find_growth(series)], ["leak"])
+
+    def test_short_soak_restarts_pauses_and_stays_flat(self) -> None:
+        # tracemalloc needs a longer run to get past one-off warm-up allocations.
+        settings = SoakSettings(
+            hours=0.05,
+            sample_seconds=6.0,
+            max_run_seconds=20.0,
+            pause_every_seconds=15.0,
+            trace=False,
+        )
+        report = run_soak(GameConfig(), settings)
+        self.assertGreater(report["game_overs"], 1)
+        self.assertGreater(report["pauses"], 1)
+        series = report["series"]
+        self.assertEqual(len(set(series["scene_nodes"])), 1)
+        # The animation clock restarts with every run.
+        self.assertLessEqual(max(series["anim_time"]), settings.max_run_seconds + 30.0)
+        self.assertEqual(report["growth"], [])
+
+
+class TestQualityController(unittest.TestCase):
+    def _controller(self, **overrides) -> tuple[QualityController, list[str]]:
+        applied: list[str] = []
+        cfg = QualityConfig(window_seconds=1.0, upgrade_hold_seconds=3.0, **overrides)
+        return QualityController(cfg, lambda tier: applied.append(tier.name)), applied
+
+    @staticmethod
+    def _play(controller: QualityController, seconds: float, frame_ms: float) -> None:
+        # Start each phase on a window boundary.
+        controller.reset_window()
+        for _ in range(int(seconds * 1000.0 / frame_ms)):
+            controller.observe(frame_ms / 1000.0)
+
+    def test_steps_down_on_slow_frames_and_back_up_with_hysteresis(self) -> None:
+        controller, applied = self._controller()
+        self.assertEqual(applied, ["high"])
+        self._play(controller, 2.2, 25.0)
+        self.assertEqual(applied, ["high", "medium", "low"])
+        # Just over budget but under the downgrade margin: hold the tier.
+        self._play(controller, 5.0, 18.5)
+        self.assertEqual(controller.tier.name, "low")
+        self._play(controller, 3.2, 1000.0 / 60.0)
+        self.assertEqual(controller.tier.name, "medium")
+        # The upgrade did not hold, so the next one needs twice as long.
+        self._play(controller, 1.0, 25.0)
+        self.assertEqual(controller.tier.name, "low")
+        self._play(controller, 4.0, 1000.0 / 60.0)
+        self.assertEqual(controller.tier.name, "low")
+        self._play(controller, 3.0, 1000.0 / 60.0)
+        self.assertEqual(controller.tier.name, "medium")
+        self._play(controller, 10.0, 60.0)
+        self.assertEqual(controller.tier, QUALITY_TIERS[-1])
+
+    def test_never_steps_above_max_tier(self) -> None:
+        controller, applied = self._controller(start_tier="high", max_tier="medium")
+        self.assertEqual(applied, ["medium"])
+        self._play(controller, 1.2, 25.0)
+        self.assertEqual(controller.tier.name, "low")
+        self._play(controller, 20.0, 5.0)
+        self.assertEqual(applied, ["medium", "low", "medium"])
+
+    def test_fixed_tier_when_not_adaptive(self) -> None:
+        controller, applied = self._controller(adaptive=False, start_tier="low")
+        self._play(controller, 5.0, 40.0)
+        self.assertEqual(applied, ["low"])
+
+    def test_window_restarts_after_a_pause(self) -> None:
+        game = NeonDashGame(GameConfig(quality=QualityConfig(window_seconds=1.0)), backend=NullBackend())
+        game.input("space")
+        for _ in range(10):
+            game.update(0.05)
+        self.assertGreater(game.quality._window_time, 0.0)
+        game.input("p")
+        game.input("p")
+        while not game.state.is_state(GameState.PLAYING):
+            game.update(0.05)
+        self.assertEqual(game.quality._window_time, 0.0)
+
+    def test_game_applies_tiers_to_collectibles_world_and_hud(self) -> None:
+        random.seed(9)
+        config = GameConfig(quality=QualityConfig(window_seconds=0.5, adjust_spawn_caps=True))
+        game = NeonDashGame(config, backend=NullBackend())
+        game.input("space")
+        for _ in range(300):
+            game.update(0.05)
+            if game.state.is_state(GameState.GAME_OVER):
+                game.input("r")
+        self.assertEqual(game.quality.tier.name, "minimal")
+        self.assertIn("minimal", game.hud.fps_text.text)
+        collectible = game.collectibles.store.nodes[0]
+        self.assertFalse(collectible.glow.enabled)
+        self.assertFalse(collectible.outer_ring.enabled)
+        visible = [segment for segment in game.world.ground_segments if segment.enabled]
+        self.assertEqual(len(visible), QUALITY_TIERS[-1].ground_segments)
+        self.assertLess(max(segment.z for segment in visible), min(
+            segment.z for segment in game.world.ground_segments if not segment.enabled
+        ))
+        self.assertLess(game.collectibles.max_active, config.collectible.max_active)
+
+
+class TestProfiles(unittest.TestCase):
+    def _registry(self, files: dict[str, str]) -> ProfileRegistry:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        directory = temp.name
+        for name, text in files.items():
+            with open(os.path.join(directory, name), "w", encoding="utf-8") as handle:
+                handle.write(text)
+        return ProfileRegistry(directory)
+
+    def test_preset_files_load(self) -> None:
+        registry = ProfileRegistry()
+        self.assertEqual(registry.load("default"), GameConfig())
+        self.assertEqual(registry.load("low_spec"), LOW_SPEC_STABILITY_CONFIG)
+        for name in registry.names():
+            self.assertEqual(registry.load(name).profile, name)
+        custom = registry.load("custom")
+        self.assertEqual(custom.movement, LOW_SPEC_STABILITY_CONFIG.movement)
+        self.assertLess(custom.collectible.max_active, LOW_SPEC_STABILITY_CONFIG.collectible.max_active)
+
+    def test_base_inheritance_and_errors(self) -> None:
+        registry = self._registry({
+            "kiosk.json": '{"base": "slow", "spawner": {"pool_max_size": 20}}',
+            "slow.toml": 'base = "kiosk"\n',
+            "slow2.toml": '[movement]\nstart_speed = 8\n',
+            "loop.json": '{"base": "loop"}',
+        })
+        with self.assertRaises(ProfileError):
+            registry.load("kiosk")
+        config = config_from_dict({"base": "x", "movement": {"start_speed": 8}})
+        self.assertEqual(config.movement.start_speed, 8.0)
+        self.assertIsInstance(config.movement.start_speed, float)
+        self.assertEqual(registry.load("slow2").profile, "slow2")
+        for bad in (
+            {"movment": {}},
+            {"movement": {"top_speed": 1.0}},
+            {"spawner": {"pool_max_size": 2.5}},
+            {"spawner": {"instanced_rendering": 1}},
+            {"lane": {"x_positions": [0.0, 1.0]}},
+        ):
+            with self.assertRaises(ProfileError):
+                config_from_dict(bad)
+        with self.assertRaises(ProfileError):
+            registry.load("missing")
+
+    def test_enumerated_fields_reject_unknown_names(self) -> None:
+        for section, name, good in (
+            ("pacing", "mode", "half_refresh"),
+            ("patterns", "mode", "thread"),
+            ("quality", "start_tier", "low"),
+            ("collectible", "render_mode", "shader"),
+            ("world", "render_mode", "scroll"),
+            ("hud", "resume_countdown_style", "cyber"),
+        ):
+            self.assertEqual(getattr(getattr(config_from_dict({section: {name: good}}), section), name), good)
+            with self.assertRaises(ProfileError) as raised:
+                config_from_dict({section: {name: "vsinc"}})
+            self.assertIn(f"{section}.{name}", str(raised.exception))
+        # main.py then falls back to the built-in config instead of crashing.
+        registry = self._registry({"typo.json": '{"pacing": {"mode": "vsinc"}}'})
+        config = main._launch_config(registry, main._parse_args(["--profile", "typo"]))
+        self.assertEqual(config.pacing.mode, "vsync")
+
+    def test_live_config_keeps_restart_only_fields(self) -> None:
+        current = GameConfig()
+        requested = config_from_dict({
+            "world": {"ground_segments": 2},
+            "spawner": {"instanced_rendering": True, "pool_max_size": 20},
+            "movement": {"start_speed": 9.0},
+        })
+        effective, pending = live_config(current, requested)
+        self.assertEqual(pending, ["world.ground_segments", "spawner.instanced_rendering"])
+        self.assertEqual(effective.world, current.world)
+        self.assertFalse(effective.spawner.instanced_rendering)
+        self.assertEqual(effective.spawner.pool_max_size, 20)
+        self.assertEqual(effective.movement.start_speed, 9.0)
+
+    def test_live_switch_trims_and_grows_pools(self) -> None:
+        random.seed(4)
+        registry = self._registry({
+            "big.json": '{"spawner": {"pool_initial_size": 30, "pool_max_size": 90}, '
+            '"collectible": {"pool_initial_size": 40, "pool_max_size": 40, "render_mode": "shader"}}',
+            "small.json": '{"spawner": {"pool_initial_size": 4, "pool_max_size": 10}, '
+            '"collectible": {"pool_initial_size": 2, "pool_max_size": 6, "max_active": 3}}',
+        })
+        backend = NullBackend()
+        game = NeonDashGame(GameConfig(), backend=backend, profiles=registry)
+        game.finish_loading()
+        baseline_nodes = backend.live_nodes
+        self.assertEqual(game.switch_profile("small"), [])
+        self.assertEqual(game.spawner.pool.created, 4)
+        self.assertEqual(game.collectibles.pool.created, 2)
+        self.assertEqual(game.collectibles.max_active, 3)
+        self.assertLess(backend.live_nodes, baseline_nodes)
+
+        # Mid-run switches wait for a pause; slots in use are trimmed on reset.
+        game.input("space")
+        for _ in range(240):
+            game.update(1.0 / 60.0)
+        self.assertIsNone(game.switch_profile("big"))
+        game.input("p")
+        self.assertEqual(game.switch_profile("big"), ["collectible.render_mode"])
+        self.assertEqual(game.spawner.store.capacity, 90)
+        self.assertEqual(game.spawner.pool.created, 30)
+        self.assertEqual(game.collectibles.store.capacity, 40)
+        self.assertEqual(game.config.collectible.render_mode, "nodes")
+        self.assertEqual(game.config.profile, "big")
+        game.input("p")
+        game.update(3.5)
+        for _ in range(120):
+            game.update(1.0 / 60.0)
+        game.input("p")
+        game.input(game.config.profiles.cycle_key)
+        self.assertEqual(game.config.profile, "small")
+        self.assertGreater(game.spawner.pool.created, 4)
+        game.input("p")
+        game.update(3.5)
+        for _ in range(60 * 120):
+            game.update(1.0 / 60.0)
+            if game.state.is_state(GameState.GAME_OVER):
+                break
+        game.input("r")
+        self.assertEqual(game.spawner.pool.created, 4)
+        self.assertEqual(game.collectibles.pool.created, 2)
+        self.assertTrue(all(node is None for node in game.spawner.store.nodes[4:]))
+
+    def test_edited_profile_file_is_reapplied_on_start_screen(self) -> None:
+        registry = self._registry({"kiosk.json": '{"movement": {"start_speed": 9.0}}'})
+        game = NeonDashGame(registry.load("kiosk"), backend=NullBackend(), profiles=registry)
+        path = registry.path("kiosk")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write('{"movement": {"start_speed": 7.5}, "collectible": {"max_active": 2}}')
+        os.utime(path, (0, 1))
+        for _ in range(40):
+            game.update(0.1)
+        self.assertEqual(game.config.movement.start_speed, 7.5)
+        self.assertEqual(game.collectibles.max_active, 2)
+
+    def _paused_switch_run(self, config: GameConfig, switched: GameConfig) -> NeonDashGame:
+        game = NeonDashGame(config, backend=NullBackend())
+        bot = DodgeBot(game)
+        game.start_run(7)
+        while game.tick_count < 300:
+            game.update(1.0 / 60.0)
+        game.input("p")
+        game.apply_config(switched)
+        game.input("p")
+        game.update(3.5)
+        for _ in range(60 * 120):
+            key = bot.act()
+            if key:
+                game.input(key)
+            game.update(1.0 / 60.0)
+            if game.state.is_state(GameState.GAME_OVER):
+                break
+        return game
+
+    def test_paused_switch_keeps_replays_valid(self) -> None:
+        config = GameConfig(startup=StartupConfig(log_report=False))
+        # Render-only changes keep recording, and the replay still matches.
+        render_only = replace(config, collectible=replace(config.collectible, lod_near_z=20.0))
+        game = self._paused_switch_run(config, render_only)
+        replay = game.last_replay
+        self.assertIsNotNone(replay)
+        self.assertTrue(ReplayPlayer(NeonDashGame(render_only, backend=NullBackend()), replay).run().matches(replay))
+
+        gameplay = replace(
+            config,
+            spawner=replace(config.spawner, start_min_spawn_interval=0.3, start_max_spawn_interval=0.4),
+        )
+        game = self._paused_switch_run(config, gameplay)
+        self.assertTrue(game.state.is_state(GameState.GAME_OVER))
+        self.assertFalse(game.recorder.recording)
+        self.assertIsNone(game.last_replay)
+        self.assertIsNone(game.save_replay("test"))
+
+
+class TestFramePacing(unittest.TestCase):
+    def test_modes_map_to_sync_and_clock_limits(self) -> None:
+        plans = {
+            mode: pacing_plan(PacingConfig(mode=mode, fps_cap=45.0, refresh_rate=120.0))
+            for mode in ("vsync", "capped", "uncapped", "half_refresh")
+        }
+        self.assertEqual(
+            [(plan.sync_video, plan.clock_mode, plan.frame_rate) for plan in plans.values()],
+            [(True, "normal", 0.0), (False, "limited", 45.0), (False, "normal", 0.0), (True, "limited", 60.0)],
+        )
+        self.assertAlmostEqual(plans["vsync"].budget_ms, 1000.0 / 120.0)
+        self.assertAlmostEqual(plans["capped"].target_fps, 45.0)
+        self.assertAlmostEqual(plans["half_refresh"].target_fps, 60.0)
+        with self.assertRaises(ValueError):
+            pacing_plan(PacingConfig(mode="adaptive"))
+
+    def test_jitter_stats(self) -> None:
+        jitter = FrameJitter(budget_ms=1000.0 / 60.0, capacity=100)
+        self.assertEqual(jitter.stats().frames, 0)
+        for _ in range(150):
+            jitter.observe(1.0 / 60.0)
+        steady = jitter.stats()
+        self.assertEqual(steady.frames, 100)
+        self.assertLess(steady.std_ms, 1e-9)
+        self.assertEqual(steady.over_budget, 0.0)
+        # Same average rate, delivered unevenly: a double frame per 10.
+        for index in range(100):
+            jitter.observe((2.0 if index % 10 == 0 else 8.0 / 9.0) / 60.0)
+        uneven = jitter.stats()
+        self.assertAlmostEqual(uneven.mean_ms, steady.mean_ms, places=6)
+        self.assertAlmostEqual(uneven.over_budget, 0.1)
+        self.assertAlmostEqual(uneven.longest_stall_ms, 2000.0 / 60.0)
+        self.assertGreater(uneven.std_ms, 4.0)
+
+    def test_game_measures_play_frames_and_caps_quality_target(self) -> None:
+        config = GameConfig(pacing=PacingConfig(mode="capped", fps_cap=30.0))
+        game = NeonDashGame(config, backend=NullBackend())
+        self.assertAlmostEqual(game.quality.budget_ms, 1000.0 / 30.0)
+        game.update(0.5)
+        self.assertEqual(game.jitter.frames, 0)
+        game.input("space")
+        for _ in range(90):
+            game.update(1.0 / 30.0)
+        stats = game.jitter.stats()
+        self.assertEqual(stats.frames, 90)
+        self.assertEqual(stats.over_budget, 0.0)
+        self.assertEqual(game.quality.tier.name, "high")
+
+
+class TestInputLatency(unittest.TestCase):
+    @staticmethod
+    def _switch_latency(low_latency: bool) -> LatencyTracker:
+        config = GameConfig(
+            spawner=SpawnerConfig(
+                start_min_spawn_interval=1000.0,
+                start_max_spawn_interval=1000.0,
+                end_min_spawn_interval=1000.0,
+                end_max_spawn_interval=1000.0,
+            ),
+            input=InputConfig(low_latency=low_latency),
+        )
+        game = NeonDashGame(config, backend=NullBackend())
+        now = [0.0]
+        game.latency = LatencyTracker(64, clock=lambda: now[0])
+        game.input("space")
+        dt = 1.0 / 144.0
+        for frame in range(144 * 8):
+            now[0] += dt
+            if frame % 36 == 0:
+                game.input("a" if frame % 72 == 0 else "d")
+            game.update(dt)
+        return game.latency
+
+    def test_low_latency_path_presents_switches_a_tick_earlier(self) -> None:
+        default = self._switch_latency(low_latency=False)
+        fast = self._switch_latency(low_latency=True)
+        for tracker in (default, fast):
+            sim = tracker.sim.summary()
+            self.assertEqual(sim.count, 32)
+            # The next tick is at most one 60 Hz tick away.
+            self.assertLessEqual(sim.max_ms, 1000.0 / 60.0 + 1e-6)
+            self.assertEqual(sum(tracker.shown.summary().histogram), 32)
+        self.assertEqual(default.sim.summary(), fast.sim.summary())
+        slow_shown, fast_shown = default.shown.summary(), fast.shown.summary()
+        self.assertGreater(slow_shown.p50_ms - fast_shown.p50_ms, 1000.0 / 60.0 - 1000.0 / 144.0)
+        self.assertIn("switches", fast.format())
+
+    def test_superseded_switch_is_not_counted(self) -> None:
+        now = [0.0]
+        tracker = LatencyTracker(8, clock=lambda: now[0])
+        tracker.press(0.0, -2.8)
+        now[0] = 0.01
+        tracker.press(-0.5, 2.8)
+        tracker.tick()
+        tracker.presented(0.0)
+        now[0] = 0.05
+        tracker.presented(1.2)
+        self.assertEqual(tracker.superseded, 1)
+        self.assertEqual(tracker.sim.summary().count, 1)
+        self.assertAlmostEqual(tracker.shown.summary().max_ms, 40.0)
+
+
+class TestMainScript(unittest.TestCase):
+    def test_launch_config_from_args(self) -> None:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        with open(os.path.join(temp.name, "kiosk.json"), "w", encoding="utf-8") as handle:
+            handle.write('{"movement": {"start_speed": 9.0}, "pacing": {"mode": "half_refresh"}}')
+        profiles = ProfileRegistry(temp.name)
+
+        config = main._launch_config(profiles, main._parse_args(["--profile", "kiosk", "--unknown-ursina-flag"]))
+        self.assertEqual(config.profile, "kiosk")
+        self.assertEqual(config.movement.start_speed, 9.0)
+        self.assertEqual(config.pacing.mode, "half_refresh")
+        game = NeonDashGame(config, backend=NullBackend())
+        game.finish_loading()
+        self.assertEqual(game.pacing.mode, "half_refresh")
+
+        capped = main._launch_config(profiles, main._parse_args(["--profile", "kiosk", "--fps-cap", "45"]))
+        self.assertEqual((capped.pacing.mode, capped.pacing.fps_cap), ("capped", 45.0))
+        uncapped = main._launch_config(profiles, main._parse_args(["--pacing", "uncapped"]))
+        self.assertEqual(uncapped.pacing.mode, "uncapped")
+        self.assertEqual(uncapped.movement, CONFIG.movement)
+
+    def test_unknown_profile_falls_back_to_built_in_config(self) -> None:
+        config = main._launch_config(ProfileRegistry(), main._parse_args(["--profile", "missing"]))
+        self.assertEqual(config.profile, CONFIG.profile)
+        self.assertEqual(config.spawner, CONFIG.spawner)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,29 +1,85 @@
+import os
 import random
+import tempfile
 import unittest
 
-from ursina import Entity, Ursina, application, destroy
-
-from config import CollectibleConfig, LaneConfig, SpawnerConfig, WorldConfig
+from config import CollectibleConfig, GameConfig, LaneConfig, PoolConfig, SpawnerConfig, WorldConfig
 from game.collectibles import CollectibleSystem
+from game.core import NeonDashGame
+from game.entity_store import EntityStore
+from game.pool import ObjectPool, PoolSizeCache
+from game.render import NullBackend
 from game.spawner import ObstacleSpawner
 
 
-_TEST_APP = None
+class TestObjectPool(unittest.TestCase):
+    def test_counts_hits_misses_cap_hits_and_high_water(self) -> None:
+        pool = ObjectPool("items", object, max_size=2)
+        pool.prewarm(1)
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIsNone(pool.acquire())
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+        pool.release(second)
+
+        stats = pool.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.cap_hits), (2, 1, 1))
+        self.assertEqual(stats.high_water, 2)
+        self.assertEqual((stats.created, stats.active, stats.idle), (2, 1, 1))
 
+    def test_prewarm_never_exceeds_max_size(self) -> None:
+        pool = ObjectPool("items", object, max_size=3)
+        self.assertEqual(pool.prewarm(10), 3)
+        self.assertEqual(pool.prewarm(10), 0)
+        self.assertEqual(pool.idle_count, 3)
 
-def _ensure_test_app() -> None:
-    global _TEST_APP
-    existing_base = getattr(application, "base", None)
-    if existing_base is not None:
-        _TEST_APP = existing_base
-        return
-    if _TEST_APP is None:
-        _TEST_APP = Ursina(window_type="offscreen")
+
+class TestAdaptivePoolSizing(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "pool_sizes.json")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_sizes_persist_per_machine_and_profile(self) -> None:
+        cache = PoolSizeCache(self.path, "default", machine="box")
+        pool = ObjectPool("obstacles", object, max_size=40)
+        for _ in range(12):
+            pool.acquire()
+        cache.record([pool.stats()])
+        self.assertTrue(cache.save())
+
+        reloaded = PoolSizeCache(self.path, "default", machine="box")
+        self.assertEqual(reloaded.high_water("obstacles"), 12)
+        self.assertEqual(reloaded.prewarm_size("obstacles", headroom=0.25, max_size=40), 15)
+        self.assertEqual(reloaded.prewarm_size("obstacles", headroom=0.25, max_size=13), 13)
+        self.assertIsNone(PoolSizeCache(self.path, "low_spec", machine="box").high_water("obstacles"))
+        self.assertIsNone(PoolSizeCache(self.path, "default", machine="other").high_water("obstacles"))
+
+    def test_game_prewarms_from_learned_high_water(self) -> None:
+        config = GameConfig(pools=PoolConfig(adaptive_sizing=True, headroom=0.0, cache_path=self.path))
+        cache = PoolSizeCache(self.path, config.profile)
+        pool = ObjectPool("obstacles", object, max_size=config.spawner.pool_max_size)
+        for _ in range(5):
+            pool.acquire()
+        cache.record([pool.stats()])
+        cache.save()
+
+        game = NeonDashGame(config, backend=NullBackend())
+        game.finish_loading()
+        self.assertEqual(game.spawner.pool.created, 5)
+        self.assertEqual(game.collectibles.pool.created, config.collectible.pool_initial_size)
+
+        game.spawner.pool.high_water = 9
+        self.assertTrue(game.save_pool_sizes())
+        self.assertEqual(PoolSizeCache(self.path, config.profile).high_water("obstacles"), 9)
 
 
 class TestObstaclePooling(unittest.TestCase):
     def setUp(self) -> None:
-        _ensure_test_app()
+        self.backend = NullBackend()
         random.seed(3)
         lane_cfg = LaneConfig(x_positions=(-2.0, 0.0, 2.0))
         world_cfg = WorldConfig(obstacle_spawn_z=40.0, obstacle_cleanup_z=-10.0)
@@ -37,26 +93,28 @@ class TestObstaclePooling(unittest.TestCase):
             pool_initial_size=2,
             pool_max_size=3,
         )
-        self.spawner = ObstacleSpawner(lane_cfg, world_cfg, spawner_cfg)
+        self.spawner = ObstacleSpawner(lane_cfg, world_cfg, spawner_cfg, backend=self.backend)
 
     def tearDown(self) -> None:
         self.spawner.reset()
 
     def test_prewarm_and_max_capacity(self) -> None:
-        self.assertEqual(self.spawner._created_count, 2)
-        self.assertEqual(len(self.spawner._pool), 2)
+        self.assertEqual(self.spawner.pool.created, 2)
+        self.assertEqual(self.spawner.pool.idle_count, 2)
 
         self.spawner._spawn_obstacle(0)
         self.spawner._spawn_obstacle(1)
         self.spawner._spawn_obstacle(2)
-        self.assertEqual(self.spawner._created_count, 3)
+        self.assertEqual(self.spawner.pool.created, 3)
         self.assertEqual(len(self.spawner.obstacles), 3)
-        self.assertEqual(len(self.spawner._pool), 0)
+        self.assertEqual(self.spawner.pool.idle_count, 0)
 
         # At cap with no idle objects: further spawn should be skipped.
         spawned = self.spawner._spawn_obstacle(0)
         self.assertFalse(spawned)
-        self.assertEqual(self.spawner._created_count, 3)
+        self.assertEqual(self.spawner.pool.cap_hits, 1)
+        self.assertEqual(self.spawner.pool.high_water, 3)
+        self.assertEqual(self.spawner.pool.created, 3)
         self.assertEqual(len(self.spawner.obstacles), 3)
 
     def test_cleanup_and_reset_release_back_to_pool(self) -> None:
@@ -64,24 +122,56 @@ class TestObstaclePooling(unittest.TestCase):
         self.spawner._spawn_obstacle(1)
         self.assertEqual(len(self.spawner.obstacles), 2)
 
-        self.spawner.obstacles[0].z = self.spawner.world_cfg.obstacle_cleanup_z - 1.0
+        self.spawner.store.z[self.spawner.active_slots()[0]] = self.spawner.world_cfg.obstacle_cleanup_z - 1.0
         self.spawner.update(dt=0.0, speed=0.0, difficulty_t=0.0, blocked_lanes=None)
         self.assertEqual(len(self.spawner.obstacles), 1)
-        self.assertEqual(len(self.spawner._pool), 1)
+        self.assertEqual(self.spawner.pool.idle_count, 1)
 
         self.spawner.reset()
         self.assertEqual(len(self.spawner.obstacles), 0)
-        self.assertEqual(len(self.spawner._pool), self.spawner._created_count)
+        self.assertEqual(self.spawner.pool.idle_count, self.spawner.pool.created)
 
     def test_blocked_lanes_logic_is_kept(self) -> None:
         self.spawner._spawn_pattern(difficulty_t=0.0, blocked_lanes={0, 1})
         self.assertEqual(len(self.spawner.obstacles), 1)
-        self.assertEqual(self.spawner.obstacles[0].lane_index, 2)
+        self.assertEqual(self.spawner.store.lane[self.spawner.active_slots()[0]], 2)
+
+
+class TestInstancedObstaclePooling(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = NullBackend()
+        random.seed(3)
+        spawner_cfg = SpawnerConfig(pool_initial_size=2, pool_max_size=3, instanced_rendering=True)
+        world_cfg = WorldConfig(obstacle_spawn_z=40.0, obstacle_cleanup_z=-10.0)
+        self.spawner = ObstacleSpawner(LaneConfig(), world_cfg, spawner_cfg, backend=self.backend)
+
+    def test_single_node_for_every_obstacle(self) -> None:
+        self.assertEqual(self.backend.live_nodes, 1)
+        for lane in (0, 1, 2):
+            self.assertTrue(self.spawner._spawn_obstacle(lane))
+        self.assertFalse(self.spawner._spawn_obstacle(0))
+        self.spawner.update(dt=0.1, speed=10.0, difficulty_t=0.0, blocked_lanes={0, 1, 2})
+        self.assertEqual(self.backend.live_nodes, 1)
+        self.assertEqual(self.spawner.draw_nodes, 1)
+        batch = self.spawner._batch
+        self.assertEqual(batch.count, 3)
+        self.assertTrue(all(abs(z - 39.0) < 1e-5 for z in batch.positions[:3, 2]))
+
+    def test_release_shrinks_instance_count(self) -> None:
+        self.spawner._spawn_obstacle(0)
+        self.spawner._spawn_obstacle(2)
+        self.spawner.store.z[self.spawner.active_slots()[0]] = -11.0
+        self.spawner.update(dt=0.0, speed=0.0, difficulty_t=0.0, blocked_lanes={0, 1, 2})
+        self.assertEqual(self.spawner._batch.count, 1)
+        self.assertEqual(self.spawner.pool.idle_count, 1)
+        self.spawner.reset()
+        self.assertEqual(self.spawner._batch.count, 0)
+        self.assertEqual(self.spawner.pool.idle_count, self.spawner.pool.created)
 
 
 class TestCollectiblePooling(unittest.TestCase):
     def setUp(self) -> None:
-        _ensure_test_app()
+        self.backend = NullBackend()
         random.seed(9)
         lane_cfg = LaneConfig(x_positions=(-2.0, 0.0, 2.0))
         world_cfg = WorldConfig(obstacle_spawn_z=50.0, obstacle_cleanup_z=-10.0)
@@ -95,45 +185,45 @@ class TestCollectiblePooling(unittest.TestCase):
             pool_initial_size=1,
             pool_max_size=2,
         )
-        self.system = CollectibleSystem(lane_cfg, world_cfg, collectible_cfg)
+        self.system = CollectibleSystem(lane_cfg, world_cfg, collectible_cfg, backend=self.backend)
 
     def tearDown(self) -> None:
         self.system.reset()
 
     def test_prewarm_and_max_capacity(self) -> None:
-        self.assertEqual(self.system._created_count, 1)
-        self.assertEqual(len(self.system._pool), 1)
+        self.assertEqual(self.system.pool.created, 1)
+        self.assertEqual(self.system.pool.idle_count, 1)
 
         self.system._spawn_collectible(0)
         self.system._spawn_collectible(1)
-        self.assertEqual(self.system._created_count, 2)
+        self.assertEqual(self.system.pool.created, 2)
         self.assertEqual(len(self.system.collectibles), 2)
-        self.assertEqual(len(self.system._pool), 0)
+        self.assertEqual(self.system.pool.idle_count, 0)
 
         # Over max_active: no additional active collectible.
         self.system._spawn_collectible(2)
         self.assertEqual(len(self.system.collectibles), 2)
-        self.assertEqual(self.system._created_count, 2)
+        self.assertEqual(self.system.pool.created, 2)
 
     def test_collect_and_cleanup_release_back_to_pool(self) -> None:
         self.system._spawn_collectible(1)
         spawned = self.system.collectibles[0]
-        spawned.z = -2.0
+        self.system.store.z[self.system.active_slots()[0]] = -2.0
         collected = self.system.collect_at(player_lane=1, player_z=-2.0, threshold=1.2)
         self.assertEqual(collected, 1)
         self.assertEqual(len(self.system.collectibles), 0)
-        self.assertEqual(len(self.system._pool), 1)
+        self.assertEqual(self.system.pool.idle_count, 1)
 
         # Re-acquire should reuse pooled object without creating new one.
-        created_before = self.system._created_count
+        created_before = self.system.pool.created
         self.system._spawn_collectible(2)
-        self.assertEqual(self.system._created_count, created_before)
+        self.assertEqual(self.system.pool.created, created_before)
         self.assertIs(self.system.collectibles[0], spawned)
 
-        self.system.collectibles[0].z = self.system.world_cfg.obstacle_cleanup_z - 1.0
-        self.system.update(dt=0.0, speed=0.0, difficulty_t=0.0, obstacles=[])
+        self.system.store.z[self.system.active_slots()[0]] = self.system.world_cfg.obstacle_cleanup_z - 1.0
+        self.system.update(dt=0.0, speed=0.0, difficulty_t=0.0, obstacles=EntityStore(1))
         self.assertEqual(len(self.system.collectibles), 0)
-        self.assertEqual(len(self.system._pool), 1)
+        self.assertEqual(self.system.pool.idle_count, 1)
 
     def test_reset_releases_everything(self) -> None:
         self.system._spawn_collectible(0)
@@ -141,24 +231,23 @@ class TestCollectiblePooling(unittest.TestCase):
         self.assertEqual(len(self.system.collectibles), 2)
         self.system.reset()
         self.assertEqual(len(self.system.collectibles), 0)
-        self.assertEqual(len(self.system._pool), self.system._created_count)
+        self.assertEqual(self.system.pool.idle_count, self.system.pool.created)
 
     def test_lanes_blocked_near_spawn_logic_is_kept(self) -> None:
         self.system._spawn_collectible(0)
         self.system._spawn_collectible(1)
-        self.system.collectibles[0].z = self.system.world_cfg.obstacle_spawn_z
-        self.system.collectibles[1].z = self.system.world_cfg.obstacle_spawn_z + 20.0
+        first, second = self.system.active_slots()
+        self.system.store.z[first] = self.system.world_cfg.obstacle_spawn_z
+        self.system.store.z[second] = self.system.world_cfg.obstacle_spawn_z + 20.0
         blocked = self.system.lanes_blocked_near_spawn(8.0)
         self.assertEqual(blocked, {0})
 
         self.system.reset()
         self.system._spawn_collectible(0)
-        blocker = Entity(model="cube")
-        blocker.lane_index = 2
-        blocker.z = self.system.world_cfg.obstacle_spawn_z
-        self.system._try_spawn([blocker])
-        self.assertNotIn(2, [c.lane_index for c in self.system.collectibles])
-        destroy(blocker)
+        blockers = EntityStore(1)
+        blockers.activate(0, lane=2, z=self.system.world_cfg.obstacle_spawn_z)
+        self.system._try_spawn(blockers)
+        self.assertNotIn(2, self.system.store.lane[self.system.active_slots()].tolist())
 
 
 if __name__ == "__main__":